@@ -0,0 +1,78 @@
+"""
+Measures the latency of other event loop tasks while a large payload is serialized and deserialized,
+blocking the event loop with ``serialize`` / ``deserialize``, and with the cooperative asyncio streaming functions.
+
+Run from the repository root:
+    python -m benchmarks.bench_async
+"""
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, serialize_to_async, iter_deserialize_async
+
+PAYLOAD = mock.products * 5000
+TICK_INTERVAL = 0.001
+
+
+async def _blocking(reader, writer, executor):
+    writer.write(serialize(PAYLOAD, string_output=True).encode('utf-8'))
+    writer.write_eof()
+    deserialize(await reader.read(), string_input=True)
+
+
+async def _cooperative(reader, writer, executor):
+    await serialize_to_async(writer, PAYLOAD, executor=executor)
+    writer.write_eof()
+    async for _ in iter_deserialize_async(reader, executor=executor):
+        pass
+
+
+async def _measure(transfer, executor=None):
+    """
+    Runs ``transfer`` against a local echo server, while measuring how late a task sleeping in a loop wakes up
+    """
+    async def echo(reader, writer):
+        writer.write(await reader.read())
+        await writer.drain()
+        writer.close()
+
+    delays = []
+
+    async def tick():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_INTERVAL)
+            delays.append(time.perf_counter() - start - TICK_INTERVAL)
+
+    server = await asyncio.start_server(echo, '127.0.0.1', 0)
+    async with server:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(TICK_INTERVAL * 5)  # the ticker is waiting before the transfer starts
+        start = time.perf_counter()
+        await transfer(reader, writer, executor)
+        elapsed = time.perf_counter() - start
+        ticker.cancel()
+        writer.close()
+    return elapsed, delays
+
+
+def _report(name: str, elapsed: float, delays: list):
+    percentiles = statistics.quantiles(delays, n=100, method='inclusive') if len(delays) > 1 else delays * 99
+    print(f'{name:>22}: total {elapsed * 1e3:8.1f} ms, other tasks delayed p50 {percentiles[49] * 1e3:7.2f} ms, '
+          f'p99 {percentiles[98] * 1e3:7.2f} ms, max {max(delays) * 1e3:7.2f} ms')
+
+
+def main():
+    print(f'{len(PAYLOAD)} products')
+    _report('blocking', *asyncio.run(_measure(_blocking)))
+    _report('cooperative', *asyncio.run(_measure(_cooperative)))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        _report('cooperative + executor', *asyncio.run(_measure(_cooperative, executor)))
+
+
+if __name__ == '__main__':
+    main()
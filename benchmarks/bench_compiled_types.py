@@ -0,0 +1,48 @@
+"""
+Compares serializing and deserializing instances of a compiled jsonic type to the generic functions.
+
+Run from the repository root:
+    python -m benchmarks.bench_compiled_types
+"""
+import timeit
+
+from jsonic import serialize, deserialize, register_jsonic_type
+
+
+class Order:
+    def __init__(self, order_id: str, customer: str, quantity: int, price: float, currency: str = 'USD',
+                 express: bool = False):
+        self.order_id = order_id
+        self.customer = customer
+        self.quantity = quantity
+        self.price = price
+        self.currency = currency
+        self.express = express
+        self._revision = 1
+
+
+class CompiledOrder(Order):
+    pass
+
+
+register_jsonic_type(Order)
+register_jsonic_type(CompiledOrder, compiled=True)
+
+
+def _orders(cls, count: int):
+    return [cls(f'order_{index}', f'customer_{index % 100}', index % 7, index * 1.5) for index in range(count)]
+
+
+def main(count: int = 10000, number: int = 5):
+    for cls in (Order, CompiledOrder):
+        orders = _orders(cls, count)
+        serialized = serialize(orders)
+        assert len(deserialize(serialized)) == count
+        serialize_time = min(timeit.repeat(lambda: serialize(orders), number=1, repeat=number))
+        deserialize_time = min(timeit.repeat(lambda: deserialize(serialized), number=1, repeat=number))
+        print(f'{cls.__name__:>14}: serialize {serialize_time / count * 1e6:5.2f} us, '
+              f'deserialize {deserialize_time / count * 1e6:5.2f} us per instance')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures the serialize / deserialize round trip of every default serializer.
+
+Run from the repository root:
+    python -m benchmarks.bench_default_serializers
+"""
+import timeit
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from uuid import uuid4
+
+from jsonic import serialize, deserialize
+
+
+class Color(Enum):
+    RED = 'red'
+
+
+VALUES = {
+    'datetime': datetime(2020, 10, 5, 1, 2, 3, 4),
+    'date': date(2020, 10, 5),
+    'time': time(1, 2, 3, 4),
+    'timedelta': timedelta(days=3, seconds=5, microseconds=7),
+    'complex': complex(1.5, -2),
+    'Decimal': Decimal('3.14159265358979323846'),
+    'UUID': uuid4(),
+    'Enum': Color.RED,
+    'bytes': bytes(range(256)),
+    'set': set(range(20)),
+    'frozenset': frozenset(range(20)),
+    'tuple': tuple(range(20)),
+    'Path': Path('/tmp/jsonic/file.json'),
+}
+
+
+def main(number: int = 20000):
+    for name, value in VALUES.items():
+        serialized = serialize(value)
+        assert deserialize(serialized) == value
+        serialize_time = timeit.timeit(lambda: serialize(value), number=number)
+        deserialize_time = timeit.timeit(lambda: deserialize(serialized), number=number)
+        print(f'{name:>10}: serialize {serialize_time / number * 1e6:6.2f} us, '
+              f'deserialize {deserialize_time / number * 1e6:6.2f} us')
+
+
+if __name__ == '__main__':
+    main()
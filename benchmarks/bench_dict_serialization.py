@@ -0,0 +1,43 @@
+"""
+Compares ``serialize(obj)`` dict output against the former json.dumps / json.loads round trip.
+
+Run from the repository root:
+    python -m benchmarks.bench_dict_serialization
+"""
+import json
+import timeit
+
+import tests.serialization.mock as mock
+from jsonic import serialize
+from jsonic.serializable import _serialize_object
+
+
+def _round_trip_serialize(obj, serialize_private_attributes=False):
+    json_str = json.dumps(obj, default=lambda o: _serialize_object(o, serialize_private_attributes))
+    return json.loads(json_str)
+
+
+def _deep_graph(depth: int):
+    node = {'products': mock.products, 'donations': mock.donations}
+    for level in range(depth):
+        node = {'level': level, 'child': node, 'siblings': [mock.products[level % len(mock.products)]]}
+    return node
+
+
+def main(number: int = 200):
+    payloads = {
+        'products': mock.products * 50,
+        'donations': mock.donations * 100,
+        'deep graph': _deep_graph(depth=100),
+    }
+    for name, payload in payloads.items():
+        assert serialize(payload) == _round_trip_serialize(payload)
+        # The best of several runs, as single runs of the smaller payloads are dominated by noise
+        round_trip = min(timeit.repeat(lambda: _round_trip_serialize(payload), number=number, repeat=5))
+        direct = min(timeit.repeat(lambda: serialize(payload), number=number, repeat=5))
+        print(f'{name:>12}: json round trip {round_trip / number * 1e3:8.3f} ms, '
+              f'direct {direct / number * 1e3:8.3f} ms, speedup x{round_trip / direct:.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures the memory held by objects deserialized with and without interning.
+
+Products are loaded from a json dump, the way an in-memory cache is rebuilt. The category profiles of the
+test model are registered as immutable here, so equal profiles are shared when interning.
+
+Run from the repository root:
+    python -m benchmarks.bench_interning
+"""
+import gc
+import time
+import tracemalloc
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, register_jsonic_type, FlyweightPool
+from tests.serialization.model import Product, CategoryProfile, AttributeProfile
+
+
+def _products(count: int):
+    products = []
+    for index in range(count):
+        template = mock.products[index % len(mock.products)]
+        products.append(Product(f'product_{index}', template.user_id, template.description, template.profile,
+                                time=template.time, amount=template.amount))
+    return products
+
+
+def _retained_memory(load):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        loaded = load()
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del loaded
+    return retained, elapsed
+
+
+def main(count: int = 20000):
+    register_jsonic_type(CategoryProfile, immutable=True)
+    register_jsonic_type(AttributeProfile, immutable=True)
+    json_str = serialize(_products(count), string_output=True)
+
+    plain_memory, plain_time = _retained_memory(lambda: deserialize(json_str, string_input=True, expected_type=list))
+    pool = FlyweightPool()
+    interned_memory, interned_time = _retained_memory(
+        lambda: deserialize(json_str, string_input=True, expected_type=list, intern=pool))
+
+    print(f'{count} products, {len(json_str) / 1024 / 1024:.1f} MiB json')
+    print(f'    plain: {plain_memory / 1024 / 1024:7.2f} MiB retained, {plain_time * 1e3:7.1f} ms')
+    print(f' interned: {interned_memory / 1024 / 1024:7.2f} MiB retained, {interned_time * 1e3:7.1f} ms '
+          f'(including the pool, {len(pool)} pooled values, {pool.hits} hits)')
+    print(f'   saving: {1 - interned_memory / plain_memory:.0%}')
+
+
+if __name__ == '__main__':
+    main()
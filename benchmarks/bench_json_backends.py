@@ -0,0 +1,36 @@
+"""
+Compares the installed json backends for string and bytes input and output.
+
+Run from the repository root:
+    python -m benchmarks.bench_json_backends
+"""
+import timeit
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, available_json_backends
+
+
+def main(number: int = 200):
+    payloads = {
+        'users': mock.users * 100,
+        'products': mock.products * 50,
+        'donations': mock.donations * 100,
+    }
+    for name, payload in payloads.items():
+        for json_backend in available_json_backends():
+            json_str = serialize(payload, string_output=True, json_backend=json_backend)
+            json_bytes = serialize(payload, bytes_output=True, json_backend=json_backend)
+            dumps = timeit.timeit(lambda: serialize(payload, string_output=True, json_backend=json_backend), number=number)
+            dumps_bytes = timeit.timeit(lambda: serialize(payload, bytes_output=True, json_backend=json_backend),
+                                        number=number)
+            loads = timeit.timeit(lambda: deserialize(json_str, string_input=True, json_backend=json_backend),
+                                  number=number)
+            loads_bytes = timeit.timeit(lambda: deserialize(json_bytes, string_input=True, json_backend=json_backend),
+                                        number=number)
+            print(f'{name:>10} {json_backend:>7}: serialize str {dumps / number * 1e3:7.3f} ms, '
+                  f'bytes {dumps_bytes / number * 1e3:7.3f} ms | '
+                  f'deserialize str {loads / number * 1e3:7.3f} ms, bytes {loads_bytes / number * 1e3:7.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark suite measuring serialize / deserialize across model shapes, built on the test model and mock fixtures.
+
+Every case is measured in dict mode and in json string mode, reporting throughput (ops/sec),
+per-call latency percentiles, and the peak memory allocated by a single call, using tracemalloc.
+
+Run from the repository root:
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --save bench_before.json
+    python -m benchmarks.bench_suite --compare bench_before.json --filter deep
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize
+from tests.serialization.model import Donation, Address, ContactDetails
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+
+def _wide_flat(count: int = 500):
+    # Donations without nested objects, holding only scalar attributes
+    return [Donation(f'donation_{index}', f'user_{index % 10}', [], time=mock.donations[0].time,
+                     description=f'description {index}') for index in range(count)]
+
+
+def _deep(depth: int = 150):
+    node = {'location': mock.donations[0].location}
+    for level in range(depth):
+        node = {'level': level, 'child': node, 'profile': mock.products[level % len(mock.products)].profile}
+    return node
+
+
+def _large_list(count: int = 2000):
+    return [mock.products[index % len(mock.products)] for index in range(count)]
+
+
+def _dict_heavy(count: int = 500):
+    return {f'user_{index}': {'address': Address(f'street {index}'),
+                              'contact': ContactDetails(email=f'user_{index}@mail.com', phone_number=str(index)),
+                              'scores': {str(score): score * 0.5 for score in range(10)},
+                              'tags': {'active': index % 2 == 0, 'group': index % 7}}
+            for index in range(count)}
+
+
+def _custom_serializer_heavy(count: int = 500):
+    return [{'time': datetime(2020, 1, 1) + timedelta(minutes=index),
+             'duration': timedelta(seconds=index),
+             'amount': mock.products[index % len(mock.products)].amount,
+             'price': Decimal(index) / 100,
+             'id': UUID(int=index),
+             'user': mock.users[index % len(mock.users)]} for index in range(count)]
+
+
+CASES = {
+    'wide_flat': _wide_flat,
+    'deep': _deep,
+    'large_list': _large_list,
+    'dict_heavy': _dict_heavy,
+    'custom_serializer_heavy': _custom_serializer_heavy,
+}
+
+
+def _operations(payload):
+    """
+    Returns:
+        benchmark name suffix to function of the measured call, for dict and string modes
+    """
+    serialized = serialize(payload)
+    serialized_string = serialize(payload, string_output=True)
+    return {
+        'serialize/dict': lambda: serialize(payload),
+        'serialize/string': lambda: serialize(payload, string_output=True),
+        'deserialize/dict': lambda: deserialize(serialized),
+        'deserialize/string': lambda: deserialize(serialized_string, string_input=True),
+    }
+
+
+def measure(function, iterations: int, warmup: int = 2) -> dict:
+    for _ in range(warmup):
+        function()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    result = {'iterations': iterations, 'ops_per_sec': iterations / sum(latencies), 'peak_memory_bytes': peak_memory}
+    for percentile in PERCENTILES:
+        index = min(len(latencies) - 1, round(percentile / 100 * (len(latencies) - 1)))
+        result[f'p{percentile}_ms'] = latencies[index] * 1e3
+    return result
+
+
+def run(iterations: int, name_filter: str = None) -> dict:
+    results = {}
+    for case_name, build_payload in CASES.items():
+        if name_filter and name_filter not in case_name:
+            continue
+        for operation_name, function in _operations(build_payload()).items():
+            name = f'{case_name}/{operation_name}'
+            results[name] = measure(function, iterations)
+            _print_result(name, results[name])
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Prints the throughput change of every benchmark present in both results
+
+    Returns:
+        names of the benchmarks whose throughput dropped by more than ``threshold``
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['ops_per_sec'] / baseline[name]['ops_per_sec']
+        peak_ratio = result['peak_memory_bytes'] / max(baseline[name]['peak_memory_bytes'], 1)
+        regressed = ratio < 1 - threshold
+        if regressed:
+            regressions.append(name)
+        print(f'{name:<50} ops/sec x{ratio:5.2f}  peak memory x{peak_ratio:5.2f}{"  REGRESSION" if regressed else ""}')
+    return regressions
+
+
+def _print_result(name: str, result: dict):
+    percentiles = ', '.join(f'p{percentile} {result[f"p{percentile}_ms"]:8.3f} ms' for percentile in PERCENTILES)
+    print(f'{name:<50} {result["ops_per_sec"]:9.1f} ops/sec, {percentiles}, '
+          f'peak {result["peak_memory_bytes"] / 1024:9.1f} KiB')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=30, help='measured calls per benchmark')
+    parser.add_argument('--filter', dest='name_filter', help='only run cases whose name contains this string')
+    parser.add_argument('--save', help='write the results to this json file')
+    parser.add_argument('--compare', help='compare the results to a json file written using --save')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='throughput drop reported as a regression when comparing, 0.1 is 10%%')
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations, args.name_filter)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'commit': _git_commit(), 'python': platform.python_version(),
+                       'timestamp': datetime.now().isoformat(timespec='seconds'), 'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f'\ncompared to commit {baseline.get("commit")}:')
+        if compare(results, baseline['results'], args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
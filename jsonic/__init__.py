@@ -1,3 +1,13 @@
-from .serializable import Serializable, register_jsonic_type, serialize, deserialize
+from .serializable import Serializable, register_jsonic_type, serialize, deserialize, set_type_import_allow_list, \
+    type_name_cache_info, compile_jsonic_type
+from .backends import set_json_backend, available_json_backends
 from .decorators import jsonic_serializer, jsonic_deserializer
+from .streaming import iter_deserialize, serialize_to
+from .async_streaming import iter_deserialize_async, serialize_to_async
+from .batch import serialize_many, deserialize_many
+from .flyweight import FlyweightPool
+from .delta import serialize_delta, apply_delta
+from .schema import validate_serialized, json_schema, type_schema
+from .instrumentation import enable_instrumentation, disable_instrumentation, stats, reset_stats
+from .lazy import deserialize_lazy, materialize, LazyJsonicObject
 from .default_serializers import *
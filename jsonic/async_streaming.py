@@ -0,0 +1,167 @@
+import asyncio
+import codecs
+from concurrent.futures import Executor
+from typing import Iterable, List
+
+from jsonic.serializable import serialize, deserialize
+from jsonic.streaming import DEFAULT_CHUNK_SIZE, _parse_json_elements
+
+"""
+This Module contains asyncio variants of the streaming functions, writing to / reading from asyncio streams.
+
+Serializing and deserializing is CPU bound, so a large collection would block the event loop for it's whole duration.
+These functions yield control to the event loop every ``yield_every`` elements, and can run chunks of elements
+on an executor instead of the event loop thread
+"""
+
+DEFAULT_YIELD_EVERY = 100
+
+
+async def serialize_to_async(writer, iterable: Iterable, serialize_private_attributes: bool = False,
+                             json_lines: bool = False, yield_every: int = DEFAULT_YIELD_EVERY,
+                             executor: Executor = None, buffer_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Asyncio variant of ``serialize_to``, writing the elements of ``iterable`` to ``writer`` as a JSON array or as JSON Lines
+
+    Args:
+        writer: ``asyncio.StreamWriter``, or any object with ``write(bytes)`` and ``async drain()`` methods
+        iterable: elements to serialize, each serialized the same way ``serialize`` does. can be an async iterable
+        serialize_private_attributes: should serialize private attributes (attributes which their name starts with ``_``)
+        json_lines (bool): write one ``jsonic representation`` per line instead of a single JSON array
+        yield_every (int): number of elements serialized between yielding control to the event loop
+        executor: when given, every ``yield_every`` elements are serialized on it, using ``loop.run_in_executor``
+        buffer_size (int): number of characters to accumulate before writing to ``writer``
+
+    Returns:
+        number of serialized elements
+
+    Note:
+        When using a process pool executor, the elements and their jsonic types should be importable in the worker
+        processes, see ``serialize_many``
+    """
+    separator = '\n' if json_lines else ','
+    pending = [] if json_lines else ['[']
+    pending_size = 0
+    count = 0
+
+    async for chunk in _chunks(iterable, yield_every):
+        serialized_chunk = await _run(executor, _serialize_chunk, chunk, serialize_private_attributes)
+        for serialized in serialized_chunk:
+            if count and not json_lines:
+                pending.append(separator)
+            pending.append(serialized)
+            if json_lines:
+                pending.append(separator)
+            pending_size += len(serialized) + 1
+            count += 1
+        if pending_size >= buffer_size:
+            writer.write(''.join(pending).encode('utf-8'))
+            await writer.drain()
+            pending = []
+            pending_size = 0
+
+    if not json_lines:
+        pending.append(']')
+    if pending:
+        writer.write(''.join(pending).encode('utf-8'))
+    await writer.drain()
+    return count
+
+
+async def iter_deserialize_async(reader, deserialize_private_attributes: bool = False, expected_type: type = None,
+                                 json_lines: bool = False, yield_every: int = DEFAULT_YIELD_EVERY,
+                                 executor: Executor = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Asyncio variant of ``iter_deserialize``, deserializing the ``jsonic representations`` read from ``reader``
+    one element at a time
+
+    Args:
+        reader: ``asyncio.StreamReader``, or any object with an ``async read(n)`` method returning utf-8 ``bytes``
+            (or ``str``), containing either a top-level JSON array, or JSON Lines
+        deserialize_private_attributes (bool): should deserialize private attributes (attributes which their name starts with ``_``)
+        expected_type: the expected type of every deserialized element
+        json_lines (bool): read one ``jsonic representation`` per line instead of a single JSON array
+        yield_every (int): number of elements deserialized between yielding control to the event loop
+        executor: when given, every ``yield_every`` elements are deserialized on it, using ``loop.run_in_executor``
+        chunk_size (int): number of bytes to read from ``reader`` at a time
+
+    Returns:
+        async generator yielding the deserialized elements in the order they appear in the stream
+
+    Raises:
+        ValueError: When the stream is not a valid JSON array or JSON Lines stream
+    """
+    chunk = []
+    async for element in _iter_json_elements_async(reader, json_lines, chunk_size):
+        chunk.append(element)
+        if len(chunk) >= yield_every:
+            for deserialized in await _run(executor, _deserialize_chunk, chunk, deserialize_private_attributes,
+                                           expected_type):
+                yield deserialized
+            chunk = []
+
+    if chunk:
+        for deserialized in await _run(executor, _deserialize_chunk, chunk, deserialize_private_attributes,
+                                       expected_type):
+            yield deserialized
+
+
+async def _run(executor: Executor, function, *args):
+    if executor is None:
+        result = function(*args)
+        await asyncio.sleep(0)
+        return result
+    return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+async def _chunks(iterable, chunk_size: int):
+    chunk = []
+    if hasattr(iterable, '__aiter__'):
+        async for element in iterable:
+            chunk.append(element)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for element in iterable:
+            chunk.append(element)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _serialize_chunk(chunk: list, serialize_private_attributes: bool) -> List[str]:
+    return [serialize(element, serialize_private_attributes=serialize_private_attributes, string_output=True)
+            for element in chunk]
+
+
+def _deserialize_chunk(chunk: list, deserialize_private_attributes: bool, expected_type: type) -> list:
+    return [deserialize(element, deserialize_private_attributes=deserialize_private_attributes,
+                        expected_type=expected_type) for element in chunk]
+
+
+async def _iter_json_elements_async(reader, json_lines: bool, chunk_size: int):
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    async def read(size: int) -> str:
+        while True:
+            chunk = await reader.read(size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            text = text_decoder.decode(chunk, final=not chunk)
+            if text or not chunk:  # otherwise chunk ended in the middle of a multi-byte character
+                return text
+
+    parser = _parse_json_elements(json_lines, chunk_size)
+    try:
+        request = next(parser)
+        while True:
+            if type(request) is tuple:
+                yield request[0]
+                request = next(parser)
+            else:
+                request = parser.send(await read(request))
+    except StopIteration:
+        return
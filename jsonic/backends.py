@@ -0,0 +1,143 @@
+import json
+from abc import ABC, abstractmethod
+
+"""This Module contains the JSON encoding / decoding backends used for string and bytes input and output"""
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # ujson is an optional dependency
+    ujson = None
+
+
+class JsonBackend(ABC):
+    """
+    Encodes plain ``dict`` / ``list`` trees to json and decodes them back
+
+    Attributes:
+        name (str): the name the backend is selected by
+    """
+    name: str = None
+
+    @abstractmethod
+    def dumps(self, obj) -> str:
+        """
+        Returns:
+            json ``str`` encoding ``obj``
+        """
+
+    def dumps_bytes(self, obj) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+    @abstractmethod
+    def loads(self, data):
+        """
+        Args:
+            data: ``str`` / ``bytes`` / ``bytearray`` / ``memoryview`` containing a json document
+        """
+
+
+class StdlibJsonBackend(JsonBackend):
+    name = 'json'
+
+    def dumps(self, obj) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data):
+        if type(data) == memoryview:
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Note:
+        Values orjson can't encode, such as integers larger than 64 bit, are encoded by the stdlib backend.
+        Unlike the stdlib backend, NaN and Infinity floats are encoded as ``null``
+    """
+    name = 'orjson'
+
+    def dumps(self, obj) -> str:
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            return _stdlib_backend.dumps_bytes(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    name = 'ujson'
+
+    def dumps(self, obj) -> str:
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def loads(self, data):
+        if type(data) == memoryview:
+            data = data.tobytes()
+        return ujson.loads(data)
+
+
+_stdlib_backend = StdlibJsonBackend()
+_json_backends = {_stdlib_backend.name: _stdlib_backend}
+if ujson is not None:
+    _json_backends[UjsonBackend.name] = UjsonBackend()
+if orjson is not None:
+    _json_backends[OrjsonBackend.name] = OrjsonBackend()
+
+# The stdlib backend is used by default, as the other backends format their output differently
+_default_json_backend = _stdlib_backend
+
+
+def available_json_backends():
+    """
+    Returns:
+        names of the installed json backends
+    """
+    return list(_json_backends.keys())
+
+
+def set_json_backend(name: str):
+    """
+    Sets the json backend used by ``serialize`` and ``deserialize`` for string and bytes input and output.
+    The stdlib ``'json'`` backend is used unless another backend is set
+
+    Args:
+        name (str): one of ``'orjson'``, ``'ujson'`` or ``'json'`` (the stdlib)
+
+    Raises:
+        ValueError: When the backend is not installed
+
+    Note:
+        ``'orjson'`` and ``'ujson'`` are faster, but their output differs from the stdlib backend: they write compact
+        json without spaces after separators, and non-ascii characters unescaped. ``'orjson'`` encodes NaN and
+        Infinity floats as ``null``, where the stdlib backend writes ``NaN`` and ``Infinity``
+    """
+    global _default_json_backend
+    _default_json_backend = get_json_backend(name)
+
+
+def get_json_backend(name: str = None) -> JsonBackend:
+    """
+    Args:
+        name (str): backend name, or ``None`` for the backend set using ``set_json_backend``
+
+    Returns:
+        the json backend
+
+    Raises:
+        ValueError: When the backend is not installed
+    """
+    if name is None:
+        return _default_json_backend
+    if name not in _json_backends:
+        raise ValueError(f'json backend {name} is not installed. available backends: {available_json_backends()}')
+    return _json_backends[name]
@@ -0,0 +1,150 @@
+import importlib
+import itertools
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List
+
+from jsonic import serializable
+from jsonic.decorators import _JsonicSerializer, _JsonicDeserializer
+from jsonic.serializable import Serializable, serialize, deserialize, set_type_import_allow_list, register_jsonic_type
+
+"""This Module contains functions for serializing and deserializing large batches, optionally using a process pool"""
+
+DEFAULT_BATCH_CHUNK_SIZE = 1000
+
+
+def serialize_many(objects: Iterable, serialize_private_attributes: bool = False, typed: bool = False,
+                   chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE, max_workers: int = None, mp_context=None) -> List:
+    """
+    Serializes every element of ``objects`` into it's ``dictionary`` representation, same as calling ``serialize`` on each of them
+
+    Args:
+        objects: elements to serialize
+        serialize_private_attributes: should serialize private attributes (attributes which their name starts with ``_``)
+        typed: leave out the ``_serialized_type`` tags, see ``serialize``
+        chunk_size (int): number of elements sent to a worker process at a time
+        max_workers (int): number of worker processes. when ``None``, serializes in the current process
+        mp_context: multiprocessing context used to start the worker processes
+
+    Returns:
+        list of serialized elements, in the same order as ``objects``
+
+    Note:
+        Registered jsonic types, with the options they were registered with, and custom serializers are re-established
+        in the worker processes, including ones registered at runtime. Their classes and functions are passed to the
+        workers by name, so they should be defined at the top level of importable modules
+    """
+    if max_workers is None:
+        return [serialize(obj, serialize_private_attributes=serialize_private_attributes, typed=typed) for obj in objects]
+
+    return _map_chunks(_serialize_chunk, objects, (serialize_private_attributes, typed), chunk_size, max_workers,
+                       mp_context)
+
+
+def deserialize_many(serialized_objects: Iterable, deserialize_private_attributes: bool = False,
+                     expected_type: type = None, typed: bool = False, chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+                     max_workers: int = None, mp_context=None) -> List:
+    """
+    Deserializes every element of ``serialized_objects``, same as calling ``deserialize`` on each of them
+
+    Args:
+        serialized_objects: ``dictionary`` representations to deserialize
+        deserialize_private_attributes (bool): should deserialize private attributes (attributes which their name starts with ``_``)
+        expected_type: the expected type of every deserialized element
+        typed (bool): deserialize input serialized in typed mode, see ``deserialize``
+        chunk_size (int): number of elements sent to a worker process at a time
+        max_workers (int): number of worker processes. when ``None``, deserializes in the current process
+        mp_context: multiprocessing context used to start the worker processes
+
+    Returns:
+        list of deserialized elements, in the same order as ``serialized_objects``
+
+    Note:
+        Registered jsonic types, with the options they were registered with, and custom deserializers are re-established
+        in the worker processes, including ones registered at runtime. Their classes and functions are passed to the
+        workers by name, so they should be defined at the top level of importable modules
+    """
+    if max_workers is None:
+        return [deserialize(obj, deserialize_private_attributes=deserialize_private_attributes,
+                            expected_type=expected_type, typed=typed) for obj in serialized_objects]
+
+    return _map_chunks(_deserialize_chunk, serialized_objects, (deserialize_private_attributes, expected_type, typed),
+                       chunk_size, max_workers, mp_context)
+
+
+def _map_chunks(function, elements: Iterable, arguments: tuple, chunk_size: int, max_workers: int, mp_context):
+    chunks = _split_to_chunks(elements, chunk_size)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, initializer=_initialize_worker,
+                             initargs=_worker_state()) as executor:
+        results = executor.map(function, chunks, itertools.repeat(arguments))
+        return [element for chunk_result in results for element in chunk_result]
+
+
+def _split_to_chunks(elements: Iterable, chunk_size: int):
+    iterator = iter(elements)
+    chunk = list(itertools.islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+
+def _worker_state():
+    modules = {type_data.cls.__module__ for type_data in Serializable.jsonic_types.values()}
+    modules.update(function.__module__ for function in _JsonicSerializer.serializers.values())
+    modules.update(function.__module__ for function in _JsonicDeserializer.deserializers.values())
+    modules.discard('__main__')  # the main module is re-imported by multiprocessing itself
+
+    registrations = _picklable((type_data.cls, type_data.transient_attributes, type_data.init_parameters_mapping,
+                                type_data.bypass_init, type_data.compiled, type_data.immutable)
+                               for type_data in Serializable.jsonic_types.values())
+    serializers = dict(_picklable(_JsonicSerializer.serializers.items()))
+    deserializers = dict(_picklable(_JsonicDeserializer.deserializers.items()))
+    legacy_deserializers = dict(_picklable(_JsonicDeserializer.legacy_deserializers.items()))
+    nested_value_deserializers = _picklable(_JsonicDeserializer.nested_value_deserializers)
+
+    return sorted(modules), registrations, serializers, deserializers, legacy_deserializers, \
+        nested_value_deserializers, serializable._type_import_allow_list
+
+
+def _picklable(entries: Iterable) -> list:
+    """
+    Returns:
+        the entries that can be passed to worker processes. Functions replaced by the decorator that registered them
+        can't be pickled by name, and are re-registered by importing their module instead
+    """
+    picklable = []
+    for entry in entries:
+        try:
+            pickle.dumps(entry)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            continue
+        picklable.append(entry)
+    return picklable
+
+
+def _initialize_worker(modules: List[str], registrations: list, serializers: dict, deserializers: dict,
+                       legacy_deserializers: dict, nested_value_deserializers: list, type_import_allow_list):
+    # Importing the modules registers their jsonic types and custom serializers and deserializers
+    for module in modules:
+        importlib.import_module(module)
+
+    # Registrations made at runtime, or with other options than the ones made on import, take precedence
+    for registration in registrations:
+        register_jsonic_type(*registration)
+    _JsonicSerializer.serializers.update(serializers)
+    _JsonicSerializer.resolved_serializers.clear()
+    _JsonicDeserializer.deserializers.update(deserializers)
+    _JsonicDeserializer.legacy_deserializers.update(legacy_deserializers)
+    _JsonicDeserializer.nested_value_deserializers.update(nested_value_deserializers)
+    set_type_import_allow_list(type_import_allow_list)
+
+
+def _serialize_chunk(chunk: list, arguments: tuple):
+    serialize_private_attributes, typed = arguments
+    return [serialize(obj, serialize_private_attributes=serialize_private_attributes, typed=typed) for obj in chunk]
+
+
+def _deserialize_chunk(chunk: list, arguments: tuple):
+    deserialize_private_attributes, expected_type, typed = arguments
+    return [deserialize(obj, deserialize_private_attributes=deserialize_private_attributes,
+                        expected_type=expected_type, typed=typed) for obj in chunk]
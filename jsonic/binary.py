@@ -0,0 +1,218 @@
+import struct
+
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME
+
+"""
+This Module contains a compact binary encoding of ``jsonic representations``, an alternative to JSON strings.
+
+Layout: the ``JSB1`` header, followed by a single encoded value. Values start with a marker byte:
+    - ``0x80`` - ``0xff``: integer 0 to 127, stored in the marker itself
+    - ``NONE`` / ``FALSE`` / ``TRUE``: no payload
+    - ``INT``: zigzag varint, ``FLOAT``: 8 bytes little-endian double
+    - ``STR``: varint byte length and utf-8 bytes
+    - ``LIST``: varint length and the encoded elements
+    - ``DICT``: varint length and (string reference, encoded value) pairs
+    - ``JSONIC_DICT``: string reference of the type tag, varint length and (string reference, encoded value) pairs,
+      for dicts holding a ``_serialized_type`` tag
+String references intern dict keys and type tags: a reference is a varint, where 0 is followed by a new string
+(varint byte length and utf-8 bytes) which is added to the string table, and n is the n-th string of the table.
+"""
+
+BINARY_HEADER = b'JSB1'
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+_LIST = 0x06
+_DICT = 0x07
+_JSONIC_DICT = 0x08
+_FIXINT_BASE = 0x80
+
+_DOUBLE = struct.Struct('<d')
+
+
+def encode(obj) -> bytes:
+    """
+    Encodes a ``jsonic representation`` (plain ``dict`` / ``list`` tree, as returned by ``serialize``) to bytes
+
+    Raises:
+        TypeError: When the input contains values which are not json native types
+    """
+    encoder = _BinaryEncoder()
+    encoder.encode(obj)
+    return bytes(encoder.output)
+
+
+def decode(data):
+    """
+    Decodes bytes returned by ``encode`` back to the ``jsonic representation``
+
+    Args:
+        data: ``bytes`` / ``bytearray`` / ``memoryview``. The input is read in place, without being copied
+
+    Raises:
+        ValueError: When the input is not a valid encoding
+    """
+    view = memoryview(data)
+    if view[:len(BINARY_HEADER)] != BINARY_HEADER:
+        raise ValueError('Binary input does not start with the jsonic binary header')
+
+    decoder = _BinaryDecoder(view)
+    try:
+        result = decoder.decode()
+    except (IndexError, struct.error):
+        raise ValueError('Binary input is truncated') from None
+    if decoder.position != len(view):
+        raise ValueError(f'Extra data after the encoded value at position {decoder.position}')
+    return result
+
+
+class _BinaryEncoder:
+    def __init__(self):
+        self.output = bytearray(BINARY_HEADER)
+        self._strings = {}
+
+    def encode(self, obj):
+        output = self.output
+        typ = type(obj)
+        if typ is str:
+            encoded = obj.encode('utf-8')
+            output.append(_STR)
+            self._write_varint(len(encoded))
+            output += encoded
+        elif typ is int:
+            if 0 <= obj < 0x80:
+                output.append(_FIXINT_BASE + obj)
+            else:
+                output.append(_INT)
+                self._write_varint(obj << 1 if obj >= 0 else ((-obj) << 1) - 1)
+        elif typ is dict:
+            type_tag = obj.get(SERIALIZED_TYPE_ATTRIBUTE_NAME)
+            if type(type_tag) is str:
+                output.append(_JSONIC_DICT)
+                self._write_string_reference(type_tag)
+                self._write_varint(len(obj) - 1)
+                for key, value in obj.items():
+                    if key != SERIALIZED_TYPE_ATTRIBUTE_NAME:
+                        self._write_string_reference(key)
+                        self.encode(value)
+            else:
+                output.append(_DICT)
+                self._write_varint(len(obj))
+                for key, value in obj.items():
+                    self._write_string_reference(key)
+                    self.encode(value)
+        elif typ is list:
+            output.append(_LIST)
+            self._write_varint(len(obj))
+            for element in obj:
+                self.encode(element)
+        elif typ is float:
+            output.append(_FLOAT)
+            output += _DOUBLE.pack(obj)
+        elif obj is None:
+            output.append(_NONE)
+        elif obj is True:
+            output.append(_TRUE)
+        elif obj is False:
+            output.append(_FALSE)
+        else:
+            raise TypeError(f'Could not binary encode value of type: {typ}')
+
+    def _write_string_reference(self, string: str):
+        index = self._strings.get(string)
+        if index is not None:
+            self._write_varint(index)
+            return
+
+        self._strings[string] = len(self._strings) + 1
+        encoded = string.encode('utf-8')
+        self.output.append(0)
+        self._write_varint(len(encoded))
+        self.output += encoded
+
+    def _write_varint(self, value: int):
+        output = self.output
+        while value >= 0x80:
+            output.append((value & 0x7f) | 0x80)
+            value >>= 7
+        output.append(value)
+
+
+class _BinaryDecoder:
+    def __init__(self, view: memoryview):
+        self.view = view
+        self.position = len(BINARY_HEADER)
+        self._strings = []
+
+    def decode(self):
+        view = self.view
+        marker = view[self.position]
+        self.position += 1
+
+        if marker >= _FIXINT_BASE:
+            return marker - _FIXINT_BASE
+        if marker == _JSONIC_DICT:
+            type_tag = self._read_string_reference()
+            result = {}
+            for _ in range(self._read_varint()):
+                key = self._read_string_reference()
+                result[key] = self.decode()
+            result[SERIALIZED_TYPE_ATTRIBUTE_NAME] = type_tag
+            return result
+        if marker == _STR:
+            return self._read_string()
+        if marker == _LIST:
+            return [self.decode() for _ in range(self._read_varint())]
+        if marker == _DICT:
+            result = {}
+            for _ in range(self._read_varint()):
+                key = self._read_string_reference()
+                result[key] = self.decode()
+            return result
+        if marker == _INT:
+            value = self._read_varint()
+            return -((value + 1) >> 1) if value & 1 else value >> 1
+        if marker == _FLOAT:
+            value = _DOUBLE.unpack_from(view, self.position)[0]
+            self.position += _DOUBLE.size
+            return value
+        if marker == _NONE:
+            return None
+        if marker == _TRUE:
+            return True
+        if marker == _FALSE:
+            return False
+
+        raise ValueError(f'Unknown binary marker {marker} at position {self.position - 1}')
+
+    def _read_string(self) -> str:
+        length = self._read_varint()
+        start = self.position
+        self.position += length
+        if self.position > len(self.view):
+            raise IndexError
+        return str(self.view[start:self.position], 'utf-8')
+
+    def _read_string_reference(self) -> str:
+        index = self._read_varint()
+        if index:
+            return self._strings[index - 1]
+        string = self._read_string()
+        self._strings.append(string)
+        return string
+
+    def _read_varint(self) -> int:
+        view = self.view
+        result = 0
+        shift = 0
+        while True:
+            byte = view[self.position]
+            self.position += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
@@ -0,0 +1,133 @@
+import dataclasses
+import keyword
+from typing import Iterable, Tuple
+
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, is_private_attribute
+
+"""
+This Module generates serialization and deserialization functions specialized for a single jsonic type.
+
+The generated functions read and write the known attributes of the type directly, with no per-attribute branching.
+Known attributes are given when compiling, and default to the ``__init__`` parameters (or dataclass fields) of the type.
+Instances with a different set of attributes are handled by the generic functions the generated ones replace.
+"""
+
+
+def known_attributes(type_data, factory) -> Tuple[str]:
+    """
+    Returns:
+        names of the instance attributes of the type, in declaration order
+    """
+    cls = type_data.cls
+    if dataclasses.is_dataclass(cls):
+        attributes = [data_field.name for data_field in dataclasses.fields(cls)]
+    else:
+        attributes = [attribute_name for parameter_name, attribute_name in factory._init_parameters]
+    attributes.extend(type_data.transient_attributes)
+    return tuple(dict.fromkeys(attributes))
+
+
+def generate_extractor(plan, attributes: Iterable[str]):
+    """
+    Generates the ``extract`` function of a ``_SerializationPlan``, building the serialized dict with a single
+    dict display when the instance ``__dict__`` holds exactly ``attributes``
+
+    Returns:
+        the generated function, or the generic ``extract`` for types whose attributes are stored in ``__slots__``
+    """
+    if plan.slot_attributes:
+        return plan.generic_extract
+
+    attributes = tuple(attributes)
+    serialized = [name for name in attributes if name not in plan.excluded_attributes]
+    public = [name for name in serialized if not is_private_attribute(name)]
+    # Attributes which are not read in the public branch still have to be present for the layout to match
+    checked = [name for name in attributes if name not in public]
+
+    layout_condition = ' and '.join([f'len(attributes) == {len(attributes)}'] +
+                                    [f'{name!r} in attributes' for name in checked])
+    source = '\n'.join([
+        'def extract(obj, serialize_private_attributes):',
+        '    attributes = obj.__dict__',
+        f'    if {layout_condition}:',
+        '        try:',
+        '            if serialize_private_attributes:',
+        f'                return {_dict_display(serialized)}',
+        f'            return {_dict_display(public)}',
+        '        except KeyError:',
+        '            pass',
+        '    return generic_extract(obj, serialize_private_attributes)',
+    ])
+    return _define('extract', source, {
+        'generic_extract': plan.generic_extract,
+        'SERIALIZED_TYPE_ATTRIBUTE_NAME': SERIALIZED_TYPE_ATTRIBUTE_NAME,
+        'type_name': plan.type_name,
+    })
+
+
+def generate_create(factory, generic_create, excluded_attributes: Iterable[str], attributes: Iterable[str]):
+    """
+    Generates the ``create`` function of a ``_DeserializationFactory``, calling __init__ with keyword arguments and
+    setting the attributes one by one when the deserialized dict holds exactly the serialized ``attributes``
+
+    Returns:
+        the generated function, or ``generic_create`` for factories creating instances without calling __init__
+    """
+    if factory.bypass_init:
+        return generic_create
+
+    serialized = [name for name in attributes if name not in excluded_attributes]
+    public = [name for name in serialized if not is_private_attribute(name)]
+    lines = ['def create(deserialized_dict, deserialize_private_attributes=False):',
+             '    if deserialize_private_attributes:']
+    lines.extend(_create_branch(factory, serialized, factory._init_parameters, indent=' ' * 8))
+    lines.append('    else:')
+    lines.extend(_create_branch(factory, public, factory._public_init_parameters, indent=' ' * 8))
+    lines.append('    return generic_create(deserialized_dict, deserialize_private_attributes)')
+
+    return _define('create', '\n'.join(lines), {
+        'generic_create': generic_create,
+        'cls': factory.cls,
+        'fill_attributes': factory._fill_attributes,
+    })
+
+
+def _create_branch(factory, attributes: list, init_parameters: tuple, indent: str):
+    variables = {name: f'value_{index}' for index, name in enumerate(attributes)}
+    if any(attribute_name not in variables for parameter_name, attribute_name in init_parameters):
+        return [indent + 'pass']  # __init__ requires an attribute that is not serialized
+
+    lines = [f'if len(deserialized_dict) == {len(attributes)}:',
+             '    try:']
+    lines.extend(f'        {variables[name]} = deserialized_dict[{name!r}]' for name in attributes)
+    lines.extend(['    except KeyError:',
+                  '        pass',
+                  '    else:'])
+    init_arguments = ', '.join(f'{parameter_name}={variables[attribute_name]}'
+                               for parameter_name, attribute_name in init_parameters)
+    lines.append(f'        instance = cls({init_arguments})')
+    if factory._fill_directly:
+        lines.append('        fill_attributes(instance, deserialized_dict)')
+    else:
+        lines.extend(f'        {_attribute_assignment(name, variables[name])}' for name in attributes)
+    lines.append('        return instance')
+    return [indent + line for line in lines]
+
+
+def _dict_display(attributes: list) -> str:
+    items = [f'{name!r}: attributes[{name!r}]' for name in attributes]
+    items.append('SERIALIZED_TYPE_ATTRIBUTE_NAME: type_name')
+    return '{' + ', '.join(items) + '}'
+
+
+def _attribute_assignment(name: str, variable: str) -> str:
+    if name.isidentifier() and not keyword.iskeyword(name) and not name.startswith('__'):
+        return f'instance.{name} = {variable}'
+    return f'setattr(instance, {name!r}, {variable})'
+
+
+def _define(function_name: str, source: str, namespace: dict):
+    exec(compile(source, f'<jsonic generated {function_name}>', 'exec'), namespace)
+    function = namespace[function_name]
+    function.__source__ = source
+    return function
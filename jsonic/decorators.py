@@ -1,3 +1,8 @@
+import inspect
+
+from jsonic.util import full_type_name
+
+
 # wrap Serializer to allow for deferred calling
 def jsonic_serializer(serialized_type):
     """
@@ -15,6 +20,8 @@ def jsonic_serializer(serialized_type):
     Note:
        If multiple serializer functions are registered for the same type, only last one to be registered
        will have an effect.
+       The serializer is also used for subclasses of the registered type, which have no serializer registered
+       for themselves or for a closer base class.
 
     Example:
        Usage example for type datetime:
@@ -46,6 +53,9 @@ def jsonic_deserializer(deserialized_type_name):
     Note:
         If multiple deserializer functions are registered for the same type, only last one to be registered
         will have an effect.
+        Deserializer functions of containers should declare a ``deserialize_value`` keyword parameter, and use it
+        for deserializing the nested ``jsonic representations``, so they are deserialized with the options of the
+        ``deserialize`` call (private attributes, references mode and interning)
 
     Example:
         Usage example for type datetime:
@@ -53,6 +63,12 @@ def jsonic_deserializer(deserialized_type_name):
             @deserializer(deserialized_type_name=datetime)
             def deserialize_datetime(serialized_datetime):
                 return datetime.fromisoformat(serialized_datetime['datetime'])
+
+        Usage example for type tuple:
+
+            @deserializer(deserialized_type_name=tuple)
+            def deserialize_tuple(serialized_tuple, deserialize_value=deserialize):
+                return tuple(deserialize_value(serialized_tuple['items']))
     """
 
     def wrapper(function):
@@ -63,22 +79,65 @@ def jsonic_deserializer(deserialized_type_name):
 
 class _JsonicSerializer:
     serializers = dict()
+    # Serializer resolved for each concrete type, by walking it's MRO. Cleared when a serializer is registered
+    resolved_serializers = dict()
 
     def __init__(self, function, serialized_type):
         self.function = function
         _JsonicSerializer.serializers[serialized_type] = function
+        _JsonicSerializer.resolved_serializers.clear()
 
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
 
+    @staticmethod
+    def resolve(typ: type):
+        """
+        Returns:
+            tuple of (type name, serializer function) of the closest class in the MRO of ``typ`` that has a registered
+            serializer, or ``None`` if there is no such class
+        """
+        try:
+            return _JsonicSerializer.resolved_serializers[typ]
+        except KeyError:
+            pass
+
+        resolved = None
+        for klass in typ.__mro__:
+            function = _JsonicSerializer.serializers.get(klass)
+            if function is not None:
+                resolved = (full_type_name(klass), function)
+                break
+
+        _JsonicSerializer.resolved_serializers[typ] = resolved
+        return resolved
+
 
 class _JsonicDeserializer:
     deserializers = dict()
+    # Deserializers by the bare type name, used by type tags written before full type names were used
+    legacy_deserializers = dict()
+    # Deserializers declaring a deserialize_value parameter, for deserializing their nested values
+    nested_value_deserializers = set()
 
     def __init__(self, function, deserialized_type_name):
         self.function = function
+        if 'deserialize_value' in inspect.signature(function).parameters:
+            _JsonicDeserializer.nested_value_deserializers.add(function)
 
-        _JsonicDeserializer.deserializers[deserialized_type_name.__name__] = function
+        _JsonicDeserializer.deserializers[full_type_name(deserialized_type_name)] = function
+        _JsonicDeserializer.legacy_deserializers[deserialized_type_name.__name__] = function
 
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
+
+    @staticmethod
+    def get(type_name: str):
+        """
+        Returns:
+            deserializer function registered for ``type_name``, or ``None`` if there is no such deserializer
+        """
+        function = _JsonicDeserializer.deserializers.get(type_name)
+        if function is None:
+            function = _JsonicDeserializer.legacy_deserializers.get(type_name)
+        return function
@@ -1,9 +1,47 @@
-from datetime import datetime
+import base64
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath, Path
+from uuid import UUID
 
 from jsonic import jsonic_serializer, jsonic_deserializer
+from jsonic.serializable import deserialize, get_type_by_name
+from jsonic.util import full_type_name
 
 """This Module contains default serializer and deserializer for some types"""
 
+__all__ = [
+    'serialize_datetime',
+    'deserialize_datetime',
+    'serialize_date',
+    'deserialize_date',
+    'serialize_time',
+    'deserialize_time',
+    'serialize_timedelta',
+    'deserialize_timedelta',
+    'serialize_complex',
+    'deserialize_complex',
+    'serialize_decimal',
+    'deserialize_decimal',
+    'serialize_uuid',
+    'deserialize_uuid',
+    'serialize_enum',
+    'deserialize_enum',
+    'serialize_bytes',
+    'deserialize_bytes',
+    'serialize_set',
+    'deserialize_set',
+    'serialize_frozenset',
+    'deserialize_frozenset',
+    'serialize_tuple',
+    'deserialize_tuple',
+    'serialize_pure_path',
+    'deserialize_pure_path',
+    'serialize_path',
+    'deserialize_path',
+]
+
 
 @jsonic_serializer(serialized_type=datetime)
 def serialize_datetime(datetime_obj):
@@ -15,13 +53,139 @@ def deserialize_datetime(serialized_datetime):
     return datetime.fromisoformat(serialized_datetime['datetime'])
 
 
+@jsonic_serializer(serialized_type=date)
+def serialize_date(date_obj: date):
+    return {'date': date_obj.isoformat()}
+
+
+@jsonic_deserializer(deserialized_type_name=date)
+def deserialize_date(serialized_date):
+    return date.fromisoformat(serialized_date['date'])
+
+
+@jsonic_serializer(serialized_type=time)
+def serialize_time(time_obj: time):
+    return {'time': time_obj.isoformat()}
+
+
+@jsonic_deserializer(deserialized_type_name=time)
+def deserialize_time(serialized_time):
+    return time.fromisoformat(serialized_time['time'])
+
+
+@jsonic_serializer(serialized_type=timedelta)
+def serialize_timedelta(delta: timedelta):
+    return {'days': delta.days, 'seconds': delta.seconds, 'microseconds': delta.microseconds}
+
+
+@jsonic_deserializer(deserialized_type_name=timedelta)
+def deserialize_timedelta(serialized_timedelta):
+    return timedelta(days=serialized_timedelta['days'], seconds=serialized_timedelta['seconds'],
+                     microseconds=serialized_timedelta['microseconds'])
+
+
 @jsonic_serializer(serialized_type=complex)
 def serialize_complex(num: complex):
-    return {'value': f'complex({num.real},{num.imag})'}
+    return {'real': num.real, 'imag': num.imag}
 
 
 @jsonic_deserializer(deserialized_type_name=complex)
 def deserialize_complex(obj: dict):
-    num_str = obj['value']
-    comma_index = num_str.index(',')
-    return complex(real=float(num_str[8:comma_index]), imag=float(num_str[comma_index + 1:-1]))
+    if 'value' in obj:  # 'complex(real,imag)' string, written by previous versions
+        num_str = obj['value']
+        comma_index = num_str.index(',')
+        return complex(real=float(num_str[8:comma_index]), imag=float(num_str[comma_index + 1:-1]))
+    return complex(obj['real'], obj['imag'])
+
+
+@jsonic_serializer(serialized_type=Decimal)
+def serialize_decimal(num: Decimal):
+    return {'decimal': str(num)}
+
+
+@jsonic_deserializer(deserialized_type_name=Decimal)
+def deserialize_decimal(serialized_decimal):
+    return Decimal(serialized_decimal['decimal'])
+
+
+@jsonic_serializer(serialized_type=UUID)
+def serialize_uuid(uuid: UUID):
+    return {'uuid': uuid.hex}
+
+
+@jsonic_deserializer(deserialized_type_name=UUID)
+def deserialize_uuid(serialized_uuid):
+    return UUID(hex=serialized_uuid['uuid'])
+
+
+@jsonic_serializer(serialized_type=Enum)
+def serialize_enum(enum_member: Enum):
+    return {'enum': full_type_name(type(enum_member)), 'value': enum_member.value}
+
+
+@jsonic_deserializer(deserialized_type_name=Enum)
+def deserialize_enum(serialized_enum, deserialize_value=deserialize):
+    enum_type = get_type_by_name(serialized_enum['enum'])
+    if not issubclass(enum_type, Enum):
+        raise TypeError(f'Could not deserialize enum member of type {serialized_enum["enum"]}, which is not an Enum')
+    return enum_type(deserialize_value(serialized_enum['value']))
+
+
+@jsonic_serializer(serialized_type=bytes)
+def serialize_bytes(data: bytes):
+    return {'base64': base64.b64encode(data).decode('ascii')}
+
+
+@jsonic_deserializer(deserialized_type_name=bytes)
+def deserialize_bytes(serialized_bytes):
+    return base64.b64decode(serialized_bytes['base64'])
+
+
+@jsonic_serializer(serialized_type=set)
+def serialize_set(items: set):
+    return {'items': list(items)}
+
+
+@jsonic_deserializer(deserialized_type_name=set)
+def deserialize_set(serialized_set, deserialize_value=deserialize):
+    return set(deserialize_value(serialized_set['items']))
+
+
+@jsonic_serializer(serialized_type=frozenset)
+def serialize_frozenset(items: frozenset):
+    return {'items': list(items)}
+
+
+@jsonic_deserializer(deserialized_type_name=frozenset)
+def deserialize_frozenset(serialized_frozenset, deserialize_value=deserialize):
+    return frozenset(deserialize_value(serialized_frozenset['items']))
+
+
+@jsonic_serializer(serialized_type=tuple)
+def serialize_tuple(items: tuple):
+    return {'items': list(items)}
+
+
+@jsonic_deserializer(deserialized_type_name=tuple)
+def deserialize_tuple(serialized_tuple, deserialize_value=deserialize):
+    return tuple(deserialize_value(serialized_tuple['items']))
+
+
+@jsonic_serializer(serialized_type=PurePath)
+def serialize_pure_path(path: PurePath):
+    return {'path': str(path)}
+
+
+@jsonic_deserializer(deserialized_type_name=PurePath)
+def deserialize_pure_path(serialized_path):
+    return PurePath(serialized_path['path'])
+
+
+@jsonic_serializer(serialized_type=Path)
+def serialize_path(path: Path):
+    return {'path': str(path)}
+
+
+@jsonic_deserializer(deserialized_type_name=Path)
+def deserialize_path(serialized_path):
+    return Path(serialized_path['path'])
@@ -0,0 +1,236 @@
+"""
+This Module contains functions for computing the changes between two snapshots of an object, and applying them.
+
+A patch is a ``dict`` which can be encoded as JSON, describing the changes to a class instance, ``dict`` or ``list``:
+
+    {
+        '_serialized_type': type_name,  # only in the top-level patch of a class instance
+        'set': {attribute: jsonic representation of it's new value},
+        'delete': [removed attribute],
+        'patch': {attribute: patch of it's class instance, dict or list value},
+    }
+
+Sections without changes are left out. Attributes of lists are their indexes, as strings
+"""
+from jsonic import serializable
+from jsonic.decorators import _JsonicSerializer
+from jsonic.serializable import deserialize, _serialize_value, _serialize_object, _JSON_PRIMITIVE_TYPES
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, full_type_name
+
+
+PATCH_SET = 'set'
+PATCH_DELETE = 'delete'
+PATCH_NESTED = 'patch'
+
+
+def serialize_delta(old, new, serialize_private_attributes: bool = False) -> dict:
+    """
+    Computes the patch turning ``old`` into ``new``, which are instances of the same jsonic type.
+    Nested class instances, dicts and lists of the same length are compared attribute by attribute, so only the
+    changed attributes are serialized. Other values, and instances of types registered as ``immutable``, are replaced
+    as a whole when they are not equal
+
+    Args:
+        old: the previous snapshot
+        new: the current snapshot
+        serialize_private_attributes: should compare private attributes (attributes which their name starts with ``_``)
+
+    Returns:
+        the patch, see ``apply_delta``. transient attributes never appear in it
+
+    Raises:
+        TypeError: When ``old`` and ``new`` are not of the same type, or are not class instances or dicts
+    """
+    if type(old) is not type(new):
+        raise TypeError(f'Can not compute delta between different types: {type(old)} and {type(new)}')
+    if not _is_patched_by_attribute(old) or type(old) is list:
+        raise TypeError(f'Can not compute delta of type: {type(old)}, only of class instances and dicts')
+    patch = _delta(old, new, serialize_private_attributes, set()) or {}
+    if type(old) is not dict:
+        patch[SERIALIZED_TYPE_ATTRIBUTE_NAME] = full_type_name(type(old))
+    return patch
+
+
+def apply_delta(target, patch: dict, deserialize_private_attributes: bool = False):
+    """
+    Applies a patch computed by ``serialize_delta`` in place.
+    An object shared by several attributes, such as an instance deserialized in references mode, is patched once
+
+    Args:
+        target: previously deserialized instance of the patched type, or it's ``jsonic representation``
+            (a dict containing ``_serialized_type``), whose nested values are patched in their serialized form
+        patch: patch returned by ``serialize_delta``, possibly after a JSON round trip
+        deserialize_private_attributes (bool): should apply changes to private attributes
+            (attributes which their name starts with ``_``)
+
+    Returns:
+        ``target``
+
+    Raises:
+        AttributeError: When the patch was computed for another type than the type of ``target``
+    """
+    serialized = type(target) is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in target
+    type_name = patch.get(SERIALIZED_TYPE_ATTRIBUTE_NAME)
+    target_type_name = target.get(SERIALIZED_TYPE_ATTRIBUTE_NAME) if type(target) is dict else full_type_name(type(target))
+    if type_name != target_type_name:
+        raise AttributeError(f'Applying patch of type {type_name} to type {target_type_name}')
+
+    _apply(target, patch, deserialize_private_attributes, serialized, set())
+    return target
+
+
+def _is_patched_by_attribute(value) -> bool:
+    """
+    Returns:
+        ``True`` for class instances, dicts and lists, which are compared and patched attribute by attribute
+    """
+    typ = type(value)
+    if typ in _JSON_PRIMITIVE_TYPES:
+        return False
+    if typ is dict or typ is list:
+        return True
+    if _JsonicSerializer.resolve(typ) is not None:
+        return False
+    return hasattr(value, '__dict__') or hasattr(typ, '__slots__')
+
+
+def _is_immutable(value) -> bool:
+    """
+    Returns:
+        ``True`` for instances of types registered as ``immutable``, which interning may share between holders,
+        so they are replaced instead of patched
+    """
+    typ = type(value)
+    return typ is not dict and typ is not list and serializable._type_data_by_class(typ).immutable
+
+
+def _attributes(value, serialize_private_attributes) -> dict:
+    typ = type(value)
+    if typ is dict:
+        return value
+    if typ is list:
+        return {str(index): element for index, element in enumerate(value)}
+    attributes = _serialize_object(value, serialize_private_attributes)
+    del attributes[SERIALIZED_TYPE_ATTRIBUTE_NAME]
+    return attributes
+
+
+def _delta(old, new, serialize_private_attributes, ancestors: set) -> dict:
+    """
+    Args:
+        ancestors (set): the ``id`` pairs of the objects being compared on the path to ``old`` and ``new``
+
+    Returns:
+        the patch turning ``old`` into ``new``, or ``None`` if they are equal
+    """
+    # Objects are compared again on every path they are reachable through, as each path is patched separately.
+    # Only cycles, where the objects are their own ancestors, are not followed
+    visit = (id(old), id(new))
+    if visit in ancestors:
+        return None
+    ancestors.add(visit)
+    try:
+        return _attributes_delta(old, new, serialize_private_attributes, ancestors)
+    finally:
+        ancestors.discard(visit)
+
+
+def _attributes_delta(old, new, serialize_private_attributes, ancestors: set) -> dict:
+    old_attributes = _attributes(old, serialize_private_attributes)
+    new_attributes = _attributes(new, serialize_private_attributes)
+    set_attributes = {}
+    nested_patches = {}
+
+    for key, new_value in new_attributes.items():
+        if key not in old_attributes:
+            set_attributes[key] = _serialize_value(new_value, serialize_private_attributes)
+            continue
+
+        old_value = old_attributes[key]
+        if old_value is new_value:
+            continue
+        if type(old_value) is type(new_value) and _is_patched_by_attribute(new_value) and \
+                not (type(new_value) is list and len(old_value) != len(new_value)) and \
+                not (type(new_value) is dict and not all(type(item_key) is str for item_key in new_value)) and \
+                not _is_immutable(new_value):
+            nested_patch = _delta(old_value, new_value, serialize_private_attributes, ancestors)
+            if nested_patch is not None:
+                nested_patches[key] = nested_patch
+        elif not _equal(old_value, new_value, serialize_private_attributes):
+            set_attributes[key] = _serialize_value(new_value, serialize_private_attributes)
+
+    deleted_attributes = [key for key in old_attributes if key not in new_attributes]
+    if not (set_attributes or nested_patches or deleted_attributes):
+        return None
+
+    patch = {}
+    if set_attributes:
+        patch[PATCH_SET] = set_attributes
+    if deleted_attributes:
+        patch[PATCH_DELETE] = deleted_attributes
+    if nested_patches:
+        patch[PATCH_NESTED] = nested_patches
+    return patch
+
+
+def _equal(old_value, new_value, serialize_private_attributes) -> bool:
+    if type(old_value) is not type(new_value):
+        return False
+    if old_value == new_value:
+        return True
+    # Values of types without __eq__ are compared by their jsonic representation
+    return type(old_value) not in _JSON_PRIMITIVE_TYPES and \
+        _serialize_value(old_value, serialize_private_attributes) == \
+        _serialize_value(new_value, serialize_private_attributes)
+
+
+def _apply(target, patch: dict, deserialize_private_attributes: bool, serialized: bool, patched: set):
+    """
+    Args:
+        patched (set): ``id`` of the objects already patched, which are not patched again when reached through
+            another attribute
+    """
+    if id(target) in patched:
+        return
+    patched.add(id(target))
+
+    typ = type(target)
+    if typ is list:
+        setter = target.__setitem__
+        getter = target.__getitem__
+        deleter = target.__delitem__
+        key_of = int
+        excluded = ()
+        filter_private = False
+    else:
+        key_of = str
+        if typ is dict:
+            setter, getter, deleter = target.__setitem__, target.__getitem__, target.__delitem__
+            excluded = ()
+            # Only attributes of class instances are private, keys of plain dicts are always applied
+            filter_private = serialized and SERIALIZED_TYPE_ATTRIBUTE_NAME in target
+        else:
+            filter_private = True
+            type_data = serializable._type_data_by_class(typ)
+            excluded = type_data.serialization_plan.excluded_attributes
+            # Slots and frozen dataclass fields are set directly, the same way deserialization does
+            set_directly = type_data.deserialization_factory._fill_directly
+            setter = (lambda name, value: object.__setattr__(target, name, value)) if set_directly else \
+                (lambda name, value: setattr(target, name, value))
+            getter = lambda name: getattr(target, name)
+            deleter = lambda name: object.__delattr__(target, name) if set_directly else delattr(target, name)
+
+    def is_applied(key: str) -> bool:
+        return key not in excluded and (deserialize_private_attributes or not filter_private or not key.startswith('_'))
+
+    for key, value in patch.get(PATCH_SET, {}).items():
+        if is_applied(key):
+            if not serialized:
+                value = deserialize(value, deserialize_private_attributes=deserialize_private_attributes)
+            setter(key_of(key), value)
+    for key in patch.get(PATCH_DELETE, ()):
+        if is_applied(key):
+            deleter(key_of(key))
+    for key, nested_patch in patch.get(PATCH_NESTED, {}).items():
+        if is_applied(key):
+            _apply(getter(key_of(key)), nested_patch, deserialize_private_attributes, serialized, patched)
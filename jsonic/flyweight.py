@@ -0,0 +1,143 @@
+import sys
+import threading
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+"""This Module contains the bounded pool of immutable values shared between deserialized objects when interning"""
+
+DEFAULT_FLYWEIGHT_POOL_SIZE = 100000
+# Longer strings are rarely repeated, so they are not pooled
+MAX_POOLED_STRING_LENGTH = 128
+
+# Values of these types are compared by type and value, values of other immutable types by type and repr,
+# which tells apart values that are equal but not the same, such as Decimal('1.0') and Decimal('1.00')
+_VALUE_KEYED_TYPES = frozenset({str, int, bytes})
+_REPR_KEYED_TYPES = frozenset({float, complex, datetime, date, time, timedelta, Decimal, UUID})
+
+
+class FlyweightPool:
+    """
+    Bounded pool of immutable values and instances of immutable jsonic types, used by ``deserialize`` when interning.
+    Equal values deserialized while the pool holds them are replaced by the pooled value, so they share memory.
+    When the pool is full, the oldest pooled values are evicted
+
+    Attributes:
+        max_size (int): maximal number of pooled values
+        hits (int): number of deserialized values replaced by a pooled value
+        misses (int): number of deserialized values added to the pool
+    """
+
+    def __init__(self, max_size: int = DEFAULT_FLYWEIGHT_POOL_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def intern_value(self, value):
+        """
+        Returns:
+            the pooled value equal to ``value``, or ``value`` itself if it is not of an immutable type
+        """
+        typ = type(value)
+        if typ in _VALUE_KEYED_TYPES:
+            if typ is str and len(value) > MAX_POOLED_STRING_LENGTH:
+                return value
+            key = (typ, value)
+        elif typ in _REPR_KEYED_TYPES:
+            key = (typ, repr(value))
+        else:
+            return value
+        return self._get_or_add(key, value)
+
+    def intern_items(self, container):
+        """
+        Returns:
+            copy of the ``dict`` / ``list`` with pooled values, and interned ``str`` keys
+        """
+        intern_value = self.intern_value
+        if type(container) is list:
+            return [intern_value(element) for element in container]
+        return {(sys.intern(key) if type(key) is str else key): intern_value(value) for key, value in container.items()}
+
+    def intern_instance(self, type_data, deserialized_dict: dict, deserialize_private_attributes=False):
+        """
+        Returns:
+            pooled instance of an immutable jsonic type with the deserialized attributes, created if not pooled
+        """
+        key = (type_data.cls, _frozen(deserialized_dict))
+        instance = self._values.get(key)
+        if instance is not None:
+            self.hits += 1
+            return instance
+        return self._get_or_add(key, type_data.deserialization_factory.create(deserialized_dict,
+                                                                              deserialize_private_attributes))
+
+    def _get_or_add(self, key, value):
+        pooled = self._values.get(key)
+        if pooled is not None:
+            self.hits += 1
+            return pooled
+
+        with self._lock:
+            self.misses += 1
+            if len(self._values) >= self.max_size:
+                del self._values[next(iter(self._values))]
+            self._values[key] = value
+        return value
+
+
+class _Identity:
+    """
+    Pool key part for values compared by identity. Holds the value, so it's id is not reused while it is pooled
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, o: object) -> bool:
+        return type(o) is _Identity and o.value is self.value
+
+
+def _frozen(value):
+    typ = type(value)
+    if typ in _VALUE_KEYED_TYPES:
+        return typ, value
+    if typ in _REPR_KEYED_TYPES:
+        return typ, repr(value)
+    if typ is list:
+        return list, tuple(_frozen(element) for element in value)
+    if typ is dict:
+        return dict, tuple((key, _frozen(item)) for key, item in value.items())
+    if value is None or typ is bool:
+        return value
+    # Nested instances are the same only if they are the same object, for example pooled immutable instances
+    return _Identity(value)
+
+
+_default_flyweight_pool = FlyweightPool()
+
+
+def get_flyweight_pool(intern) -> FlyweightPool:
+    """
+    Args:
+        intern: ``True`` for the shared default pool, a ``FlyweightPool``, or ``False`` for no pool
+
+    Returns:
+        the pool, or ``None`` when not interning
+    """
+    if isinstance(intern, FlyweightPool):
+        return intern
+    return _default_flyweight_pool if intern else None
@@ -0,0 +1,275 @@
+import functools
+import threading
+import time
+from typing import Callable
+
+from jsonic import serializable
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, full_type_name
+
+"""
+This Module contains opt-in instrumentation of serialization and deserialization, recording per-type statistics.
+
+Enabling instrumentation replaces internal functions of ``jsonic.serializable`` with measuring wrappers,
+and disabling it restores the original functions, so instrumentation costs nothing while disabled.
+The wrapped functions are the points every engine dispatches each instance through, so all deserialization modes
+(iterative, typed, references and interning) are measured.
+"""
+
+_INSTRUMENTED_FUNCTIONS = ('_serialize_value', '_serialize_object', '_deserialize_custom_value', '_create_instance',
+                           '_type_data_by_name', '_type_data_by_class', '_unregistered_type_data')
+
+_original_functions = {}
+_callback = None
+_lock = threading.Lock()
+_local = threading.local()
+_type_names = {}
+
+
+class _TypeStats:
+    __slots__ = ('count', 'time', 'bytes')
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.bytes = 0
+
+    def snapshot(self) -> dict:
+        return {'count': self.count, 'time': self.time, 'bytes': self.bytes}
+
+
+_serialize_stats = {}
+_deserialize_stats = {}
+_type_data_cache = {'hits': 0, 'misses': 0}
+_type_name_cache_base = None
+
+
+def enable_instrumentation(callback: Callable[[str, str, float, int], None] = None):
+    """
+    Starts recording call counts, time and json bytes per type, see ``stats``
+
+    Args:
+        callback: called after every instrumented serialization and deserialization of a class instance, with
+            ``(operation, type_name, seconds, json_bytes)``, where operation is ``'serialize'`` or ``'deserialize'``.
+            Can be used for exporting the measurements to a metrics system
+    """
+    global _callback
+    _callback = callback
+    if _original_functions:
+        return
+
+    for function_name in _INSTRUMENTED_FUNCTIONS:
+        _original_functions[function_name] = getattr(serializable, function_name)
+    serializable._serialize_value = _instrumented_serialize_value(_original_functions['_serialize_value'])
+    serializable._serialize_object = _instrumented_serialize_object(_original_functions['_serialize_object'])
+    serializable._deserialize_custom_value = \
+        _instrumented_deserialize_custom_value(_original_functions['_deserialize_custom_value'])
+    serializable._create_instance = _instrumented_create_instance(_original_functions['_create_instance'])
+    serializable._type_data_by_name = _instrumented_type_data_lookup(_original_functions['_type_data_by_name'],
+                                                                     serializable.Serializable.jsonic_types)
+    serializable._type_data_by_class = _instrumented_type_data_lookup(_original_functions['_type_data_by_class'],
+                                                                      serializable._jsonic_types_by_class)
+    serializable._unregistered_type_data = \
+        _instrumented_unregistered_type_data(_original_functions['_unregistered_type_data'])
+
+
+def disable_instrumentation():
+    """
+    Stops recording, restoring the uninstrumented functions. Recorded statistics are kept until reset
+    """
+    global _callback
+    _callback = None
+    for function_name, function in _original_functions.items():
+        setattr(serializable, function_name, function)
+    _original_functions.clear()
+
+
+def is_instrumentation_enabled() -> bool:
+    return bool(_original_functions)
+
+
+def stats(reset: bool = False) -> dict:
+    """
+    Returns:
+        snapshot of the recorded statistics::
+
+            {
+                'serialize': {type_name: {'count': int, 'time': float, 'bytes': int}},
+                'deserialize': {type_name: {'count': int, 'time': float, 'bytes': int}},
+                'type_data_cache': {'hits': int, 'misses': int},
+                'type_name_cache': {'hits': int, 'misses': int},
+            }
+
+        ``time`` is the total seconds spent on instances of the type, excluding nested instances, which are
+        recorded under their own type. When deserializing class instances, it is the time spent creating them from
+        their deserialized attributes. ``bytes`` is the estimated json size of the instances, excluding nested instances.
+        ``type_data_cache`` counts lookups of type data, where lookups of registered types are always hits,
+        ``type_name_cache`` counts resolutions of type names of unregistered types to their class
+
+    Args:
+        reset (bool): reset the statistics after taking the snapshot
+    """
+    with _lock:
+        type_name_cache = serializable.type_name_cache_info()
+        hits_base, misses_base = _type_name_cache_base or (0, 0)
+        snapshot = {
+            'serialize': {type_name: type_stats.snapshot() for type_name, type_stats in _serialize_stats.items()},
+            'deserialize': {type_name: type_stats.snapshot() for type_name, type_stats in _deserialize_stats.items()},
+            'type_data_cache': dict(_type_data_cache),
+            'type_name_cache': {'hits': type_name_cache.hits - hits_base, 'misses': type_name_cache.misses - misses_base},
+        }
+    if reset:
+        reset_stats()
+    return snapshot
+
+
+def reset_stats():
+    global _type_name_cache_base
+    with _lock:
+        _serialize_stats.clear()
+        _deserialize_stats.clear()
+        _type_data_cache.update(hits=0, misses=0)
+        type_name_cache = serializable.type_name_cache_info()
+        _type_name_cache_base = (type_name_cache.hits, type_name_cache.misses)
+
+
+def _record(operation: str, type_stats_by_name: dict, type_name: str, seconds: float, json_bytes: int):
+    with _lock:
+        type_stats = type_stats_by_name.get(type_name)
+        if type_stats is None:
+            type_stats = type_stats_by_name[type_name] = _TypeStats()
+        type_stats.count += 1
+        type_stats.time += seconds
+        type_stats.bytes += json_bytes
+    callback = _callback
+    if callback is not None:
+        callback(operation, type_name, seconds, json_bytes)
+
+
+def _timed(function, *args, **kwargs):
+    """
+    Calls ``function``, returning it's result and the seconds spent in it, excluding nested timed calls
+    """
+    nested_times = getattr(_local, 'nested_times', None)
+    if nested_times is None:
+        nested_times = _local.nested_times = []
+
+    nested_times.append(0.0)
+    start = time.perf_counter()
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        own_time = elapsed - nested_times.pop()
+        if nested_times:
+            nested_times[-1] += elapsed
+    return result, own_time
+
+
+def _type_name(cls: type) -> str:
+    type_name = _type_names.get(cls)
+    if type_name is None:
+        type_name = _type_names[cls] = full_type_name(cls)
+    return type_name
+
+
+def _instrumented_serialize_value(serialize_value):
+    @functools.wraps(serialize_value)
+    def instrumented(obj, serialize_private_attributes=False, include_type_tags=True, references=None, ancestors=None):
+        typ = type(obj)
+        if typ is dict or typ is list:
+            return serialize_value(obj, serialize_private_attributes, include_type_tags, references, ancestors)
+
+        json_bytes = getattr(_local, 'json_bytes', None)
+        if json_bytes is None:
+            json_bytes = _local.json_bytes = []
+
+        json_bytes.append(0)
+        try:
+            result, seconds = _timed(serialize_value, obj, serialize_private_attributes, include_type_tags,
+                                     references, ancestors)
+        finally:
+            own_json_bytes = json_bytes.pop()
+        _record('serialize', _serialize_stats, _type_name(typ), seconds, own_json_bytes)
+        return result
+
+    return instrumented
+
+
+def _instrumented_serialize_object(serialize_object):
+    @functools.wraps(serialize_object)
+    def instrumented(obj, serialize_private_attributes=False):
+        serialized_object = serialize_object(obj, serialize_private_attributes)
+        # Nested instances are not serialized yet, so only the attributes of obj itself are measured
+        json_bytes = getattr(_local, 'json_bytes', None)
+        if json_bytes:
+            json_bytes[-1] = _estimated_json_size(serialized_object)
+        return serialized_object
+
+    return instrumented
+
+
+def _instrumented_deserialize_custom_value(deserialize_custom_value):
+    @functools.wraps(deserialize_custom_value)
+    def instrumented(deserializer, obj, *args, **kwargs):
+        result, seconds = _timed(deserialize_custom_value, deserializer, obj, *args, **kwargs)
+        _record('deserialize', _deserialize_stats, obj[SERIALIZED_TYPE_ATTRIBUTE_NAME], seconds,
+                _estimated_json_size(obj))
+        return result
+
+    return instrumented
+
+
+def _instrumented_create_instance(create_instance):
+    @functools.wraps(create_instance)
+    def instrumented(type_data, deserialized_dict, *args, **kwargs):
+        # Measured before creating the instance, which may consume the deserialized attributes
+        type_name = type_data.serialization_plan.type_name
+        json_bytes = _estimated_json_size(deserialized_dict) + len(SERIALIZED_TYPE_ATTRIBUTE_NAME) + len(type_name) + 6
+        result, seconds = _timed(create_instance, type_data, deserialized_dict, *args, **kwargs)
+        _record('deserialize', _deserialize_stats, type_name, seconds, json_bytes)
+        return result
+
+    return instrumented
+
+
+def _instrumented_type_data_lookup(type_data_lookup, registered_types: dict):
+    @functools.wraps(type_data_lookup)
+    def instrumented(key):
+        # Lookups of unregistered types are counted by _unregistered_type_data
+        if key in registered_types:
+            with _lock:
+                _type_data_cache['hits'] += 1
+        return type_data_lookup(key)
+
+    return instrumented
+
+
+def _instrumented_unregistered_type_data(unregistered_type_data):
+    @functools.wraps(unregistered_type_data)
+    def instrumented(cls: type):
+        hit = cls in serializable._unregistered_types
+        with _lock:
+            _type_data_cache['hits' if hit else 'misses'] += 1
+        return unregistered_type_data(cls)
+
+    return instrumented
+
+
+def _estimated_json_size(value, nested: bool = False) -> int:
+    """
+    Estimates the size of the json encoding of ``value``, leaving out class instances and their ``jsonic representations``
+    """
+    typ = type(value)
+    if typ is str:
+        return len(value) + 2
+    if typ is dict:
+        if nested and SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
+            return 0
+        return 1 + sum(len(str(key)) + 4 + _estimated_json_size(item, nested=True) for key, item in value.items())
+    if typ is list:
+        return 1 + sum(_estimated_json_size(element, nested=True) + 1 for element in value)
+    if value is None or typ is bool:
+        return 4 if value is not False else 5
+    if typ is int or typ is float:
+        return len(repr(value))
+    return 0
@@ -0,0 +1,127 @@
+from jsonic.backends import get_json_backend
+from jsonic.decorators import _JsonicDeserializer
+from jsonic.serializable import deserialize, _type_data_by_name, _JSON_STRING_INPUT_TYPES
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, full_type_name
+
+"""This Module contains lazy deserialization, which reconstructs nested objects only when they are accessed"""
+
+
+def deserialize_lazy(obj, deserialize_private_attributes: bool = False, string_input: bool = False,
+                     expected_type: type = None, json_backend: str = None):
+    """
+    Deserializes ``jsonic representation`` lazily: every dictionary representing a class instance is returned as a
+    ``LazyJsonicObject`` proxy. Attributes of the proxy are deserialized when first accessed, and cached
+
+    Args:
+        obj: dictionary/json string representing dictionary, that is a result of ``serialize`` function on an object
+        deserialize_private_attributes (bool): should deserialize private attributes (attributes which their name starts with ``_``)
+        string_input (bool): is the input a ``json string`` (``str`` / utf-8 ``bytes``), or ``dict``
+        expected_type: the deserialized result expected type
+        json_backend: name of the json backend used for string input, see ``deserialize``
+
+    Returns:
+        ``LazyJsonicObject`` / list / dict of them for class instances, or the deserialized input for other types
+
+    Raises:
+        AttributeError: When the serialized type is different from the expected type
+    """
+    if string_input:
+        if type(obj) not in _JSON_STRING_INPUT_TYPES:
+            raise TypeError(f'deserializing string, but input was not of type str or bytes. given input: {obj}')
+        obj = get_json_backend(json_backend).loads(obj)
+
+    if type(obj) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in obj and \
+            not _JsonicDeserializer.get(obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]):
+        type_name = obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]
+        if expected_type and full_type_name(expected_type) != type_name:
+            raise AttributeError(f'Deserializing type {type_name}, which is not the expected type: {expected_type}')
+        return LazyJsonicObject(obj, deserialize_private_attributes)
+
+    if type(obj) == list:
+        if expected_type and expected_type != list:
+            raise AttributeError(f'Deserializing list, which is not the expected type: {expected_type}')
+        return [deserialize_lazy(element, deserialize_private_attributes) for element in obj]
+
+    if type(obj) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME not in obj:
+        if expected_type and expected_type != dict:
+            raise AttributeError(f'Deserializing type dict, which is not the expected type: {expected_type}')
+        return {key: deserialize_lazy(value, deserialize_private_attributes) for key, value in obj.items()}
+
+    return deserialize(obj, deserialize_private_attributes=deserialize_private_attributes, expected_type=expected_type)
+
+
+def materialize(obj):
+    """
+    Returns:
+        the class instance a ``LazyJsonicObject`` proxy represents, or ``obj`` itself if it is not a proxy
+    """
+    if type(obj) == LazyJsonicObject:
+        return obj._jsonic_materialize()
+    return obj
+
+
+class LazyJsonicObject:
+    """
+    Proxy of a serialized class instance, returned by ``deserialize_lazy``.
+    Reading an attribute deserializes only that attribute, and caches it.
+    The proxy reports the class it represents as it's ``__class__``, so ``isinstance`` checks work
+
+    Note:
+        Reading a name which is not a serialized attribute, such as a method or a property, materializes the instance
+        and reads it from the instance. use ``materialize`` to get the instance itself
+    """
+    __slots__ = ('_jsonic_obj', '_jsonic_private', '_jsonic_attributes', '_jsonic_instance')
+
+    def __init__(self, obj: dict, deserialize_private_attributes: bool = False):
+        object.__setattr__(self, '_jsonic_obj', obj)
+        object.__setattr__(self, '_jsonic_private', deserialize_private_attributes)
+        object.__setattr__(self, '_jsonic_attributes', {})
+        object.__setattr__(self, '_jsonic_instance', None)
+
+    def __getattr__(self, name: str):
+        attributes = self._jsonic_attributes
+        if name in attributes:
+            return attributes[name]
+
+        obj = self._jsonic_obj
+        if name not in obj:
+            return getattr(self._jsonic_materialize(), name)
+        if name == SERIALIZED_TYPE_ATTRIBUTE_NAME or (not self._jsonic_private and name.startswith('_')):
+            raise AttributeError(f"'{obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]}' object has no attribute '{name}'")
+
+        value = obj[name]
+        if type(value) == list or (type(value) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value):
+            value = deserialize(value, deserialize_private_attributes=self._jsonic_private)
+        attributes[name] = value
+        return value
+
+    def __setattr__(self, name: str, value):
+        self._jsonic_attributes[name] = value
+        instance = self._jsonic_instance
+        if instance is not None:
+            setattr(instance, name, value)
+
+    @property
+    def __class__(self):
+        return _type_data_by_name(self._jsonic_obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]).cls
+
+    def __eq__(self, o: object) -> bool:
+        return self._jsonic_materialize() == materialize(o)
+
+    def __hash__(self):
+        return hash(self._jsonic_materialize())
+
+    def __repr__(self):
+        return f'LazyJsonicObject({self._jsonic_obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]})'
+
+    def _jsonic_materialize(self):
+        instance = self._jsonic_instance
+        if instance is None:
+            type_data = _type_data_by_name(self._jsonic_obj[SERIALIZED_TYPE_ATTRIBUTE_NAME])
+            deserialized_dict = {key: self.__getattr__(key) for key in self._jsonic_obj
+                                 if key != SERIALIZED_TYPE_ATTRIBUTE_NAME and
+                                 (self._jsonic_private or not key.startswith('_'))}
+            deserialized_dict.update(self._jsonic_attributes)
+            instance = type_data.deserialization_factory.create(deserialized_dict, self._jsonic_private)
+            object.__setattr__(self, '_jsonic_instance', instance)
+        return instance
@@ -0,0 +1,466 @@
+import collections.abc
+import inspect
+import types
+import typing
+from typing import Dict, Tuple
+
+from jsonic import serializable
+from jsonic.decorators import _JsonicSerializer, _JsonicDeserializer
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, REFERENCE_ATTRIBUTE_NAME, full_type_name
+
+"""
+This Module contains schemas of ``jsonic representations``, derived from the jsonic types, used for validating
+serialized input before deserializing it, and for exporting JSON Schema documents.
+
+The schema of a jsonic type is derived from it's __init__ signature and ``init_parameters_mapping``, which determine
+the required attributes, the same way deserialization does, and from the annotations of it's __init__ parameters and class, which determine the expected
+types of the attributes. Attributes without annotations, and attributes the schema does not know of, accept any value
+"""
+
+JSON_SCHEMA_DIALECT = 'https://json-schema.org/draft/2020-12/schema'
+
+_UNION_TYPES = (typing.Union, getattr(types, 'UnionType', typing.Union))
+_LIST_TYPES = (list, collections.abc.MutableSequence)
+_SEQUENCE_TYPES = (collections.abc.Sequence, collections.abc.Iterable, collections.abc.Collection)
+_ITEMS_TYPES = (set, frozenset, tuple, collections.abc.Set, collections.abc.MutableSet)
+_MAPPING_TYPES = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+_PRIMITIVE_JSON_TYPES = {type(None): 'null', bool: 'boolean', int: 'integer', float: 'number', str: 'string'}
+
+
+class TypeSchema:
+    """
+    Schema of the ``jsonic representation`` of a jsonic type
+
+    Attributes:
+        cls (type): the jsonic type
+        type_name (str): the type tag of the jsonic type
+        required_attributes (Tuple[str]): attributes matching the __init__ parameters, which are all passed
+            to __init__ when deserializing
+        public_required_attributes (Tuple[str]): the required attributes matching public __init__ parameters,
+            which are the required attributes when private attributes are not deserialized
+        attribute_types (Dict[str, type]): type hints of the attributes, excluding transient attributes
+    """
+
+    def __init__(self, type_data):
+        cls = type_data.cls
+        self.cls = cls
+        self.type_name = type_data.serialization_plan.type_name
+        excluded = type_data.serialization_plan.excluded_attributes
+
+        required_attributes = []
+        public_required_attributes = []
+        none_default_attributes = set()
+        if not type_data.bypass_init:
+            for parameter_name, parameter in inspect.signature(cls.__init__).parameters.items():
+                if parameter_name == 'self' or \
+                        parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                    continue
+                attribute_name = type_data.init_parameters_mapping.get(parameter_name, parameter_name)
+                if parameter.default is None:
+                    none_default_attributes.add(attribute_name)
+                # Every parameter is passed to __init__ when deserializing, including parameters with defaults
+                required_attributes.append(attribute_name)
+                if not parameter_name.startswith('_'):
+                    public_required_attributes.append(attribute_name)
+        self.required_attributes: Tuple[str] = tuple(required_attributes)
+        self.public_required_attributes: Tuple[str] = tuple(public_required_attributes)
+
+        attribute_types = _class_annotations(cls)
+        try:
+            attribute_types.update(type_data.attribute_type_hints)
+        except (NameError, TypeError):  # annotations referring to names that can not be resolved are ignored
+            pass
+        # Parameters defaulting to None accept None, as in annotations such as ``contact: ContactDetails = None``
+        self.attribute_types: Dict[str, type] = {name: typing.Optional[hint] if name in none_default_attributes else hint
+                                                 for name, hint in attribute_types.items() if name not in excluded}
+
+
+def type_schema(cls: type) -> TypeSchema:
+    """
+    Returns:
+        the schema of the ``jsonic representation`` of ``cls``, derived once and reused
+    """
+    return _schemas.type_schema(_type_data(cls))
+
+
+def validate_serialized(obj, expected_type=None, deserialize_private_attributes: bool = False, typed: bool = False):
+    """
+    Validates a ``jsonic representation`` against the schemas of the types it contains, in a single pass which
+    creates no instances, so invalid input is rejected before any deserialization work is done.
+    Called by ``deserialize`` when validating
+
+    Args:
+        obj: ``dictionary`` representation, as passed to ``deserialize``
+        expected_type: the expected type of the representation. may be a generic alias such as ``List[Product]``
+        deserialize_private_attributes (bool): validate private attributes, which are otherwise ignored
+        typed (bool): the representation was serialized in typed mode, so nested objects are validated by the
+            type hints of ``expected_type`` and of the attributes of nested classes
+
+    Raises:
+        ValueError: When the input does not match the schema, with the path of the first invalid value
+    """
+    walk = _Walk(deserialize_private_attributes, typed)
+    stack = [(obj, None, _schemas.hint_check(expected_type, typed) if expected_type is not None else _check_any)]
+    while stack:
+        value, path, check = stack.pop()
+        check(value, path, walk, stack)
+
+
+def json_schema(cls, typed: bool = False, serialize_private_attributes: bool = False) -> dict:
+    """
+    Exports the JSON Schema (draft 2020-12) of the ``jsonic representation`` of ``cls``
+
+    Args:
+        cls: jsonic type, or a generic alias such as ``List[Product]``
+        typed (bool): describe the representation serialized in typed mode, without ``_serialized_type`` tags
+        serialize_private_attributes (bool): include private attributes
+
+    Returns:
+        JSON Schema ``dict``. jsonic types are described in ``$defs`` by their type name and referenced by ``$ref``
+    """
+    definitions = {}
+    schema = _hint_json_schema(cls, typed, serialize_private_attributes, definitions)
+    return {'$schema': JSON_SCHEMA_DIALECT, **schema, **({'$defs': definitions} if definitions else {})}
+
+
+class _Walk:
+    __slots__ = ('private', 'typed')
+
+    def __init__(self, private: bool, typed: bool):
+        self.private = private
+        self.typed = typed
+
+
+class _Schemas:
+    """
+    Schemas and compiled checks, built on first use. Keyed by the type data, so re-registering a type rebuilds them
+    """
+
+    def __init__(self):
+        self._type_schemas = {}
+        self._type_checks = {}
+        self._hint_checks = {}
+
+    def type_schema(self, type_data) -> TypeSchema:
+        schema = self._type_schemas.get(type_data)
+        if schema is None:
+            schema = self._type_schemas[type_data] = TypeSchema(type_data)
+        return schema
+
+    def type_check(self, type_data):
+        check = self._type_checks.get(type_data)
+        if check is None:
+            check = self._type_checks[type_data] = _compile_type_check(self.type_schema(type_data))
+        return check
+
+    def hint_check(self, hint, typed: bool):
+        key = (hint, typed)
+        try:
+            check = self._hint_checks.get(key)
+        except TypeError:  # unhashable hint
+            return _compile_hint_check(hint, typed)[1]
+        if check is None:
+            check = self._hint_checks[key] = _compile_hint_check(hint, typed)[1]
+        return check
+
+
+_schemas = _Schemas()
+
+
+def _type_data(cls: type):
+    return serializable._type_data_by_class(cls)
+
+
+def _class_annotations(cls: type) -> dict:
+    annotations = {}
+    for klass in reversed(cls.__mro__):
+        if klass is serializable.Serializable or klass is object:
+            continue
+        try:
+            hints = typing.get_type_hints(klass)
+        except (NameError, TypeError):
+            continue
+        own_annotations = klass.__dict__.get('__annotations__', {})
+        annotations.update((name, hint) for name, hint in hints.items()
+                           if name in own_annotations and typing.get_origin(hint) is not typing.ClassVar)
+    return annotations
+
+
+def _format_path(path) -> str:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(f'[{key}]' if type(key) is int else f'.{key}')
+    return '$' + ''.join(reversed(keys))
+
+
+def _invalid(path, message: str):
+    raise ValueError(f'Invalid jsonic representation at {_format_path(path)}: {message}')
+
+
+def _check_any(value, path, walk: _Walk, stack: list):
+    typ = type(value)
+    if typ is list:
+        stack.extend((element, (path, index), _check_any) for index, element in enumerate(value))
+    elif typ is dict:
+        if SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
+            _check_tagged(value, path, walk, stack, None)
+        else:
+            stack.extend((item, (path, key), _check_any) for key, item in value.items())
+
+
+def _check_tagged(value: dict, path, walk: _Walk, stack: list, expected_cls):
+    type_name = value[SERIALIZED_TYPE_ATTRIBUTE_NAME]
+    if type(type_name) is not str:
+        _invalid(path, f'{SERIALIZED_TYPE_ATTRIBUTE_NAME} should be a string, got {type_name!r}')
+
+    if _JsonicDeserializer.get(type_name) is not None:
+        if expected_cls is not None:
+            _invalid(path, f'expected {full_type_name(expected_cls)}, got {type_name}')
+        _check_custom_value(value, path, walk, stack)
+        return
+
+    try:
+        type_data = serializable._type_data_by_name(type_name)
+    except (TypeError, ValueError, ImportError, AttributeError) as e:
+        _invalid(path, f'unknown type {type_name}: {e}')
+    if expected_cls is not None and not issubclass(type_data.cls, expected_cls):
+        _invalid(path, f'expected {full_type_name(expected_cls)}, got {type_name}')
+    _schemas.type_check(type_data)(value, path, walk, stack)
+
+
+def _check_custom_value(value: dict, path, walk: _Walk, stack: list):
+    # Values serialized by custom serializers are validated by their deserializer, only nested values are walked
+    for key, item in value.items():
+        if type(item) is dict or type(item) is list:
+            stack.append((item, (path, key), _check_any))
+
+
+def _compile_type_check(schema: TypeSchema):
+    required_attributes = schema.required_attributes
+    public_required_attributes = schema.public_required_attributes
+    attribute_checks = {name: _compile_value_check(hint, False) for name, hint in schema.attribute_types.items()}
+    typed_attribute_checks = {name: _compile_value_check(hint, True) for name, hint in schema.attribute_types.items()}
+    type_name = schema.type_name
+
+    def check(value: dict, path, walk: _Walk, stack: list):
+        private = walk.private
+        for attribute_name in required_attributes if private else public_required_attributes:
+            if attribute_name not in value:
+                _invalid(path, f'missing required attribute "{attribute_name}" of type {type_name}')
+
+        checks = typed_attribute_checks if walk.typed else attribute_checks
+        for key, item in value.items():
+            if key[:1] == '_' and (not private or key == SERIALIZED_TYPE_ATTRIBUTE_NAME):
+                continue
+            check_value = checks.get(key)
+            if check_value is not None:
+                check_value(item, key, path, stack)
+            elif type(item) is dict or type(item) is list:
+                stack.append((item, (path, key), _check_any))
+
+    return check
+
+
+def _compile_value_check(hint, typed: bool):
+    """
+    Returns:
+        function of ``(value, key, parent_path, stack)`` checking the value of an attribute or an element.
+        Values of primitive types are checked inline, as they are the vast majority of the values,
+        other values are pushed on the stack with their check
+    """
+    primitive_types = _primitive_types(hint)
+    if primitive_types is not None:
+        accepted_types, description = primitive_types
+
+        def check_value(value, key, parent_path, stack):
+            if type(value) not in accepted_types:
+                _invalid((parent_path, key), f'expected {description}, got {type(value).__name__}')
+        return check_value
+
+    check = _schemas.hint_check(hint, typed)
+    if check is _check_any:
+        def check_value(value, key, parent_path, stack):
+            if type(value) is dict or type(value) is list:
+                stack.append((value, (parent_path, key), _check_any))
+        return check_value
+
+    def check_value(value, key, parent_path, stack):
+        stack.append((value, (parent_path, key), check))
+    return check_value
+
+
+def _primitive_types(hint):
+    """
+    Returns:
+        tuple of (accepted types, description) when ``hint`` is a primitive json type or a union of such types,
+        otherwise ``None``
+    """
+    origin = typing.get_origin(hint) or hint
+    if origin in _PRIMITIVE_JSON_TYPES:
+        return ((int, float) if origin is float else (origin,)), _PRIMITIVE_JSON_TYPES[origin]
+    if origin in _UNION_TYPES:
+        members = [_primitive_types(member) for member in typing.get_args(hint)]
+        if all(member is not None for member in members):
+            return tuple(accepted_type for accepted_types, _ in members for accepted_type in accepted_types), \
+                ' or '.join(description for _, description in members)
+    return None
+
+
+def _compile_hint_check(hint, typed: bool):
+    """
+    Returns:
+        tuple of ``(accepts, check)``: ``accepts(value)`` is a shallow test used for choosing a member of a union,
+        and ``check(value, path, walk, stack)`` validates the value, pushing it's nested values on the stack
+    """
+    if hint is None or hint is typing.Any or hint is object or isinstance(hint, (str, typing.TypeVar, typing.ForwardRef)):
+        return (lambda value: True), _check_any
+
+    origin = typing.get_origin(hint) or hint
+    args = typing.get_args(hint)
+
+    primitive_types = _primitive_types(hint)
+    if primitive_types is not None:
+        accepted_types, description = primitive_types
+
+        def accepts(value):
+            return type(value) in accepted_types
+
+        def check(value, path, walk, stack):
+            if type(value) not in accepted_types:
+                _invalid(path, f'expected {description}, got {type(value).__name__}')
+        return accepts, check
+
+    if origin in _UNION_TYPES:
+        members = [_compile_hint_check(member, typed) for member in args]
+
+        def check(value, path, walk, stack):
+            for member_accepts, member_check in members:
+                if member_accepts(value):
+                    return member_check(value, path, walk, stack)
+            _invalid(path, f'expected {hint}, got {type(value).__name__}')
+        return (lambda value: any(member_accepts(value) for member_accepts, _ in members)), check
+
+    if origin in _LIST_TYPES or origin in _SEQUENCE_TYPES or origin in _ITEMS_TYPES:
+        check_element = _compile_value_check(_element_hint(args), typed)
+        # Lists are serialized as lists, other collections by their custom serializer as a tagged {'items': [...]}
+        items_dict = origin not in _LIST_TYPES
+
+        def accepts(value):
+            return type(value) is list or (items_dict and type(value) is dict and 'items' in value)
+
+        def check(value, path, walk, stack):
+            if type(value) is list:
+                for index, element in enumerate(value):
+                    check_element(element, index, path, stack)
+            elif items_dict and type(value) is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
+                _check_tagged(value, path, walk, stack, None)
+            elif items_dict and type(value) is dict and typed and type(value.get('items')) is list:
+                for index, element in enumerate(value['items']):
+                    check_element(element, index, (path, 'items'), stack)
+            else:
+                _invalid(path, f'expected {hint}, got {type(value).__name__}')
+        return accepts, check
+
+    if origin in _MAPPING_TYPES:
+        check_item = _compile_value_check(args[1] if len(args) == 2 else None, typed)
+
+        def accepts(value):
+            return type(value) is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME not in value
+
+        def check(value, path, walk, stack):
+            if not accepts(value):
+                _invalid(path, f'expected {hint}, got {_value_description(value)}')
+            for key, item in value.items():
+                check_item(item, key, path, stack)
+        return accepts, check
+
+    if not isinstance(origin, type):
+        return (lambda value: True), _check_any
+
+    custom_serializer = _JsonicSerializer.resolve(origin)
+    if custom_serializer is not None:
+        deserializer = _JsonicDeserializer.get(custom_serializer[0])
+
+        def accepts(value):
+            if type(value) is not dict:
+                return False
+            return typed or _JsonicDeserializer.get(value.get(SERIALIZED_TYPE_ATTRIBUTE_NAME)) is deserializer
+
+        def check(value, path, walk, stack):
+            if not accepts(value):
+                _invalid(path, f'expected {full_type_name(origin)}, got {_value_description(value)}')
+            _check_custom_value(value, path, walk, stack)
+        return accepts, check
+
+    def accepts(value):
+        return type(value) is dict and (typed or SERIALIZED_TYPE_ATTRIBUTE_NAME in value or
+                                        REFERENCE_ATTRIBUTE_NAME in value)
+
+    def check(value, path, walk, stack):
+        if type(value) is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
+            _check_tagged(value, path, walk, stack, origin)
+        elif type(value) is dict and REFERENCE_ATTRIBUTE_NAME in value:
+            pass  # back-reference to an instance validated where it first occurred
+        elif type(value) is dict and walk.typed:
+            _schemas.type_check(_type_data(origin))(value, path, walk, stack)
+        else:
+            _invalid(path, f'expected {full_type_name(origin)}, got {_value_description(value)}')
+    return accepts, check
+
+
+def _element_hint(args: tuple):
+    # Tuples of different element types, such as Tuple[int, str], accept any elements
+    return args[0] if len(args) == 1 or (len(args) == 2 and args[1] is Ellipsis) else None
+
+
+def _value_description(value) -> str:
+    if type(value) is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
+        return str(value[SERIALIZED_TYPE_ATTRIBUTE_NAME])
+    return type(value).__name__
+
+
+def _hint_json_schema(hint, typed: bool, private: bool, definitions: dict) -> dict:
+    if hint is None or hint is typing.Any or hint is object or isinstance(hint, (str, typing.TypeVar, typing.ForwardRef)):
+        return {}
+
+    origin = typing.get_origin(hint) or hint
+    args = typing.get_args(hint)
+
+    if origin in _PRIMITIVE_JSON_TYPES:
+        return {'type': _PRIMITIVE_JSON_TYPES[origin]}
+    if origin in _UNION_TYPES:
+        return {'anyOf': [_hint_json_schema(member, typed, private, definitions) for member in args]}
+    if origin in _LIST_TYPES or origin in _SEQUENCE_TYPES or origin in _ITEMS_TYPES:
+        array_schema = {'type': 'array', 'items': _hint_json_schema(_element_hint(args), typed, private, definitions)}
+        if origin in _LIST_TYPES or origin in _SEQUENCE_TYPES or typed:
+            return array_schema
+        return _tagged_object_schema(_JsonicSerializer.resolve(origin)[0], {'items': array_schema}, ['items'])
+    if origin in _MAPPING_TYPES:
+        value_hint = args[1] if len(args) == 2 else None
+        return {'type': 'object', 'additionalProperties': _hint_json_schema(value_hint, typed, private, definitions)}
+    if not isinstance(origin, type):
+        return {}
+
+    custom_serializer = _JsonicSerializer.resolve(origin)
+    if custom_serializer is not None:
+        return {'type': 'object'} if typed else _tagged_object_schema(custom_serializer[0], {}, [])
+
+    schema = type_schema(origin)
+    if schema.type_name not in definitions:
+        definitions[schema.type_name] = {}  # placeholder, for types referring to themselves
+        properties = {name: _hint_json_schema(attribute_type, typed, private, definitions)
+                      for name, attribute_type in schema.attribute_types.items() if private or not name.startswith('_')}
+        required = list(schema.required_attributes if private else schema.public_required_attributes)
+        properties.update((name, {}) for name in required if name not in properties)
+        if typed:
+            definition = {'type': 'object', 'properties': properties, 'required': required}
+        else:
+            definition = _tagged_object_schema(schema.type_name, properties, required)
+        definitions[schema.type_name] = definition
+    return {'$ref': f'#/$defs/{schema.type_name}'}
+
+
+def _tagged_object_schema(type_name: str, properties: dict, required: list) -> dict:
+    return {'type': 'object', 'properties': {**properties, SERIALIZED_TYPE_ATTRIBUTE_NAME: {'const': type_name}},
+            'required': required + [SERIALIZED_TYPE_ATTRIBUTE_NAME]}
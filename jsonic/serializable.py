@@ -1,12 +1,33 @@
+import collections.abc
+import dataclasses
+import functools
 import importlib
 import inspect
 import json
-from typing import List, Dict
+import types
+import typing
+from typing import List, Dict, Iterable
 
+from jsonic import binary, codegen, schema
+from jsonic.flyweight import FlyweightPool, get_flyweight_pool
+from jsonic.backends import get_json_backend
 from jsonic.decorators import _JsonicSerializer, _JsonicDeserializer
-from jsonic.util import full_type_name, is_private_attribute
+from jsonic.util import SERIALIZED_TYPE_ATTRIBUTE_NAME, REFERENCE_ID_ATTRIBUTE_NAME, REFERENCE_ATTRIBUTE_NAME, \
+    full_type_name, is_private_attribute, slot_descriptors
 
-SERIALIZED_TYPE_ATTRIBUTE_NAME = '_serialized_type'
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+# Base types json encodes their subclasses as
+_JSON_NATIVE_TYPES = (str, int, float, dict, list)
+_JSON_STRING_INPUT_TYPES = frozenset({str, bytes, bytearray, memoryview})
+
+# Registered jsonic types by class, so serialization doesn't need to resolve the type name of every instance
+_jsonic_types_by_class = {}
+# Type data of classes that were serialized or deserialized without being registered, built on first use
+_unregistered_types = {}
+
+TYPE_NAME_CACHE_SIZE = 1024
+# Modules unregistered types may be imported from when deserializing. None means any module may be imported
+_type_import_allow_list = None
 
 
 class JsonicTypeData:
@@ -17,10 +38,22 @@ class JsonicTypeData:
         cls (type): The jsonic type
         transient_attributes (List[str]): list of attribute names that won't be serialized and deserialized
         init_parameters_mapping: (Dict[str, str]): mapping from __init__ parameter name to it's matching instance attribute
+        bypass_init (bool): create deserialized instances without calling __init__
+        compiled (bool): replace the generic serialization and deserialization functions of the type with
+            functions generated for it's known attributes, on first use. The known attributes are the attributes
+            of the first serialized instance, or the defaults of ``compile_jsonic_type`` if an instance is
+            deserialized first
+        immutable (bool): instances are never modified after they are created, so when deserializing with ``intern``,
+            equal instances can be shared
+        serialization_plan (_SerializationPlan): per-class serialization data, resolved once and reused for every instance
+        deserialization_factory (_DeserializationFactory): per-class instance factory, resolved on first deserialization
+        attribute_type_hints (Dict[str, type]): type hints of instance attributes, taken from their matching
+            __init__ parameter annotations. Resolved on first typed deserialization
     """
 
     def __init__(self, cls: type, transient_attributes: List[str] = None,
-                 init_parameters_mapping: Dict[str, str] = None):
+                 init_parameters_mapping: Dict[str, str] = None, bypass_init: bool = False, compiled: bool = False,
+                 immutable: bool = False):
         if transient_attributes is None:
             transient_attributes = []
         if init_parameters_mapping is None:
@@ -28,6 +61,234 @@ class JsonicTypeData:
         self.cls = cls
         self.transient_attributes = transient_attributes
         self.init_parameters_mapping = init_parameters_mapping
+        self.bypass_init = bypass_init
+        self.compiled = compiled
+        self.immutable = immutable
+        self.serialization_plan = _SerializationPlan(cls, transient_attributes)
+        self._deserialization_factory = None
+        self._attribute_type_hints = None
+        if compiled:
+            # Compiling is deferred, as decorators such as dataclass may still replace __init__ after registration
+            self.serialization_plan.extract = self._compile_and_extract
+
+    @property
+    def deserialization_factory(self):
+        if self._deserialization_factory is None:
+            if self.compiled:
+                self.compile()
+            else:
+                self._deserialization_factory = self._build_deserialization_factory()
+        return self._deserialization_factory
+
+    def compile(self, attributes: Iterable[str] = None):
+        """
+        Replaces the ``extract`` function of the serialization plan and the ``create`` function of the
+        deserialization factory with functions generated for the known attributes of the type
+        """
+        plan = self.serialization_plan
+        factory = self._deserialization_factory or self._build_deserialization_factory()
+        if attributes is None:
+            attributes = codegen.known_attributes(self, factory)
+        attributes = tuple(attributes)
+        plan.extract = codegen.generate_extractor(plan, attributes)
+        factory.create = codegen.generate_create(factory, functools.partial(_DeserializationFactory.create, factory),
+                                                 plan.excluded_attributes, attributes)
+        self._deserialization_factory = factory
+        self.compiled = True
+
+    def _build_deserialization_factory(self):
+        return _DeserializationFactory(self.cls, self.init_parameters_mapping, self.bypass_init)
+
+    def _compile_and_extract(self, obj, serialize_private_attributes):
+        # The attributes of the first serialized instance are the known attributes of the type
+        self.compile(None if self.serialization_plan.slot_attributes else obj.__dict__.keys())
+        return self.serialization_plan.extract(obj, serialize_private_attributes)
+
+    @property
+    def attribute_type_hints(self):
+        if self._attribute_type_hints is None:
+            init_type_hints = typing.get_type_hints(self.cls.__init__)
+            init_type_hints.pop('return', None)
+            self._attribute_type_hints = {self.init_parameters_mapping.get(parameter_name, parameter_name): hint
+                                          for parameter_name, hint in init_type_hints.items()}
+        return self._attribute_type_hints
+
+
+class _SerializationPlan:
+    """
+    Serialization data of a specific type, resolved once when the type is registered
+
+    Attributes:
+        type_name (str): the type tag written to ``_serialized_type``
+        excluded_attributes (FrozenSet[str]): attributes that are never serialized
+        slot_attributes (Tuple[str]): attributes stored in ``__slots__`` of the type and it's base classes
+        extract: function of ``(obj, serialize_private_attributes)`` returning the serialized dict of an instance
+        generic_extract: the ``extract`` function built for the type, which a compiled ``extract`` falls back to
+    """
+
+    def __init__(self, cls: type, transient_attributes: List[str]):
+        self.type_name = full_type_name(cls)
+        self.excluded_attributes = frozenset(transient_attributes)
+        slots = slot_descriptors(cls)
+        self.slot_attributes = tuple(slots.keys())
+        self.extract = self.generic_extract = self._build_slots_extractor(slots) if slots else self._build_extractor()
+
+    def _build_slots_extractor(self, slots: dict):
+        type_name = self.type_name
+        excluded = self.excluded_attributes
+        getters = tuple((name, descriptor.__get__) for name, descriptor in slots.items() if name not in excluded)
+        public_getters = tuple((name, get) for name, get in getters if not is_private_attribute(name))
+
+        def extract(obj, serialize_private_attributes):
+            result = {}
+            for name, get in getters if serialize_private_attributes else public_getters:
+                try:
+                    result[name] = get(obj)
+                except AttributeError:  # slot was never set
+                    pass
+
+            # Subclasses of slotted classes can store other attributes in __dict__
+            instance_dict = getattr(obj, '__dict__', None)
+            if instance_dict:
+                result.update((key, value) for key, value in instance_dict.items() if key not in excluded and
+                              (serialize_private_attributes or not key.startswith('_')))
+            result[SERIALIZED_TYPE_ATTRIBUTE_NAME] = type_name
+            return result
+
+        return extract
+
+    def _build_extractor(self):
+        type_name = self.type_name
+        excluded = self.excluded_attributes
+
+        if excluded:
+            def extract(obj, serialize_private_attributes):
+                if serialize_private_attributes:
+                    result = {key: value for key, value in obj.__dict__.items() if key not in excluded}
+                else:
+                    result = {key: value for key, value in obj.__dict__.items()
+                              if key not in excluded and not key.startswith('_')}
+                result[SERIALIZED_TYPE_ATTRIBUTE_NAME] = type_name
+                return result
+        else:
+            def extract(obj, serialize_private_attributes):
+                if serialize_private_attributes:
+                    result = obj.__dict__.copy()
+                else:
+                    result = {key: value for key, value in obj.__dict__.items() if not key.startswith('_')}
+                result[SERIALIZED_TYPE_ATTRIBUTE_NAME] = type_name
+                return result
+
+        return extract
+
+
+class _DeserializationFactory:
+    """
+    Creates instances of a specific type from their deserialized attributes.
+    The __init__ signature, ``init_parameters_mapping`` and private parameters filtering are resolved once,
+    instead of for every deserialized instance
+
+    Attributes:
+        cls (type): the created type
+        type_name (str): the type tag of the created type
+        bypass_init (bool): create instances using ``cls.__new__`` and fill their attributes directly, without calling __init__
+    """
+
+    def __init__(self, cls: type, init_parameters_mapping: Dict[str, str], bypass_init: bool = False):
+        self.cls = cls
+        self.type_name = full_type_name(cls)
+        self.bypass_init = bypass_init
+
+        init_parameters = []
+        init_signature_parameters = {} if bypass_init else inspect.signature(cls.__init__).parameters
+        for parameter_name, parameter_data in init_signature_parameters.items():
+            if parameter_name == 'self':
+                continue
+            if parameter_data.kind == inspect.Parameter.VAR_KEYWORD or \
+                    parameter_data.kind == inspect.Parameter.VAR_POSITIONAL:
+                continue
+            # assuming parameter has same name as corresponding attribute, unless it is mapped
+            init_parameters.append((parameter_name, init_parameters_mapping.get(parameter_name, parameter_name)))
+
+        self._init_parameters = tuple(init_parameters)
+        self._public_init_parameters = tuple((parameter_name, attribute_name) for parameter_name, attribute_name
+                                             in init_parameters if not is_private_attribute(parameter_name))
+
+        # Slots and frozen dataclass fields are filled directly, without going through __setattr__
+        self._slot_setters = {name: descriptor.__set__ for name, descriptor in slot_descriptors(cls).items()}
+        self._fill_directly = bool(self._slot_setters) or \
+            (dataclasses.is_dataclass(cls) and cls.__dataclass_params__.frozen)
+
+    def create(self, deserialized_dict: dict, deserialize_private_attributes=False):
+        """
+        Creates an instance by passing the matching attributes to __init__,
+        and then setting all deserialized attributes on the created instance
+        """
+        if self.bypass_init:
+            return self._create_without_init(deserialized_dict)
+
+        created_instance = self.cls(**self._init_arguments(deserialized_dict, deserialize_private_attributes))
+        self._set_attributes(created_instance, deserialized_dict)
+        return created_instance
+
+    def allocate(self):
+        """
+        Returns:
+            an uninitialized instance, created using ``cls.__new__``. see ``initialize``
+        """
+        return self.cls.__new__(self.cls)
+
+    def initialize(self, instance, deserialized_dict: dict, deserialize_private_attributes=False):
+        """
+        Initializes an instance returned by ``allocate`` the same way ``create`` does, by calling __init__ on it.
+        Used for instances which are referenced before they are created, in cyclic graphs
+        """
+        if self.bypass_init:
+            self._fill_without_init(instance, deserialized_dict)
+            return
+
+        self.cls.__init__(instance, **self._init_arguments(deserialized_dict, deserialize_private_attributes))
+        self._set_attributes(instance, deserialized_dict)
+
+    def _init_arguments(self, deserialized_dict: dict, deserialize_private_attributes=False):
+        init_parameters = self._init_parameters if deserialize_private_attributes else self._public_init_parameters
+        try:
+            return {parameter_name: deserialized_dict[attribute_name]
+                    for parameter_name, attribute_name in init_parameters}
+        except KeyError:
+            parameter_name = next(parameter_name for parameter_name, attribute_name in init_parameters
+                                  if attribute_name not in deserialized_dict)
+            raise AttributeError(f'Missing attribute in given dict to match __init__ parameter: {parameter_name}.\n'
+                                 f'If relevant, consider registering type "{self.type_name}" using "register_jsonic_type" '
+                                 f'and providing required "init_parameters_mapping".') from None
+
+    def _set_attributes(self, instance, deserialized_dict: dict):
+        # After creating the instance, set all it's attributes to deserialized value
+        if self._fill_directly:
+            self._fill_attributes(instance, deserialized_dict)
+        else:
+            for attr_name, attr_value in deserialized_dict.items():
+                setattr(instance, attr_name, attr_value)
+
+    def _create_without_init(self, deserialized_dict: dict):
+        created_instance = self.cls.__new__(self.cls)
+        self._fill_without_init(created_instance, deserialized_dict)
+        return created_instance
+
+    def _fill_without_init(self, instance, deserialized_dict: dict):
+        if self._slot_setters:
+            self._fill_attributes(instance, deserialized_dict)
+        else:
+            instance.__dict__.update(deserialized_dict)
+
+    def _fill_attributes(self, instance, deserialized_dict: dict):
+        slot_setters = self._slot_setters
+        for attr_name, attr_value in deserialized_dict.items():
+            set_slot = slot_setters.get(attr_name)
+            if set_slot is not None:
+                set_slot(instance, attr_value)
+            else:
+                object.__setattr__(instance, attr_name, attr_value)
 
 
 class Serializable:
@@ -46,6 +307,17 @@ class Serializable:
     For __init__ parameter which has no mapping defined, it is assumed that the corresponding instance variable has
     the same name as the parameter.
 
+    Plain data classes whose __init__ only stores it's parameters can have class attribute:
+        bypass_init: bool = True
+    so deserialized instances are created without calling __init__, by setting all their attributes directly.
+
+    Classes that are serialized and deserialized in large numbers can have class attribute:
+        compiled: bool = True
+    so their serialization and deserialization functions are generated for their known attributes, see ``compile_jsonic_type``.
+
+    Classes whose instances are never modified after they are created can have class attribute:
+        immutable: bool = True
+    so equal instances are shared when deserializing with ``intern``.
 
     Note:
         If nested objects exists in such class, their type should be one of the following:
@@ -56,15 +328,20 @@ class Serializable:
     jsonic_types: Dict[str, JsonicTypeData] = {}
     transient_attributes: List[str] = None
     init_parameters_mapping: Dict[str, str] = None
+    bypass_init: bool = False
+    compiled: bool = False
+    immutable: bool = False
 
     def __init__(self) -> None:
         super().__init__()
 
     def __init_subclass__(cls) -> None:
-        register_jsonic_type(cls, cls.transient_attributes, cls.init_parameters_mapping)
+        register_jsonic_type(cls, cls.transient_attributes, cls.init_parameters_mapping, cls.bypass_init,
+                             cls.compiled, cls.immutable)
 
 
-def serialize(obj, serialize_private_attributes=False, string_output=False):
+def serialize(obj, serialize_private_attributes=False, string_output=False, typed=False, bytes_output=False,
+              json_backend: str = None, format: str = None, references: bool = False):
     """
      Serializes ``class instance`` / ``dict`` / ``list`` / ``other python type`` into ``dictionary`` / ``json string`` representing the input
 
@@ -72,50 +349,288 @@ def serialize(obj, serialize_private_attributes=False, string_output=False):
         obj: ``object`` / ``class instance`` / ``dict`` / ``list`` to be serializes
         serialize_private_attributes: should serialize private attributes (attributes which their name starts with ``_``)
         string_output: serialize into json string or ``dict`` / ``list
+        typed: leave out the ``_serialized_type`` tags. The output can only be deserialized by ``deserialize``
+            in typed mode, with the ``expected_type`` of the input
+        bytes_output: serialize into utf-8 encoded json ``bytes``, avoiding an extra encoding copy when writing to sockets
+        json_backend: name of the json backend used for string and bytes output, ``'orjson'`` / ``'ujson'`` / ``'json'``.
+            defaults to the backend set using ``set_json_backend``, which is the stdlib backend unless set
+        format: ``'json'`` to serialize into json string, same as ``string_output``,
+            or ``'binary'`` to serialize into compact binary ``bytes``, in which dict keys and type tags are interned
+        references: track the identity of class instances, so an instance referenced more than once is serialized
+            on it's first occurrence with a ``_jsonic_id``, and replaced by a ``{"_jsonic_ref": id}`` back-reference
+            after that. Supports cyclic object graphs. The output should be deserialized with ``references=True``
 
     Returns:
-        ``dictionary`` / ``json string`` representing the input
+        ``dictionary`` / ``json string`` / ``bytes`` representing the input
+
+    Raises:
+        TypeError: When references mode is combined with typed mode
 
     Note:
-        Only class instances of classes extending ``Serializable`` or registered using ``register_jsonic_type`` can be serialized
+        Only class instances of classes extending ``Serializable`` or registered using ``register_jsonic_type`` can be serialized.
+        In references mode only class instances are tracked, values serialized by custom serializers, dicts
+        and lists are serialized on every occurrence. In cyclic graphs, __init__ of an instance may receive
+        an instance of the cycle that is not initialized yet
     """
-    json_str = json.dumps(obj, default=lambda o: _serialize_object(o, serialize_private_attributes))
-    return json_str if string_output else json.loads(json_str)
-
-
-def deserialize(obj, deserialize_private_attributes: bool = False, string_input: bool = False, expected_type: type = None):
+    _validate_format(format)
+    if references and typed:
+        raise TypeError('references mode can not be combined with typed mode')
+    serialized = _serialize_value(obj, serialize_private_attributes, include_type_tags=not typed,
+                                  references={} if references else None)
+    if format == 'binary':
+        return binary.encode(serialized)
+    if bytes_output:
+        return get_json_backend(json_backend).dumps_bytes(serialized)
+    if string_output or format == 'json':
+        return get_json_backend(json_backend).dumps(serialized)
+    return serialized
+
+
+def deserialize(obj, deserialize_private_attributes: bool = False, string_input: bool = False, expected_type: type = None,
+                typed: bool = False, json_backend: str = None, format: str = None, references: bool = False,
+                intern=False, validate: bool = False):
     """
     Deserializes dictionary/json string representing dictionary, that was returned by ``serialize`` function call on an object
 
     Args:
         obj: dictionary/json string representing dictionary, that is a result of ``serialize`` function on an object
         deserialize_private_attributes (bool): should deserialize private attributes (attributes which their name starts with ``_``)
-        string_input (bool): is the input of type ``json string``, or ``dict``
+        string_input (bool): is the input a ``json string`` (``str`` / utf-8 ``bytes`` / ``bytearray`` / ``memoryview``), or ``dict``
         expected_type: the deserialized result expected type
+        typed (bool): deserialize input serialized in typed mode, which has no ``_serialized_type`` tags.
+            Nested objects are rebuilt according to the type hints of ``expected_type``, which may also be
+            a generic alias such as ``List[Product]``, and of the ``__init__`` parameters of nested classes
+        json_backend: name of the json backend used for string input, ``'orjson'`` / ``'ujson'`` / ``'json'``.
+            defaults to the backend set using ``set_json_backend``, which is the stdlib backend unless set
+        format: ``'json'`` for json string input, same as ``string_input``, or ``'binary'`` for input serialized
+            using ``format='binary'``. binary input may be ``bytes`` / ``bytearray`` / ``memoryview``, and is read in place
+        references (bool): deserialize input serialized in references mode, rebuilding instances referenced
+            more than once as a single shared instance, and cyclic object graphs
+        intern: ``True`` or a ``FlyweightPool``, to reduce the memory held by the deserialized objects: dict keys are
+            interned, and equal values of immutable types (such as ``str``, ``int``, ``datetime`` and jsonic types
+            registered as ``immutable``) are shared, using a bounded pool. ``True`` uses a pool shared by all calls
+        validate (bool): validate the input against the schemas of the types it contains before deserializing it,
+            so invalid input is rejected before any instance is created. see ``validate_serialized``
     Returns:
         object / class instance / dict / list, depending on the serialized input
 
     Raises:
         AttributeError: When the serialized type is different from the expected type
+        ValueError: When a back-reference in references mode refers to an unknown id, or when validating and the
+            input does not match the schema of it's types
+    """
+    _validate_format(format)
+    if format == 'binary':
+        return deserialize(binary.decode(obj), expected_type=expected_type,
+                           deserialize_private_attributes=deserialize_private_attributes, typed=typed,
+                           references=references, intern=intern, validate=validate)
+    if string_input or format == 'json':
+        if type(obj) not in _JSON_STRING_INPUT_TYPES:
+            raise TypeError(f'deserializing string, but input was not of type str or bytes. given input: {obj}')
+        return deserialize(get_json_backend(json_backend).loads(obj), expected_type=expected_type,
+                           deserialize_private_attributes=deserialize_private_attributes, typed=typed,
+                           references=references, intern=intern, validate=validate)
+
+    if validate:
+        schema.validate_serialized(obj, expected_type, deserialize_private_attributes, typed)
+    pool = get_flyweight_pool(intern)
+    if references or pool is not None:
+        if typed:
+            raise TypeError('references mode and interning can not be combined with typed mode')
+        return _deserialize_iterative(obj, deserialize_private_attributes, expected_type,
+                                      _ReferenceTable() if references else None, pool)
+    if typed:
+        if expected_type is None:
+            raise TypeError('deserializing in typed mode requires the expected_type of the input')
+        return _deserialize_typed(obj, expected_type, deserialize_private_attributes=deserialize_private_attributes)
+
+    return _deserialize_iterative(obj, deserialize_private_attributes, expected_type)
+
+
+def _deserialize_recursive(obj, deserialize_private_attributes=False, expected_type: type = None):
+    """
+    Recursive deserialization of a ``jsonic representation``, the reference implementation of ``_deserialize_iterative``
     """
-    if string_input:
-        if type(obj) != str:
-            raise TypeError(f'deserializing string, but input was not of type str. given input: {obj}')
-        return deserialize(json.loads(obj), expected_type=expected_type, deserialize_private_attributes=deserialize_private_attributes)
-
     if type(obj) == list:
         return _deserialize_list(obj, expected_type=expected_type, deserialize_private_attributes=deserialize_private_attributes)
     elif type(obj) == dict:
-        if SERIALIZED_TYPE_ATTRIBUTE_NAME in obj and obj[SERIALIZED_TYPE_ATTRIBUTE_NAME] in _JsonicDeserializer.deserializers:
+        if SERIALIZED_TYPE_ATTRIBUTE_NAME in obj and _JsonicDeserializer.get(obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]):
             # There is custom deserializer for given objects serialized type, so use it
-            return _deserialize_with_custom_deserializer(obj, expected_type=expected_type)
+            return _deserialize_with_custom_deserializer(obj, expected_type, deserialize_private_attributes)
         return _deserialize_dict(obj, expected_type=expected_type, deserialize_private_attributes=deserialize_private_attributes)
     else:
         return obj
 
 
+# Kinds of containers deserialized by _deserialize_iterative
+_LIST_CONTAINER = 0
+_GENERIC_DICT_CONTAINER = 1
+_JSONIC_DICT_CONTAINER = 2
+
+
+def _deserialize_iterative(obj, deserialize_private_attributes=False, expected_type: type = None,
+                           references: '_ReferenceTable' = None, pool: FlyweightPool = None):
+    """
+    Deserializes a ``jsonic representation`` using an explicit stack instead of recursion, so any nesting depth
+    is supported, and every container is visited once. Returns the same result as ``_deserialize_recursive``
+
+    Args:
+        references (_ReferenceTable): instances by their reference id, for input serialized in references mode
+        pool (FlyweightPool): pool of immutable values shared by the deserialized objects, when interning
+    """
+    root_type = type(obj)
+    if root_type == list:
+        if expected_type and expected_type != list:
+            raise AttributeError(f'Deserializing list, which is not the expected type: {expected_type}')
+    elif root_type == dict:
+        if SERIALIZED_TYPE_ATTRIBUTE_NAME in obj:
+            type_name = obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]
+            if _JsonicDeserializer.get(type_name):
+                return _deserialize_with_custom_deserializer(obj, expected_type, deserialize_private_attributes,
+                                                             references, pool)
+            _type_data_by_name(type_name)  # unknown types are reported before a mismatching expected type
+            if expected_type and full_type_name(expected_type) != type_name:
+                raise AttributeError(f'Deserializing type {type_name}, which is not the expected type: {expected_type}')
+        elif expected_type and expected_type != dict:
+            raise AttributeError(f'Deserializing type dict, which is not the expected type: {expected_type}')
+    else:
+        return obj
+
+    root = [None]
+    # Every frame holds the container kind, an iterator over it's items, the deserialized items, the type data
+    # and reference id of jsonic dicts, and the container and key the deserialized result is stored at
+    stack = [_deserialization_frame(obj, root, 0, references)]
+    push = stack.append
+    get_custom_deserializer = _JsonicDeserializer.get
+    while stack:
+        kind, items, result, type_data, reference_id, parent, parent_key = stack[-1]
+        if kind == _LIST_CONTAINER:
+            append = result.append
+            for value in items:
+                value_type = type(value)
+                if value_type is list or value_type is dict:
+                    key = len(result)
+                    break
+                append(value)
+            else:
+                value_type = None
+        elif kind == _JSONIC_DICT_CONTAINER:
+            for key, value in items:
+                if key == SERIALIZED_TYPE_ATTRIBUTE_NAME or (not deserialize_private_attributes and key.startswith('_')):
+                    continue
+                value_type = type(value)
+                if value_type is list or (value_type is dict and (SERIALIZED_TYPE_ATTRIBUTE_NAME in value or (
+                        references is not None and REFERENCE_ATTRIBUTE_NAME in value))):
+                    break  # plain dict attributes are kept as is
+                result[key] = value
+            else:
+                value_type = None
+        else:
+            for key, value in items:
+                value_type = type(value)
+                if value_type is list or value_type is dict:
+                    break
+                result[key] = value
+            else:
+                value_type = None
+
+        if value_type is None:  # all items were deserialized
+            stack.pop()
+            if pool is not None:
+                result = pool.intern_items(result)
+            if kind == _JSONIC_DICT_CONTAINER:
+                result = _create_instance(type_data, result, deserialize_private_attributes, reference_id, references,
+                                          pool)
+            parent[parent_key] = result
+            continue
+
+        if kind == _LIST_CONTAINER:
+            result.append(None)  # placeholder, until the nested container is deserialized
+        else:
+            result[key] = None  # keeps the key order, until the nested container is deserialized
+
+        custom_deserializer = get_custom_deserializer(value[SERIALIZED_TYPE_ATTRIBUTE_NAME]) \
+            if value_type is dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value else None
+        if custom_deserializer is not None:
+            result[key] = _deserialize_custom_value(custom_deserializer, value, deserialize_private_attributes,
+                                                    references, pool)
+        elif references is not None and value_type is dict and REFERENCE_ATTRIBUTE_NAME in value:
+            result[key] = references.resolve(value[REFERENCE_ATTRIBUTE_NAME])
+        else:
+            push(_deserialization_frame(value, result, key, references))
+
+    return root[0]
+
+
+def _create_instance(type_data: JsonicTypeData, deserialized_dict: dict, deserialize_private_attributes=False,
+                     reference_id=None, references: '_ReferenceTable' = None, pool: FlyweightPool = None):
+    """
+    Creates the instance of a jsonic dict from it's deserialized attributes, once all of them were deserialized
+    """
+    if reference_id is not None:
+        return references.create(reference_id, type_data, deserialized_dict, deserialize_private_attributes)
+    if pool is not None and type_data.immutable:
+        return pool.intern_instance(type_data, deserialized_dict, deserialize_private_attributes)
+    return type_data.deserialization_factory.create(deserialized_dict, deserialize_private_attributes)
+
+
+def _deserialization_frame(container, parent, parent_key, references: '_ReferenceTable' = None) -> tuple:
+    if type(container) is list:
+        return _LIST_CONTAINER, iter(container), [], None, None, parent, parent_key
+    if SERIALIZED_TYPE_ATTRIBUTE_NAME in container:
+        type_data = _type_data_by_name(container[SERIALIZED_TYPE_ATTRIBUTE_NAME])
+        reference_id = None
+        if references is not None:
+            reference_id = container.get(REFERENCE_ID_ATTRIBUTE_NAME)
+            if reference_id is not None:
+                references.start(reference_id, type_data)
+        return _JSONIC_DICT_CONTAINER, iter(container.items()), {}, type_data, reference_id, parent, parent_key
+    return _GENERIC_DICT_CONTAINER, iter(container.items()), {}, None, None, parent, parent_key
+
+
+class _ReferenceTable:
+    """
+    Instances deserialized in references mode, by their reference id.
+    An instance which is referenced while it's attributes are still being deserialized, in a cyclic graph,
+    is allocated without calling __init__, and initialized once it's attributes are deserialized
+    """
+
+    def __init__(self):
+        self.instances = {}
+        self._in_progress = {}
+
+    def start(self, reference_id, type_data: JsonicTypeData):
+        self._in_progress[reference_id] = type_data
+
+    def resolve(self, reference_id):
+        instance = self.instances.get(reference_id)
+        if instance is None:
+            type_data = self._in_progress.get(reference_id)
+            if type_data is None:
+                raise ValueError(f'Could not resolve back-reference to unknown id: {reference_id}')
+            instance = self.instances[reference_id] = type_data.deserialization_factory.allocate()
+        return instance
+
+    def create(self, reference_id, type_data: JsonicTypeData, deserialized_dict: dict, deserialize_private_attributes):
+        del self._in_progress[reference_id]
+        deserialized_dict.pop(REFERENCE_ID_ATTRIBUTE_NAME, None)
+        factory = type_data.deserialization_factory
+        instance = self.instances.get(reference_id)
+        if instance is None:
+            instance = self.instances[reference_id] = factory.create(deserialized_dict, deserialize_private_attributes)
+        else:
+            factory.initialize(instance, deserialized_dict, deserialize_private_attributes)
+        return instance
+
+
+def _validate_format(format: str):
+    if format is not None and format not in ('json', 'binary'):
+        raise ValueError(f'Unknown format: {format}. supported formats: json, binary')
+
+
 def register_jsonic_type(cls, transient_attributes: List[str] = None,
-                         init_parameters_mapping: Dict[str, str] = None):
+                         init_parameters_mapping: Dict[str, str] = None, bypass_init: bool = False,
+                         compiled: bool = False, immutable: bool = False):
     """
     Registers jsonic type with it's metadata.
     Can be used to register classes that doesn't extend ``Serializable``, from example classes from external source.
@@ -126,65 +641,217 @@ def register_jsonic_type(cls, transient_attributes: List[str] = None,
         cls (type):
         transient_attributes (List[str]): list of attribute names that won't be serialized and deserialized
         init_parameters_mapping: (Dict[str, str]): mapping from __init__ parameter name to it's matching instance attribute
+        bypass_init (bool): create deserialized instances using ``cls.__new__`` and set all their attributes directly,
+            without calling __init__. Suitable for data classes whose __init__ has no side effects
+        compiled (bool): generate the serialization and deserialization functions of the type on first use,
+            for the attributes of the first serialized instance. see ``compile_jsonic_type``
+        immutable (bool): instances are never modified after they are created, so equal instances are shared
+            when deserializing with ``intern``
     """
     class_name = full_type_name(cls)
-    Serializable.jsonic_types[class_name] = JsonicTypeData(cls, transient_attributes,
-                                                           init_parameters_mapping)
+    type_data = JsonicTypeData(cls, transient_attributes, init_parameters_mapping, bypass_init, compiled, immutable)
+    Serializable.jsonic_types[class_name] = type_data
+    _jsonic_types_by_class[cls] = type_data
+    # Unregistered subclasses inherit the registered type data of their base classes
+    _unregistered_types.clear()
+
+
+def compile_jsonic_type(cls, attributes: Iterable[str] = None):
+    """
+    Generates serialization and deserialization functions for a registered jsonic type, which read and write
+    it's known attributes directly instead of iterating and filtering them for every instance
+
+    Args:
+        cls (type): registered type, or type extending ``Serializable``
+        attributes (Iterable[str]): names of the attributes instances of the type hold.
+            defaults to the attributes matching the __init__ parameters, or the dataclass fields, and the transient attributes
+
+    Raises:
+        TypeError: When the type is not registered
+
+    Note:
+        Instances holding other attributes than ``attributes`` are still serialized and deserialized, by the generic functions
+    """
+    type_data = _jsonic_types_by_class.get(cls)
+    if type_data is None:
+        raise TypeError(f'Could not compile type {full_type_name(cls)}, which is not registered')
+    type_data.compile(attributes)
+
+
+def set_type_import_allow_list(allowed_modules: Iterable[str] = None):
+    """
+    Restricts the modules unregistered types may be imported from when deserializing.
+    Registered types and types with custom deserializers are always allowed.
+
+    Args:
+        allowed_modules (Iterable[str]): module names, each allowing the module itself and all of it's sub-modules.
+            ``None`` allows importing from any module, which is the default
+
+    Note:
+        Deserializing untrusted input with no allow list may import arbitrary modules
+    """
+    global _type_import_allow_list
+    _type_import_allow_list = None if allowed_modules is None else tuple(allowed_modules)
+    _import_type_by_name.cache_clear()
+
+
+def _serialize_value(obj, serialize_private_attributes=False, include_type_tags=True, references: dict = None,
+                     ancestors: set = None):
+    """
+    Builds the plain ``dict`` / ``list`` tree representing ``obj`` straight from the live objects.
+    json native values are represented the same way encoding with ``json.dumps`` and decoding back with ``json.loads`` does
+
+    Args:
+        references (dict): in references mode, the reference id and instance of every serialized instance, by it's ``id``
+        ancestors (set): ``id`` of the containers and instances on the path to ``obj``, for detecting cycles
+
+    Raises:
+        ValueError: When the object graph is cyclic, and not serialized in references mode
+    """
+    typ = type(obj)
+    if typ in _JSON_PRIMITIVE_TYPES:
+        return obj
+    if ancestors is None:
+        ancestors = set()
+    marker = id(obj)
+    if typ is dict:
+        if marker in ancestors:
+            raise ValueError('Circular reference detected')
+        ancestors.add(marker)
+        # Same as _serialize_dict_items, inlined as plain dicts are the most common containers
+        serialized = {(key if type(key) is str else _serialize_dict_key(key)):
+                      (value if type(value) in _JSON_PRIMITIVE_TYPES
+                       else _serialize_value(value, serialize_private_attributes, include_type_tags, references,
+                                             ancestors))
+                      for key, value in obj.items()}
+        ancestors.discard(marker)
+        return serialized
+    if typ is list:
+        if marker in ancestors:
+            raise ValueError('Circular reference detected')
+        ancestors.add(marker)
+        serialized = [element if type(element) in _JSON_PRIMITIVE_TYPES
+                      else _serialize_value(element, serialize_private_attributes, include_type_tags, references,
+                                            ancestors)
+                      for element in obj]
+        ancestors.discard(marker)
+        return serialized
+
+    # Subclasses of json native types are encoded as their base type, same as json.dumps does,
+    # unless there is a custom serializer for them
+    custom_serializer = _JsonicSerializer.resolve(typ)
+    if custom_serializer is None and isinstance(obj, _JSON_NATIVE_TYPES):
+        if isinstance(obj, str):
+            return str.__str__(obj)
+        if isinstance(obj, int):
+            return int.__int__(obj)
+        if isinstance(obj, float):
+            return float.__float__(obj)
+        if marker in ancestors:
+            raise ValueError('Circular reference detected')
+        ancestors.add(marker)
+        if isinstance(obj, dict):
+            serialized = _serialize_dict_items(obj, serialize_private_attributes, include_type_tags, references,
+                                               ancestors)
+        else:
+            serialized = [_serialize_value(element, serialize_private_attributes, include_type_tags, references,
+                                           ancestors)
+                          for element in obj]
+        ancestors.discard(marker)
+        return serialized
+
+    reference_id = None
+    if references is not None and custom_serializer is None:
+        reference = references.get(marker)
+        if reference is not None:
+            return {REFERENCE_ATTRIBUTE_NAME: reference[0]}
+        reference_id = len(references) + 1
+        # The instance is kept alive until serialization ends, so it's id is not reused
+        references[marker] = (reference_id, obj)
+
+    if marker in ancestors:
+        raise ValueError('Circular reference detected')
+    ancestors.add(marker)
+    serialized = _serialize_object(obj, serialize_private_attributes)
+    if not include_type_tags:
+        del serialized[SERIALIZED_TYPE_ATTRIBUTE_NAME]
+    if reference_id is not None:
+        serialized[REFERENCE_ID_ATTRIBUTE_NAME] = reference_id
+    if custom_serializer is not None:
+        serialized = _serialize_dict_items(serialized, serialize_private_attributes, include_type_tags, references,
+                                           ancestors)
+    else:
+        # Extracted attributes are a new dict keyed by attribute names, so only their nested values are replaced
+        for key, value in serialized.items():
+            if type(value) not in _JSON_PRIMITIVE_TYPES:
+                serialized[key] = _serialize_value(value, serialize_private_attributes, include_type_tags, references,
+                                                   ancestors)
+    ancestors.discard(marker)
+    return serialized
+
+
+def _serialize_dict_items(obj: dict, serialize_private_attributes=False, include_type_tags=True, references: dict = None,
+                          ancestors: set = None):
+    # Primitive keys and values are checked inline, as they are the vast majority of the items
+    return {(key if type(key) is str else _serialize_dict_key(key)):
+            (value if type(value) in _JSON_PRIMITIVE_TYPES
+             else _serialize_value(value, serialize_private_attributes, include_type_tags, references, ancestors))
+            for key, value in obj.items()}
+
+
+def _serialize_dict_key(key):
+    if type(key) is str:
+        return key
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)  # json converts these keys to their json literal
+
+    raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
 
 
 def _serialize_object(obj, serialize_private_attributes=False):
     typ = type(obj)
-    if typ in _JsonicSerializer.serializers:
-        value = _JsonicSerializer.serializers[typ](obj)
-        value[SERIALIZED_TYPE_ATTRIBUTE_NAME] = typ.__name__
-        return value
-
-    elif hasattr(obj, '__dict__'):
-        type_name = full_type_name(typ)
-        is_jsonic_type = type_name in Serializable.jsonic_types
-        type_data = Serializable.jsonic_types[type_name] if is_jsonic_type else None
-        ignored_attributes = {}
-
-        if not serialize_private_attributes:  # Do not serialize private attributes
-            to_remove = [key for key in obj.__dict__.keys() if key.startswith('_')]
-            for key in to_remove:
-                ignored_attributes[key] = getattr(obj, key)
-                delattr(obj, key)
-
-        if type_data and type_data.transient_attributes:  # Do not serialize transient attributes
-            to_remove = [key for key in obj.__dict__.keys() if key in type_data.transient_attributes]
-            for key in to_remove:
-                ignored_attributes[key] = getattr(obj, key)
-                delattr(obj, key)
-
-        setattr(obj, SERIALIZED_TYPE_ATTRIBUTE_NAME, type_name)
-        result = {}
-        for key, value in obj.__dict__.items():
-            result[key] = value
-        for key, val in ignored_attributes.items():
-            setattr(obj, key, val)
-
-        return result
+    custom_serializer = _JsonicSerializer.resolve(typ)
+    if custom_serializer is not None:
+        type_name, serializer = custom_serializer
+        return {**serializer(obj), SERIALIZED_TYPE_ATTRIBUTE_NAME: type_name}
+
+    if typ in _jsonic_types_by_class or hasattr(obj, '__dict__') or hasattr(typ, '__slots__'):
+        return _type_data_by_class(typ).serialization_plan.extract(obj, serialize_private_attributes)
 
     raise TypeError(f'Could not find serializer for type: {typ}')
 
 
-def _deserialize_with_custom_deserializer(obj, expected_type: type = None):
+def _deserialize_with_custom_deserializer(obj, expected_type: type = None, deserialize_private_attributes=False,
+                                          references: '_ReferenceTable' = None, pool: FlyweightPool = None):
     if SERIALIZED_TYPE_ATTRIBUTE_NAME in obj:
         type_name = obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]
-        if expected_type and full_type_name(expected_type) != type_name:
+        if expected_type and full_type_name(expected_type) != type_name and expected_type.__name__ != type_name:
             raise AttributeError(f'Deserializing type {type_name}, which is not the expected type: {expected_type}')
-        if type_name in _JsonicDeserializer.deserializers:
-            del obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]
-            result = _JsonicDeserializer.deserializers[type_name](obj)
-            obj[SERIALIZED_TYPE_ATTRIBUTE_NAME] = type_name
-            return result
+        deserializer = _JsonicDeserializer.get(type_name)
+        if deserializer is not None:
+            return _deserialize_custom_value(deserializer, obj, deserialize_private_attributes, references, pool)
 
         raise TypeError(f'Could not find custom deserializer for object with type tag: {type_name}')
 
     raise TypeError(f'Missing attribute _serialized_type for object: {obj}')
 
 
+def _deserialize_custom_value(deserializer, obj: dict, deserialize_private_attributes=False,
+                              references: '_ReferenceTable' = None, pool: FlyweightPool = None):
+    """
+    Calls a custom deserializer, passing deserializers declaring a ``deserialize_value`` parameter a function
+    deserializing their nested values with the same options, reference table and pool
+    """
+    # Pass a copy without the type tag, so the input is never modified
+    serialized_value = {key: value for key, value in obj.items() if key != SERIALIZED_TYPE_ATTRIBUTE_NAME}
+    if deserializer not in _JsonicDeserializer.nested_value_deserializers:
+        return deserializer(serialized_value)
+    return deserializer(serialized_value, deserialize_value=lambda value: _deserialize_iterative(
+        value, deserialize_private_attributes, None, references, pool))
+
+
 def _deserialize_dict(obj: dict, deserialize_private_attributes=False, expected_type: type = None):
     if SERIALIZED_TYPE_ATTRIBUTE_NAME in obj:
         return _deserialize_jsonic_type_dict(obj, deserialize_private_attributes=deserialize_private_attributes,
@@ -201,7 +868,7 @@ def _deserialize_generic_dict(obj: dict, deserialize_private_attributes: bool =
 
     for key, value in obj.items():
         if (type(value) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value) or type(value) == list:
-            deserialized_dict[key] = deserialize(value, deserialize_private_attributes=deserialize_private_attributes)
+            deserialized_dict[key] = _deserialize_recursive(value, deserialize_private_attributes)
         elif type(value) == dict:  # value is is a dict but not jsonic type dict
             deserialized_dict[key] = _deserialize_generic_dict(value, deserialize_private_attributes=deserialize_private_attributes)
         else:
@@ -210,15 +877,70 @@ def _deserialize_generic_dict(obj: dict, deserialize_private_attributes: bool =
     return deserialized_dict
 
 
+def _type_data_by_name(type_name: str) -> JsonicTypeData:
+    type_data = Serializable.jsonic_types.get(type_name)
+    if type_data is None:
+        type_data = _unregistered_type_data(get_type_by_name(type_name))
+    return type_data
+
+
+def _type_data_by_class(cls: type) -> JsonicTypeData:
+    type_data = _jsonic_types_by_class.get(cls)
+    if type_data is None:
+        type_data = _unregistered_type_data(cls)
+    return type_data
+
+
+def _unregistered_type_data(cls: type) -> JsonicTypeData:
+    type_data = _unregistered_types.get(cls)
+    if type_data is None:
+        registered_base = next((_jsonic_types_by_class[base] for base in cls.__mro__[1:] if base in _jsonic_types_by_class),
+                               None)
+        if registered_base is None:
+            type_data = JsonicTypeData(cls)
+        else:
+            type_data = JsonicTypeData(cls, registered_base.transient_attributes,
+                                       registered_base.init_parameters_mapping, registered_base.bypass_init,
+                                       registered_base.compiled, registered_base.immutable)
+        _unregistered_types[cls] = type_data
+    return type_data
+
+
 def get_type_by_name(type_name: str):
     if type_name in Serializable.jsonic_types:
         return Serializable.jsonic_types[type_name].cls
 
+    return _import_type_by_name(type_name)
+
+
+def type_name_cache_info():
+    """
+    Returns:
+        ``functools`` cache info (hits, misses, maxsize, currsize) of the cache resolving
+        type names of unregistered types to their class
+    """
+    return _import_type_by_name.cache_info()
+
+
+@functools.lru_cache(maxsize=TYPE_NAME_CACHE_SIZE)
+def _import_type_by_name(type_name: str):
     last_index = type_name.rindex('.')
     module_name = type_name[0:last_index]
     cls_name = type_name[last_index + 1:]
+
+    if _type_import_allow_list is not None and not _is_allowed_module(module_name):
+        raise TypeError(f'Could not deserialize type {type_name}: it is not registered, '
+                        f'and module {module_name} is not in the type import allow list')
+
     module = importlib.import_module(module_name)
-    return getattr(module, cls_name)
+    cls = getattr(module, cls_name)
+    if not isinstance(cls, type):
+        raise TypeError(f'Could not deserialize type {type_name}: {cls_name} is not a class')
+    return cls
+
+
+def _is_allowed_module(module_name: str):
+    return any(module_name == allowed or module_name.startswith(allowed + '.') for allowed in _type_import_allow_list)
 
 
 def _deserialize_jsonic_type_dict(obj: dict, deserialize_private_attributes=False, expected_type: type = None):
@@ -226,8 +948,7 @@ def _deserialize_jsonic_type_dict(obj: dict, deserialize_private_attributes=Fals
         raise TypeError(f'Deserializing dict of jsonic type but could not find {SERIALIZED_TYPE_ATTRIBUTE_NAME} attribute')
 
     type_name = obj[SERIALIZED_TYPE_ATTRIBUTE_NAME]
-    is_jsonic_type = type_name in Serializable.jsonic_types
-    cls = get_type_by_name(type_name)
+    type_data = _type_data_by_name(type_name)
 
     if expected_type and full_type_name(expected_type) != type_name:
         raise AttributeError(f'Deserializing type {type_name}, which is not the expected type: {expected_type}')
@@ -240,44 +961,80 @@ def _deserialize_jsonic_type_dict(obj: dict, deserialize_private_attributes=Fals
         elif not deserialize_private_attributes and key.startswith('_'):
             pass
         elif type(value) == list:
-            deserialized_dict[key] = deserialize(value, deserialize_private_attributes=deserialize_private_attributes)
+            deserialized_dict[key] = _deserialize_recursive(value, deserialize_private_attributes)
         elif type(value) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in value:
-            deserialized_dict[key] = deserialize(value, deserialize_private_attributes=deserialize_private_attributes)
+            deserialized_dict[key] = _deserialize_recursive(value, deserialize_private_attributes)
         else:
             deserialized_dict[key] = value
 
-    init_dict = {}
+    return type_data.deserialization_factory.create(deserialized_dict, deserialize_private_attributes)
+
 
-    sign = inspect.signature(cls.__init__)
+def _deserialize_typed(obj, expected_type, deserialize_private_attributes=False):
+    if obj is None or expected_type is None or expected_type is typing.Any:
+        return deserialize(obj, deserialize_private_attributes=deserialize_private_attributes)
 
-    init_parameters_mapping = Serializable.jsonic_types[type_name].init_parameters_mapping if is_jsonic_type else {}
+    origin = typing.get_origin(expected_type) or expected_type
+    args = typing.get_args(expected_type)
 
-    for parameter_name, parameter_data in sign.parameters.items():
-        if not deserialize_private_attributes and is_private_attribute(parameter_name):
+    if origin is typing.Union or origin is getattr(types, 'UnionType', typing.Union):
+        return _deserialize_typed_union(obj, args, deserialize_private_attributes=deserialize_private_attributes)
+    if type(obj) == dict and SERIALIZED_TYPE_ATTRIBUTE_NAME in obj:  # tagged input is deserialized by it's tag
+        return deserialize(obj, deserialize_private_attributes=deserialize_private_attributes)
+    if origin in _JSON_PRIMITIVE_TYPES:
+        return obj
+
+    if origin in (set, frozenset, tuple) and type(obj) == dict:  # serialized by the default set / tuple serializers
+        obj = obj['items']
+    if origin in (list, set, frozenset, collections.abc.Sequence, collections.abc.Iterable, collections.abc.Set):
+        element_type = args[0] if args else None
+        elements = [_deserialize_typed(element, element_type, deserialize_private_attributes) for element in obj]
+        return origin(elements) if origin in (set, frozenset) else elements
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_deserialize_typed(element, args[0], deserialize_private_attributes) for element in obj)
+        element_types = args if args else [None] * len(obj)
+        return tuple(_deserialize_typed(element, element_type, deserialize_private_attributes)
+                     for element, element_type in zip(obj, element_types))
+    if origin in (dict, collections.abc.Mapping):
+        value_type = args[1] if args else None
+        return {key: _deserialize_typed(value, value_type, deserialize_private_attributes) for key, value in obj.items()}
+
+    custom_serializer = _JsonicSerializer.resolve(origin) if isinstance(origin, type) else None
+    custom_deserializer = _JsonicDeserializer.get(custom_serializer[0]) if custom_serializer is not None else None
+    if custom_deserializer is not None:
+        return _deserialize_custom_value(custom_deserializer, obj, deserialize_private_attributes)
+
+    return _deserialize_typed_jsonic_type_dict(obj, origin, deserialize_private_attributes)
+
+
+def _deserialize_typed_union(obj, union_types, deserialize_private_attributes=False):
+    # The first union member type the input can be deserialized as is used
+    for union_type in union_types:
+        if union_type is type(None):
             continue
-        if parameter_name == 'self':
-            pass
-        elif parameter_data.kind == inspect.Parameter.VAR_KEYWORD or \
-                parameter_data.kind == inspect.Parameter.VAR_POSITIONAL:
-            pass
-        elif parameter_name in init_parameters_mapping:
-            init_dict[parameter_name] = deserialized_dict[init_parameters_mapping[parameter_name]]
-        else:  # assuming parameter has same name as corresponding attribute
-            if parameter_name not in deserialized_dict:
-                raise AttributeError(f'Missing attribute in given dict to match __init__ parameter: {parameter_name}.\n'
-                                     f'If relevant, consider registering type "{type_name}" using "register_jsonic_type" '
-                                     f'and providing required "init_parameters_mapping".')
-            init_dict[parameter_name] = deserialized_dict[parameter_name]
-
-    created_instance = cls(**init_dict)
-
-    # After creating the instance, set all it's attributes to deserialized value
-    for attr_name, attr_value in deserialized_dict.items():
-        if not deserialize_private_attributes and is_private_attribute(attr_name):
+        try:
+            return _deserialize_typed(obj, union_type, deserialize_private_attributes)
+        except (TypeError, AttributeError, KeyError, ValueError):
+            continue
+
+    raise TypeError(f'Could not deserialize {obj} as any of the types: {union_types}')
+
+
+def _deserialize_typed_jsonic_type_dict(obj, cls: type, deserialize_private_attributes=False):
+    if type(obj) != dict:
+        raise AttributeError(f'Deserializing {type(obj)}, which is not the expected type: {cls}')
+
+    type_data = _type_data_by_class(cls)
+    type_hints = type_data.attribute_type_hints
+    deserialized_dict = {}
+
+    for key, value in obj.items():
+        if not deserialize_private_attributes and key.startswith('_'):
             continue
-        setattr(created_instance, attr_name, attr_value)
+        deserialized_dict[key] = _deserialize_typed(value, type_hints.get(key), deserialize_private_attributes)
 
-    return created_instance
+    return _create_instance(type_data, deserialized_dict, deserialize_private_attributes)
 
 
 def _deserialize_list(lst: list, deserialize_private_attributes=False, expected_type: type = None):
@@ -285,6 +1042,6 @@ def _deserialize_list(lst: list, deserialize_private_attributes=False, expected_
         raise AttributeError(f'Deserializing list, which is not the expected type: {expected_type}')
     deserialized_list = []
     for element in lst:
-        deserialized_list.append(deserialize(element, deserialize_private_attributes=deserialize_private_attributes))
+        deserialized_list.append(_deserialize_recursive(element, deserialize_private_attributes))
 
     return deserialized_list
@@ -0,0 +1,220 @@
+import codecs
+import io
+import json
+import socket
+from json.decoder import WHITESPACE
+from typing import Iterable
+
+from jsonic.serializable import serialize, deserialize
+
+"""This Module contains functions for serializing and deserializing large collections incrementally to / from a stream"""
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def serialize_to(stream, iterable: Iterable, serialize_private_attributes: bool = False, json_lines: bool = False,
+                 buffer_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Serializes elements of ``iterable`` one at a time, writing them to ``stream`` as a JSON array or as JSON Lines.
+    Neither the output nor the input collection are held in memory, so ``iterable`` can be a generator
+
+    Args:
+        stream: text or binary file-like object, or a connected socket, to write the output to
+        iterable: elements to serialize, each serialized the same way ``serialize`` does
+        serialize_private_attributes: should serialize private attributes (attributes which their name starts with ``_``)
+        json_lines (bool): write one ``jsonic representation`` per line instead of a single JSON array
+        buffer_size (int): number of characters to accumulate before writing to ``stream``
+
+    Returns:
+        number of serialized elements
+    """
+    write = _stream_writer(stream)
+    separator = '\n' if json_lines else ','
+    pending = [] if json_lines else ['[']
+    pending_size = 0
+    count = 0
+
+    for element in iterable:
+        serialized = serialize(element, serialize_private_attributes=serialize_private_attributes, string_output=True)
+        if count and not json_lines:
+            pending.append(separator)
+        pending.append(serialized)
+        if json_lines:
+            pending.append(separator)
+        pending_size += len(serialized) + 1
+        count += 1
+        if pending_size >= buffer_size:
+            write(''.join(pending))
+            pending = []
+            pending_size = 0
+
+    if not json_lines:
+        pending.append(']')
+    if pending:
+        write(''.join(pending))
+    return count
+
+
+def _stream_writer(stream):
+    if isinstance(stream, socket.socket):
+        return lambda text: stream.sendall(text.encode('utf-8'))
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(stream, 'mode', ''):
+        return lambda text: stream.write(text.encode('utf-8'))
+    return stream.write
+
+
+def iter_deserialize(file_obj, deserialize_private_attributes: bool = False, expected_type: type = None,
+                     json_lines: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Deserializes a stream of ``jsonic representations`` one element at a time.
+    The stream is read in chunks, so memory usage is bounded by the size of a single element rather than the whole input
+
+    Args:
+        file_obj: text or binary (utf-8) file-like object, containing either a top-level JSON array,
+            or JSON Lines (one ``jsonic representation`` per line)
+        deserialize_private_attributes (bool): should deserialize private attributes (attributes which their name starts with ``_``)
+        expected_type: the expected type of every deserialized element
+        json_lines (bool): read one ``jsonic representation`` per line instead of a single JSON array,
+            as written by ``serialize_to`` with ``json_lines``
+        chunk_size (int): number of characters / bytes to read from ``file_obj`` at a time
+
+    Returns:
+        generator yielding the deserialized elements in the order they appear in the stream
+
+    Raises:
+        ValueError: When the stream is not a valid JSON array or JSON Lines stream
+    """
+    for element in _iter_json_elements(file_obj, json_lines, chunk_size):
+        yield deserialize(element, deserialize_private_attributes=deserialize_private_attributes,
+                          expected_type=expected_type)
+
+
+def _iter_json_elements(file_obj, json_lines: bool, chunk_size: int):
+    read = _text_reader(file_obj)
+    parser = _parse_json_elements(json_lines, chunk_size)
+    try:
+        request = next(parser)
+        while True:
+            if type(request) is tuple:
+                yield request[0]
+                request = next(parser)
+            else:
+                request = parser.send(read(request))
+    except StopIteration:
+        return
+
+
+def _text_reader(file_obj):
+    """
+    Returns:
+        function reading up to ``size`` characters from a text or binary (utf-8) ``file_obj``,
+        returning empty string at the end of the stream
+    """
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def read(size: int) -> str:
+        while True:
+            chunk = file_obj.read(size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            text = text_decoder.decode(chunk, final=not chunk)
+            if text or not chunk:  # otherwise chunk ended in the middle of a multi-byte character
+                return text
+
+    return read
+
+
+def _parse_json_elements(json_lines: bool, chunk_size: int):
+    """
+    Parses a top-level JSON array, or whitespace separated JSON values when ``json_lines``, without doing any I/O itself,
+    so the same parser is used for file-like objects and for asyncio streams.
+
+    The generator yields an ``int`` when it needs more input, and expects to be sent the next chunk of text,
+    of up to that many characters, or empty string at the end of the stream.
+    Parsed elements are yielded wrapped in a 1-tuple
+    """
+    reader = _JsonStreamReader(chunk_size)
+    if json_lines:  # any whitespace separated JSON values are accepted
+        while (yield from reader.peek()):
+            yield (yield from reader.decode_value()),
+        return
+
+    first_char = yield from reader.peek()
+    if first_char != '[':
+        raise ValueError(f'Expecting "[" at the start of the top-level JSON array, found: {first_char!r}')
+    reader.advance()
+    if (yield from reader.peek()) == ']':
+        reader.advance()
+    else:
+        while True:
+            yield (yield from reader.decode_value()),
+            delimiter = yield from reader.peek()
+            reader.advance()
+            if delimiter == ']':
+                break
+            if delimiter != ',':
+                raise ValueError(f'Expecting "," or "]" after array element, found: {delimiter!r}')
+
+    if (yield from reader.peek()):
+        raise ValueError('Extra data after the end of the top-level JSON array')
+
+
+class _JsonStreamReader:
+    """
+    Reads JSON values from chunks of text, holding only the unconsumed part of the input in memory.
+    Methods reading input are generators, see ``_parse_json_elements``
+    """
+
+    def __init__(self, chunk_size: int):
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character, or empty string at the end of the stream
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not (yield from self._read(self._chunk_size)):
+                return ''
+
+    def advance(self):
+        self._position += 1
+
+    def decode_value(self):
+        yield from self.peek()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value is incomplete, read more of it. The read size grows so large values are not re-parsed too often
+                if not (yield from self._read(read_size)):
+                    raise
+                read_size *= 2
+                continue
+
+            # A value ending exactly at the end of the buffer might be a truncated number
+            if end == len(self._buffer) and (yield from self._read(read_size)):
+                continue
+
+            self._position = end
+            return value
+
+    def _read(self, size: int):
+        if self._eof:
+            return False
+
+        chunk = yield size
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
@@ -1,3 +1,9 @@
+SERIALIZED_TYPE_ATTRIBUTE_NAME = '_serialized_type'
+# Written by serialize in references mode: the id of an instance on it's first occurrence, and back-references to it
+REFERENCE_ID_ATTRIBUTE_NAME = '_jsonic_id'
+REFERENCE_ATTRIBUTE_NAME = '_jsonic_ref'
+
+
 def full_type_name(o):
     module = o.__module__
     if module is None or module == str.__class__.__module__:
@@ -8,3 +14,24 @@ def full_type_name(o):
 
 def is_private_attribute(attr_name):
     return attr_name.startswith('_')
+
+
+def slot_descriptors(cls):
+    """
+    Returns:
+        dictionary from attribute name to it's slot member descriptor, for the ``__slots__`` of ``cls`` and it's base classes
+    """
+    descriptors = {}
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in ('__dict__', '__weakref__'):
+                continue
+            if slot.startswith('__') and not slot.endswith('__'):  # private names are mangled
+                slot = '_' + klass.__name__.lstrip('_') + slot
+            descriptor = klass.__dict__.get(slot)
+            if descriptor is not None and hasattr(descriptor, '__set__'):
+                descriptors[slot] = descriptor
+    return descriptors
@@ -13,10 +13,20 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/OrrBin/Jsonic",
     packages=['jsonic'],
+    extras_require={
+        'orjson': ['orjson'],
+        'ujson': ['ujson'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
 )
\ No newline at end of file
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, serialize_to_async, iter_deserialize_async
+from tests.serialization.model import Product
+
+
+async def _round_trip(elements, private: bool = False, json_lines: bool = False, chunk_size: int = 1024, **kwargs):
+    """
+    Serializes ``elements`` to a local in-process server, which deserializes them from the connection
+    """
+    received = []
+
+    async def handle(reader, writer):
+        received.extend([element async for element in iter_deserialize_async(
+            reader, deserialize_private_attributes=private, json_lines=json_lines, chunk_size=chunk_size, **kwargs)])
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    async with server:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        count = await serialize_to_async(writer, elements, serialize_private_attributes=private,
+                                         json_lines=json_lines, **kwargs)
+        writer.write_eof()
+        await reader.read()  # until the server is done and closes the connection
+        writer.close()
+        await writer.wait_closed()
+    assert count == len(received)
+    return received
+
+
+def test_async_round_trip():
+    assert asyncio.run(_round_trip(mock.products * 20, yield_every=7, chunk_size=50)) == mock.products * 20
+    assert asyncio.run(_round_trip([])) == []
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        donations = asyncio.run(_round_trip(mock.donations, private=True, json_lines=True, executor=executor,
+                                            yield_every=2))
+    assert donations == mock.donations
+
+    lists = [[1, 2], [3], []]
+    assert asyncio.run(_round_trip(lists, json_lines=True, chunk_size=3)) == lists
+
+
+def test_async_streams_match_sync_format():
+    class Output:
+        def __init__(self):
+            self.data = b''
+
+        def write(self, data: bytes):
+            self.data += data
+
+        async def drain(self):
+            pass
+
+    async def products():
+        for product in mock.products:
+            yield product
+
+    output = Output()
+    asyncio.run(serialize_to_async(output, products(), buffer_size=10))
+    assert json.loads(output.data) == serialize(mock.products)
+
+    async def read_all(data: bytes, **kwargs):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return [element async for element in iter_deserialize_async(reader, **kwargs)]
+
+    assert asyncio.run(read_all(output.data, expected_type=Product, chunk_size=3)) == mock.products
+    with pytest.raises(ValueError, match='Expecting'):
+        asyncio.run(read_all(b'[1, 2 3]'))
+
+
+def test_async_serialization_yields_to_event_loop():
+    async def serialize_while_ticking():
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0)
+
+        async def discard(reader, writer):
+            await reader.read()
+            writer.close()
+
+        ticker = asyncio.ensure_future(tick())
+        server = await asyncio.start_server(discard, '127.0.0.1', 0)
+        async with server:
+            _, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            await serialize_to_async(writer, mock.products * 500, yield_every=10)
+            writer.close()
+            await writer.wait_closed()
+        ticker.cancel()
+        return ticks
+
+    ticks = asyncio.run(serialize_while_ticking())
+    assert len(ticks) > len(mock.products * 500) / 10
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from jsonic import *
+from jsonic.util import full_type_name
 
 
 class Address:
@@ -70,3 +71,74 @@ def test_basic_usage():
 
     print(f'deserialized with private: {obj_with_privates}')
     print(f'deserialized without private: {obj_without_privates}')
+
+
+class CacheEntry(Serializable):
+    bypass_init = True
+    init_calls = 0
+
+    def __init__(self, key: str, value: int, _version: int = 0) -> None:
+        super().__init__()
+        CacheEntry.init_calls += 1
+        self.key = key
+        self.value = value
+        self._version = _version
+
+
+def test_bypass_init():
+    entries = [CacheEntry(f'key{i}', i, _version=i) for i in range(10)]
+    init_calls = CacheEntry.init_calls
+
+    new_entries = deserialize(serialize(entries, serialize_private_attributes=True), deserialize_private_attributes=True)
+    assert CacheEntry.init_calls == init_calls
+    assert [entry.__dict__ for entry in new_entries] == [entry.__dict__ for entry in entries]
+
+    new_entries = deserialize(serialize(entries))
+    assert [(entry.key, entry.value) for entry in new_entries] == [(entry.key, entry.value) for entry in entries]
+    assert not hasattr(new_entries[0], '_version')
+
+
+class Timestamp(datetime):
+    pass
+
+
+class Building:
+    def __init__(self, address: str, floors: int) -> None:
+        self.address = address
+        self.floors = floors
+
+
+register_jsonic_type(Building, transient_attributes=['floors'])
+
+
+class Tower(Building):
+    def __init__(self, address: str, floors: int, height: float) -> None:
+        super().__init__(address, floors)
+        self.height = height
+
+
+def test_custom_serializer_subclass_dispatch():
+    json_obj = serialize({'time': Timestamp(2020, 10, 5, 1, 2, 3)})
+    assert json_obj['time']['_serialized_type'] == 'datetime.datetime'
+    assert deserialize(json_obj) == {'time': datetime(2020, 10, 5, 1, 2, 3)}
+    assert deserialize(json_obj['time'], expected_type=datetime) == datetime(2020, 10, 5, 1, 2, 3)
+
+    @jsonic_serializer(serialized_type=Timestamp)
+    def serialize_timestamp(timestamp):
+        return {'timestamp': timestamp.timestamp()}
+
+    @jsonic_deserializer(deserialized_type_name=Timestamp)
+    def deserialize_timestamp(serialized_timestamp):
+        return Timestamp.fromtimestamp(serialized_timestamp['timestamp'])
+
+    # Registering a serializer for the subclass takes precedence over the one resolved for it before
+    json_obj = serialize(Timestamp(2020, 10, 5, 1, 2, 3))
+    assert json_obj['_serialized_type'] == full_type_name(Timestamp)
+    assert type(deserialize(json_obj)) == Timestamp
+
+    # Type tags written before full type names were used are still deserialized
+    assert deserialize({'datetime': '2020-10-05 00:00:00', '_serialized_type': 'datetime'}) == datetime(2020, 10, 5)
+
+    # Subclasses of registered types inherit their registered meta-data
+    json_obj = serialize(Tower('myAddress', 40, 150.5))
+    assert json_obj == {'address': 'myAddress', 'height': 150.5, '_serialized_type': full_type_name(Tower)}
@@ -0,0 +1,68 @@
+import multiprocessing
+
+import tests.serialization.mock as mock
+from jsonic import serialize, serialize_many, deserialize_many, register_jsonic_type, jsonic_serializer, \
+    jsonic_deserializer
+from tests.serialization.model import Product
+
+
+def test_batch_in_current_process():
+    json_list = serialize_many(mock.donations, serialize_private_attributes=True)
+    assert json_list == serialize(mock.donations, serialize_private_attributes=True)
+    assert deserialize_many(json_list, deserialize_private_attributes=True) == mock.donations
+
+
+def test_batch_with_process_pool():
+    products = mock.products * 20
+    json_list = serialize_many(products, chunk_size=7, max_workers=2)
+    assert json_list == serialize(products)
+    assert deserialize_many(json_list, expected_type=Product, chunk_size=7, max_workers=2) == products
+
+
+def test_batch_with_spawned_workers_reestablishes_registrations():
+    spawn_context = multiprocessing.get_context('spawn')
+    objects = mock.users + mock.products + mock.donations
+    json_list = serialize_many(objects, serialize_private_attributes=True, chunk_size=2, max_workers=2,
+                               mp_context=spawn_context)
+    assert json_list == serialize(objects, serialize_private_attributes=True)
+
+    new_objects = deserialize_many(json_list, deserialize_private_attributes=True, chunk_size=2, max_workers=2,
+                                   mp_context=spawn_context)
+    assert new_objects == objects
+
+
+class Gauge:
+    def __init__(self, name: str, value: float):
+        self.name = name
+        self.value = value
+        self.cache = [name] * 3
+
+
+class Reading:
+    def __init__(self, value: float):
+        self.value = value
+
+
+def serialize_reading(reading: Reading):
+    return {'reading': reading.value}
+
+
+def deserialize_reading(serialized_reading):
+    return Reading(serialized_reading['reading'])
+
+
+def test_batch_with_spawned_workers_reestablishes_runtime_registrations():
+    register_jsonic_type(Gauge, transient_attributes=['cache'])
+    jsonic_serializer(Reading)(serialize_reading)
+    jsonic_deserializer(Reading)(deserialize_reading)
+
+    spawn_context = multiprocessing.get_context('spawn')
+    objects = [Gauge('pressure', 1.5), Gauge('flow', 2), [Reading(3.5)]]
+    json_list = serialize_many(objects, chunk_size=1, max_workers=2, mp_context=spawn_context)
+    assert json_list == serialize(objects)
+    assert 'cache' not in json_list[0]
+
+    new_objects = deserialize_many(json_list, chunk_size=1, max_workers=2, mp_context=spawn_context)
+    assert [(gauge.name, gauge.value, gauge.cache) for gauge in new_objects[:2]] == \
+           [('pressure', 1.5, ['pressure'] * 3), ('flow', 2, ['flow'] * 3)]
+    assert isinstance(new_objects[2][0], Reading) and new_objects[2][0].value == 3.5
@@ -0,0 +1,35 @@
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize
+from jsonic.binary import encode, decode
+
+
+def test_binary_round_trip():
+    for objects in (mock.users, mock.products, mock.donations):
+        binary = serialize(objects, serialize_private_attributes=True, format='binary')
+        assert type(binary) == bytes
+        assert len(binary) < len(serialize(objects, serialize_private_attributes=True, string_output=True))
+
+        for binary_input in (binary, bytearray(binary), memoryview(binary)):
+            assert deserialize(binary_input, deserialize_private_attributes=True, format='binary') == objects
+
+
+def test_binary_encoding_of_values():
+    values = [None, True, False, 0, 127, 128, -1, -129, 2 ** 100, -2 ** 100, 1.5, float('inf'), '', 'שלום',
+              [], {}, {'a': [1, {'a': 2}]}, {'_serialized_type': 'tag', 'a': 1}, [{'_serialized_type': 'tag'}] * 3]
+    assert decode(encode(values)) == values
+
+
+def test_binary_invalid_input():
+    with pytest.raises(ValueError, match='header'):
+        decode(b'{"json": true}')
+
+    with pytest.raises(ValueError, match='truncated'):
+        decode(encode(['a string', 1.5])[:-3])
+
+    with pytest.raises(ValueError, match='Extra data'):
+        decode(encode([1, 2]) + b'\x00')
+
+    with pytest.raises(ValueError, match='Unknown format'):
+        serialize(mock.users, format='xml')
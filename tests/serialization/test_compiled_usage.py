@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from jsonic import serialize, deserialize, register_jsonic_type, compile_jsonic_type, Serializable
+
+
+class Reading:
+    def __init__(self, sensor_id: str, value: float, unit: str = 'C'):
+        self.sensor_id = sensor_id
+        self.value = value
+        self.unit = unit
+        self._calibration = 0.5
+        self.cached_label = f'{sensor_id}:{value}{unit}'
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, Reading):
+            return NotImplemented
+        return self.__dict__ == o.__dict__
+
+
+class UncompiledReading(Reading):
+    pass
+
+
+register_jsonic_type(Reading, transient_attributes=['cached_label'], compiled=True)
+register_jsonic_type(UncompiledReading, transient_attributes=['cached_label'])
+
+
+@dataclass
+class Batch(Serializable):
+    compiled = True
+
+    batch_id: int
+    readings: List[Reading] = field(default_factory=list)
+
+
+class Unregistered:
+    pass
+
+
+def _without_type_tag(serialized: dict) -> dict:
+    return {key: value for key, value in serialized.items() if key != '_serialized_type'}
+
+
+def test_compiled_type_matches_generic_serialization():
+    reading = Reading('sensor_1', 21.5)
+    uncompiled_reading = UncompiledReading('sensor_1', 21.5)
+
+    for private in (False, True):
+        serialized = serialize(reading, serialize_private_attributes=private)
+        assert _without_type_tag(serialized) == \
+            _without_type_tag(serialize(uncompiled_reading, serialize_private_attributes=private))
+        deserialized = deserialize(serialized, deserialize_private_attributes=private)
+        assert type(deserialized) == Reading
+        assert deserialized == reading
+
+
+def test_compiled_functions_are_generated():
+    serialize(Reading('sensor_1', 1.0))
+    type_data = Serializable.jsonic_types[f'{__name__}.Reading']
+    assert hasattr(type_data.serialization_plan.extract, '__source__')
+    assert hasattr(type_data.deserialization_factory.create, '__source__')
+    assert not hasattr(Serializable.jsonic_types[f'{__name__}.UncompiledReading'].serialization_plan.extract,
+                       '__source__')
+
+
+def test_compiled_type_falls_back_for_other_attributes():
+    reading = Reading('sensor_2', 3.0)
+    reading.extra = [1, 2]
+    del reading.unit
+
+    serialized = serialize(reading)
+    assert serialized['extra'] == [1, 2]
+    assert 'unit' not in serialized
+    with pytest.raises(AttributeError, match='unit'):
+        deserialize(serialized)
+
+    serialized['unit'] = 'F'
+    deserialized = deserialize(serialized)
+    assert deserialized.extra == [1, 2] and deserialized.unit == 'F'
+
+
+def test_compiled_dataclass_round_trip():
+    batch = Batch(7, [Reading('sensor_1', 1.0), Reading('sensor_2', 2.0, unit='F')])
+    deserialized = deserialize(serialize(batch, string_output=True), string_input=True, expected_type=Batch)
+    assert deserialized.batch_id == 7
+    assert [(reading.sensor_id, reading.unit) for reading in deserialized.readings] == [('sensor_1', 'C'), ('sensor_2', 'F')]
+
+
+def test_compile_unregistered_type():
+    with pytest.raises(TypeError, match='not registered'):
+        compile_jsonic_type(Unregistered)
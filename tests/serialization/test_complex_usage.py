@@ -1,10 +1,18 @@
+import copy
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pytest
 
 import tests.serialization.mock as mock
-from jsonic import serialize, deserialize
-from tests.serialization.model import Product, Donation
+from jsonic import serialize, deserialize, Serializable, register_jsonic_type, set_type_import_allow_list, \
+    type_name_cache_info, available_json_backends
+from jsonic.backends import get_json_backend, JsonBackend
+from jsonic.serializable import _deserialize_iterative, _deserialize_recursive
+from jsonic.util import full_type_name
+from tests.serialization.model import Product, Donation, User
 
 
 def test_user_serialization():
@@ -207,3 +215,182 @@ def test_raises_error_when_wrong_expected_type():
     product_json_obj = serialize(product, serialize_private_attributes=True)
     with pytest.raises(AttributeError, match="not the expected type:"):
         deserialize(product_json_obj, deserialize_private_attributes=True, expected_type=Donation)
+
+
+def test_dict_output_matches_json_round_trip():
+    obj = {
+        'users': mock.users,
+        'products': tuple(mock.products),
+        'donations': mock.donations,
+        1: 'int key',
+        2.5: 'float key',
+        None: 'none key',
+        True: 'bool key'
+    }
+
+    assert serialize(obj, serialize_private_attributes=True) == \
+           json.loads(serialize(obj, serialize_private_attributes=True, string_output=True))
+    assert serialize(obj) == json.loads(serialize(obj, string_output=True))
+
+    with pytest.raises(TypeError, match='keys must be str, int, float, bool or None'):
+        serialize({('tuple', 'key'): 'value'})
+
+
+def test_circular_reference_detected():
+    cyclic_dict = {'name': 'root'}
+    cyclic_dict['self'] = cyclic_dict
+    cyclic_list = [1]
+    cyclic_list.append([cyclic_list])
+    user = copy.deepcopy(mock.users[0])
+    user.friend = user
+    for cyclic in (cyclic_dict, cyclic_list, user):
+        with pytest.raises(ValueError, match='Circular reference detected'):
+            serialize(cyclic)
+
+    # Values shared without forming a cycle are serialized once per occurrence
+    shared = [mock.products[0]]
+    assert serialize({'a': shared, 'b': shared, 'c': (shared, shared)})['c']['items'] == [serialize(shared)] * 2
+    assert serialize(user, references=True)['friend'] == {'_jsonic_ref': 1}
+
+
+def test_serialization_plan_resolved_on_registration():
+    plan = Serializable.jsonic_types[full_type_name(User)].serialization_plan
+    assert plan.type_name == full_type_name(User)
+    assert plan.excluded_attributes == frozenset({'userCalculatedAttr'})
+
+    user_json_obj = serialize(mock.users[0])
+    assert 'userCalculatedAttr' not in user_json_obj
+    assert user_json_obj['_serialized_type'] == plan.type_name
+
+
+def test_serialize_does_not_modify_instances():
+    objects = mock.users + mock.products + mock.donations
+    attributes_before = [dict(obj.__dict__) for obj in objects]
+    expected = [serialize(obj) for obj in objects]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(serialize, objects * 50))
+
+    assert results == expected * 50
+    assert [obj.__dict__ for obj in objects] == attributes_before
+    assert not any('_serialized_type' in obj.__dict__ for obj in objects)
+
+
+def test_deserialization_factory_inspects_init_once(monkeypatch):
+    signature_calls = []
+    original_signature = inspect.signature
+
+    def counting_signature(*args, **kwargs):
+        signature_calls.append(args)
+        return original_signature(*args, **kwargs)
+
+    monkeypatch.setattr(inspect, 'signature', counting_signature)
+    register_jsonic_type(User, User.transient_attributes, User.init_parameters_mapping)
+
+    json_list = serialize(mock.users * 100)
+    assert deserialize(json_list) == mock.users * 100
+    assert len([args for args in signature_calls if args[0] is User.__init__]) == 1
+
+    # Registering the type again invalidates the cached factory
+    register_jsonic_type(User, User.transient_attributes, User.init_parameters_mapping)
+    assert deserialize(json_list) == mock.users * 100
+    assert len([args for args in signature_calls if args[0] is User.__init__]) == 2
+
+
+def test_type_import_allow_list():
+    product_json_obj = serialize(mock.products[0])
+    try:
+        set_type_import_allow_list(['tests.serialization'])
+        assert deserialize(product_json_obj) == mock.products[0]
+        cache_info = type_name_cache_info()
+        assert deserialize(product_json_obj) == mock.products[0]
+        assert type_name_cache_info().hits > cache_info.hits
+        assert type_name_cache_info().misses == cache_info.misses
+
+        set_type_import_allow_list(['tests.serialization.mock'])
+        with pytest.raises(TypeError, match='not in the type import allow list'):
+            deserialize(product_json_obj)
+
+        # Registered types are always allowed
+        assert deserialize(serialize(mock.users[0])) == mock.users[0]
+
+        with pytest.raises(TypeError, match='not in the type import allow list'):
+            deserialize({'_serialized_type': 'os.system', 'command': 'echo'})
+    finally:
+        set_type_import_allow_list(None)
+
+    with pytest.raises(TypeError, match='is not a class'):
+        deserialize({'_serialized_type': 'os.system', 'command': 'echo'})
+
+
+@pytest.mark.parametrize('json_backend', available_json_backends())
+def test_json_backends(json_backend):
+    json_str = serialize(mock.products, string_output=True, json_backend=json_backend)
+    assert type(json_str) == str
+    assert json.loads(json_str) == serialize(mock.products)
+    assert deserialize(json_str, string_input=True, json_backend=json_backend) == mock.products
+
+    json_bytes = serialize(mock.donations, bytes_output=True, serialize_private_attributes=True, json_backend=json_backend)
+    assert type(json_bytes) == bytes
+    for json_input in (json_bytes, bytearray(json_bytes), memoryview(json_bytes)):
+        new_list = deserialize(json_input, string_input=True, deserialize_private_attributes=True,
+                               json_backend=json_backend)
+        assert new_list == mock.donations
+
+
+def test_stdlib_json_backend_is_the_default():
+    assert get_json_backend().name == 'json'
+    values = [float('nan'), float('inf'), 'קוד']
+    assert serialize(values, string_output=True) == json.dumps(values)
+
+
+def test_json_backend_contract():
+    class EncodeOnlyBackend(JsonBackend):
+        def dumps(self, obj) -> str:
+            return json.dumps(obj)
+
+    for backend_class in (JsonBackend, EncodeOnlyBackend):
+        with pytest.raises(TypeError, match='abstract'):
+            backend_class()
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError, match='is not installed'):
+        serialize(mock.products, string_output=True, json_backend='simplejson')
+
+
+@pytest.mark.parametrize('private', [False, True])
+def test_iterative_deserialization_matches_recursive(private):
+    obj = {
+        'users': mock.users,
+        'products': {product.product_id: [product, {'nested': [product.profile, None, 1.5]}] for product in mock.products},
+        'donations': mock.donations,
+        'custom': [datetime(2020, 10, 7), {1, 2}, (3, 4)],
+        'empty': [[], {}, [[]]],
+    }
+    serialized = serialize(obj, serialize_private_attributes=private)
+    serialized['donations'][0]['plain'] = {'nested': {'_serialized_type': 'datetime.datetime',
+                                                      'datetime': '2020-10-07 00:00:00'}}
+
+    iterative = _deserialize_iterative(serialized, private)
+    recursive = _deserialize_recursive(serialized, private)
+    assert iterative == recursive
+    assert serialize(iterative, serialize_private_attributes=True) == \
+           serialize(recursive, serialize_private_attributes=True)
+    assert iterative['donations'][0].plain == serialized['donations'][0]['plain']
+
+
+def test_iterative_deserialization_of_deep_nesting():
+    depth = 20000
+    serialized = [serialize(mock.users[0])]
+    for level in range(depth):
+        serialized = {'level': level, 'child': [serialized]}
+
+    deserialized = deserialize(serialized)
+    for level in reversed(range(depth)):
+        assert deserialized['level'] == level
+        deserialized = deserialized['child'][0]
+    assert deserialized == [mock.users[0]]
+
+    with pytest.raises(RecursionError):
+        _deserialize_recursive(serialized)
@@ -0,0 +1,74 @@
+import copy
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum
+from pathlib import Path, PurePath
+from typing import Tuple, Set
+from uuid import uuid4
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = (0, 255, 0)
+
+
+class Priority(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+def test_default_serializers_round_trip():
+    values = [
+        datetime(2020, 10, 5, 1, 2, 3, 4),
+        date(2020, 10, 5),
+        time(1, 2, 3, 4, tzinfo=timezone.utc),
+        timedelta(days=-3, seconds=5, microseconds=7),
+        complex(1.5, -2),
+        Decimal('3.14159265358979323846'),
+        uuid4(),
+        Color.RED,
+        Color.GREEN,
+        Priority.HIGH,
+        b'\x00\xffbytes',
+        {1, 2, 3},
+        frozenset({'a', 'b'}),
+        (1, 'two', datetime(2020, 1, 1), (3, 4)),
+        Path('/tmp/jsonic/file.json'),
+        PurePath('relative/path'),
+    ]
+
+    for value in values:
+        new_value = deserialize(serialize(value))
+        assert new_value == value
+        assert type(new_value) == type(value)
+
+        new_value = deserialize(serialize(value, string_output=True), string_input=True)
+        assert new_value == value
+        assert type(new_value) == type(value)
+
+    assert deserialize(serialize(values)) == values
+
+
+def test_default_serializers_typed_mode():
+    assert deserialize(serialize((1, 2.5), typed=True), expected_type=Tuple[int, float], typed=True) == (1, 2.5)
+    assert deserialize(serialize({Priority.LOW}, typed=True), expected_type=Set[Priority], typed=True) == {Priority.LOW}
+
+
+def test_complex_previous_format():
+    assert deserialize({'value': 'complex(-4.123,-5.0001)', '_serialized_type': 'complex'}) == complex(-4.123, -5.0001)
+
+
+def test_container_items_use_deserialization_options():
+    donation = mock.donations[0]
+    donation_copy = copy.deepcopy(donation)
+    donation_copy._privateAttr = 'changed'
+    serialized = serialize({'tuple': (donation_copy,), 'set': frozenset([Priority.HIGH])},
+                           serialize_private_attributes=True)
+
+    deserialized = deserialize(serialized, deserialize_private_attributes=True)
+    assert deserialized['tuple'][0]._privateAttr == 'changed'
+    assert deserialized['set'] == frozenset([Priority.HIGH])
+    assert deserialize(serialized)['tuple'][0]._privateAttr == 'donationPrivate'
@@ -0,0 +1,159 @@
+import copy
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, serialize_delta, apply_delta, Serializable
+from tests.serialization.model import Donation
+
+
+@dataclass(frozen=True)
+class Version(Serializable):
+    number: int
+    tags: Dict[str, str]
+
+
+def test_delta_of_changed_attributes():
+    old = mock.donations[0]
+    new = copy.deepcopy(old)
+    new.description = 'changed description'
+    new.location.coord.lat = 31.5
+    new.time = datetime(2021, 1, 1)
+
+    patch = json.loads(json.dumps(serialize_delta(old, new)))
+    assert set(patch['set']) == {'description', 'time'}
+    assert patch['patch'] == {'location': {'patch': {'coord': {'set': {'lat': 31.5}}}}}
+    assert len(json.dumps(patch)) < len(serialize(new, string_output=True)) / 2
+
+    target = deserialize(serialize(old), expected_type=Donation)
+    assert apply_delta(target, patch) is target
+    assert target == new
+
+    representation = serialize(old)
+    apply_delta(representation, patch)
+    assert representation == serialize(new)
+
+
+def test_delta_of_unchanged_instance():
+    donation = mock.donations[1]
+    patch = serialize_delta(donation, copy.deepcopy(donation))
+    assert patch == {'_serialized_type': f'{Donation.__module__}.Donation'}
+
+
+def test_delta_honors_transient_and_private_attributes():
+    old = mock.users[0]
+    new = copy.deepcopy(old)
+    new.userCalculatedAttr = 'recalculated'
+    assert 'set' not in serialize_delta(old, new)
+
+    old_donation = mock.donations[0]
+    new_donation = copy.deepcopy(old_donation)
+    new_donation._privateAttr = 'changed'
+    assert 'set' not in serialize_delta(old_donation, new_donation)
+
+    patch = serialize_delta(old_donation, new_donation, serialize_private_attributes=True)
+    assert patch['set'] == {'_privateAttr': 'changed'}
+    target = copy.deepcopy(old_donation)
+    assert apply_delta(target, patch)._privateAttr == 'donationPrivate'
+    assert apply_delta(target, patch, deserialize_private_attributes=True)._privateAttr == 'changed'
+
+
+def test_delta_of_frozen_dataclass_and_nested_collections():
+    old = Version(1, {'stage': 'beta', 'owner': 'core'})
+    new = Version(2, {'stage': 'stable'})
+    patch = serialize_delta(old, new)
+    assert patch['set'] == {'number': 2}
+    assert patch['patch']['tags'] == {'set': {'stage': 'stable'}, 'delete': ['owner']}
+
+    target = Version(1, {'stage': 'beta', 'owner': 'core'})
+    assert apply_delta(target, patch) == new
+
+
+def test_invalid_delta():
+    with pytest.raises(TypeError, match='different types'):
+        serialize_delta(mock.users[0], mock.donations[0])
+
+    with pytest.raises(TypeError, match='only of class instances'):
+        serialize_delta(datetime(2020, 1, 1), datetime(2021, 1, 1))
+
+    with pytest.raises(AttributeError, match='Applying patch'):
+        apply_delta(copy.deepcopy(mock.users[0]), serialize_delta(mock.donations[0], mock.donations[1]))
+
+
+@dataclass
+class Cell(Serializable):
+    v: int
+
+
+@dataclass
+class Pair(Serializable):
+    a: Cell
+    b: Cell
+    headers: Dict[str, str]
+
+
+def test_delta_of_shared_instance_and_private_dict_keys():
+    shared = Cell(1)
+    old = Pair(shared, shared, {'_etag': 'v1'})
+    new = Pair(Cell(2), Cell(2), {'_etag': 'v2'})
+    patch = serialize_delta(old, new)
+    assert patch['patch'] == {'a': {'set': {'v': 2}}, 'b': {'set': {'v': 2}}, 'headers': {'set': {'_etag': 'v2'}}}
+
+    target = deserialize(serialize(old), expected_type=Pair)
+    apply_delta(target, patch)
+    assert (target.a.v, target.b.v) == (2, 2)
+    assert target.headers == {'_etag': 'v2'}
+
+
+class Inner(Serializable):
+    def __init__(self, value: int):
+        super().__init__()
+        self.value = value
+
+
+@dataclass
+class Holder(Serializable):
+    x: Inner
+    y: Inner
+
+
+def test_delta_of_instance_shared_in_replica():
+    shared = Inner(1)
+    shared.extra = 'removed'
+    old = Holder(shared, shared)
+    new = copy.deepcopy(old)
+    del new.x.extra
+    patch = serialize_delta(old, new)
+    assert patch['patch'] == {'x': {'delete': ['extra']}, 'y': {'delete': ['extra']}}
+
+    target = deserialize(serialize(old, references=True), references=True)
+    assert target.x is target.y
+    apply_delta(target, patch)
+    assert not hasattr(target.x, 'extra') and target.x.value == 1
+
+
+class Tag(Serializable):
+    immutable = True
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+
+@dataclass
+class Tagged(Serializable):
+    tag: Tag
+
+
+def test_delta_replaces_immutable_instances():
+    patch = serialize_delta(Tagged(Tag('draft')), Tagged(Tag('final')))
+    assert 'patch' not in patch and patch['set']['tag']['name'] == 'final'
+
+    first, second = deserialize(serialize([Tagged(Tag('draft')), Tagged(Tag('draft'))]), intern=True)
+    assert first.tag is second.tag  # shared by interning
+    apply_delta(first, patch)
+    assert (first.tag.name, second.tag.name) == ('final', 'draft')
@@ -0,0 +1,83 @@
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, enable_instrumentation, disable_instrumentation, stats, reset_stats
+from jsonic import serializable
+from tests.serialization.model import Donation, Location
+
+
+@pytest.fixture
+def instrumentation():
+    reset_stats()
+    yield
+    disable_instrumentation()
+    reset_stats()
+
+
+def test_disabled_instrumentation_keeps_original_functions(instrumentation):
+    original_serialize_object = serializable._serialize_object
+    enable_instrumentation()
+    assert serializable._serialize_object is not original_serialize_object
+    disable_instrumentation()
+    assert serializable._serialize_object is original_serialize_object
+
+    serialize(mock.donations[0])
+    assert stats()['serialize'] == {}
+
+
+def test_per_type_statistics(instrumentation):
+    enable_instrumentation()
+    serialized = serialize(mock.donations, string_output=True)
+    deserialize(serialized, string_input=True)
+
+    snapshot = stats(reset=True)
+    donation_name = f'{Donation.__module__}.Donation'
+    location_name = f'{Location.__module__}.Location'
+    for operation in ('serialize', 'deserialize'):
+        assert snapshot[operation][donation_name]['count'] == len(mock.donations)
+        assert snapshot[operation][location_name]['count'] == len(mock.donations)
+        assert snapshot[operation]['datetime.datetime']['count'] == len(mock.donations)
+        assert snapshot[operation][donation_name]['time'] > 0
+        assert 0 < snapshot[operation][location_name]['bytes'] < snapshot[operation][donation_name]['bytes']
+
+    total_bytes = sum(type_stats['bytes'] for type_stats in snapshot['serialize'].values())
+    assert abs(total_bytes - len(serialized)) < len(serialized) * 0.25
+    assert snapshot['type_data_cache']['hits'] + snapshot['type_data_cache']['misses'] > 0
+    assert stats()['serialize'] == {}
+
+
+def test_callback(instrumentation):
+    events = []
+    enable_instrumentation(callback=lambda *event: events.append(event))
+    serialize(mock.users[0])
+
+    operations = {operation for operation, type_name, seconds, json_bytes in events}
+    type_names = [type_name for operation, type_name, seconds, json_bytes in events]
+    assert operations == {'serialize'}
+    assert type_names[-1] == f'{type(mock.users[0]).__module__}.User'
+    assert len(events) == 4  # user, credentials and two datetimes
+
+
+def test_instrumented_deserialization_engines(instrumentation):
+    enable_instrumentation()
+    deep = [0]
+    for _ in range(5000):
+        deep = [deep]
+    deserialized = deserialize(deep)  # deeper than the recursion limit
+    for _ in range(5000):
+        deserialized = deserialized[0]
+    assert deserialized == [0]
+
+    donation_name = f'{Donation.__module__}.Donation'
+    for options in ({'references': True}, {'intern': True}):
+        reset_stats()
+        serialized = serialize(mock.donations, references=options.get('references', False))
+        assert deserialize(serialized, **options) == mock.donations
+        snapshot = stats()
+        assert snapshot['deserialize'][donation_name]['count'] == len(mock.donations)
+        assert snapshot['deserialize']['datetime.datetime']['count'] == len(mock.donations)
+
+    reset_stats()
+    deserialize(serialize(mock.donations))
+    # Donation is registered, so looking up it's type data is always a hit
+    assert stats()['type_data_cache']['hits'] >= len(mock.donations)
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, Serializable, FlyweightPool
+
+
+@dataclass(frozen=True)
+class Color(Serializable):
+    immutable = True
+
+    name: str
+    rgb: List[int]
+
+
+@dataclass
+class Pixel(Serializable):
+    x: int
+    y: int
+    color: Color
+    updated: datetime
+
+
+def _pixels(count: int):
+    colors = [Color('red', [255, 0, 0]), Color('green', [0, 255, 0])]
+    return [Pixel(index, index * 2, colors[index % 2], datetime(2020, 1, 1 + index % 3)) for index in range(count)]
+
+
+def test_interning_shares_equal_values():
+    pixels = _pixels(20)
+    json_str = serialize(pixels, string_output=True)
+
+    interned = deserialize(json_str, string_input=True, intern=FlyweightPool())
+    assert interned == deserialize(json_str, string_input=True) == pixels
+
+    reds = [pixel.color for pixel in interned if pixel.color.name == 'red']
+    assert all(color is reds[0] for color in reds)
+    assert interned[0].color is not interned[1].color
+    assert interned[0].updated is interned[3].updated
+    assert interned[0] is not interned[2]  # mutable instances are never shared
+
+    not_interned = deserialize(json_str, string_input=True)
+    assert not_interned[0].color is not not_interned[2].color
+
+
+def test_interning_keeps_values_that_are_equal_but_not_same():
+    values = [1, True, 1.0, Decimal('1.0'), Decimal('1.00'), -0.0, 0.0, 'a' * 200, 'a' * 200]
+    interned = deserialize(serialize(values), intern=FlyweightPool())
+    assert [(type(value), repr(value)) for value in interned] == [(type(value), repr(value)) for value in values]
+
+
+def test_interning_mock_fixtures():
+    pool = FlyweightPool()
+    serialized = serialize(mock.donations * 5, serialize_private_attributes=True)
+    assert deserialize(serialized, deserialize_private_attributes=True, intern=pool) == mock.donations * 5
+    assert pool.hits > 0 and pool.misses > 0
+
+
+def test_pool_is_bounded():
+    pool = FlyweightPool(max_size=3)
+    deserialize(serialize([f'value {index}' for index in range(10)]), intern=pool)
+    assert len(pool) == 3
+    assert pool.misses == 10
@@ -0,0 +1,78 @@
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize_lazy, materialize, Serializable
+from tests.serialization.model import Donation, Location, Product
+
+
+def test_lazy_attributes_are_deserialized_on_access():
+    donation = mock.donations[0]
+    # Private attributes are serialized, so reading them checks they are not deserialized
+    lazy_donation = deserialize_lazy(serialize(donation, serialize_private_attributes=True, string_output=True),
+                                     string_input=True, expected_type=Donation)
+
+    assert isinstance(lazy_donation, Donation)
+    assert lazy_donation.donation_id == donation.donation_id
+    assert 'location' not in lazy_donation._jsonic_attributes
+
+    location = lazy_donation.location
+    assert type(location) == Location
+    assert location == donation.location
+    assert lazy_donation.location is location
+
+    assert lazy_donation.product_ids == donation.product_ids
+    with pytest.raises(AttributeError):
+        lazy_donation._privateAttr
+
+    new_donation = materialize(lazy_donation)
+    assert type(new_donation) == Donation
+    assert new_donation == donation
+    assert new_donation.location is location
+    assert lazy_donation == donation
+
+
+def test_lazy_collections():
+    lazy_products = deserialize_lazy(serialize(mock.products), expected_type=list)
+    assert [product.product_id for product in lazy_products] == [product.product_id for product in mock.products]
+    assert [materialize(product) for product in lazy_products] == mock.products
+
+    lazy_dict = deserialize_lazy(serialize({'product': mock.products[0], 'count': 3}))
+    assert lazy_dict['count'] == 3
+    assert lazy_dict['product'].profile == mock.products[0].profile
+
+    with pytest.raises(AttributeError, match='not the expected type'):
+        deserialize_lazy(serialize(mock.donations[0]), expected_type=Product)
+
+
+class Account(Serializable):
+    def __init__(self, owner: str, balance: int):
+        super().__init__()
+        self.owner = owner
+        self.balance = balance
+
+    @property
+    def label(self):
+        return f'{self.owner}: {self.balance}'
+
+    def doubled(self):
+        return self.balance * 2
+
+    def __eq__(self, o: object) -> bool:
+        return isinstance(o, Account) and (self.owner, self.balance) == (o.owner, o.balance)
+
+    def __hash__(self):
+        return hash((self.owner, self.balance))
+
+
+def test_lazy_methods_properties_and_hashing():
+    account = Account('dana', 10)
+    lazy_account = deserialize_lazy(serialize(account))
+    assert isinstance(lazy_account, Account)
+    assert lazy_account.doubled() == 20
+    assert lazy_account.label == 'dana: 10'
+    with pytest.raises(AttributeError):
+        lazy_account.missing
+
+    assert hash(lazy_account) == hash(account)
+    assert {lazy_account: 'found'}[account] == 'found'
+    assert account in {lazy_account}
@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, Serializable
+from tests.serialization.model import User, UserCredentials
+
+
+class TreeNode(Serializable):
+    def __init__(self, name: str, parent: 'TreeNode' = None, children: List['TreeNode'] = None):
+        super().__init__()
+        self.name = name
+        self.parent = parent
+        self.children = children if children is not None else []
+        self._expanded = parent is None
+
+    def add_child(self, name: str) -> 'TreeNode':
+        child = TreeNode(name, parent=self)
+        self.children.append(child)
+        return child
+
+
+def test_shared_instances_are_serialized_once():
+    credentials = UserCredentials(token='shared', exp=datetime(2020, 11, 1))
+    users = [User(user_id=f'user_{index}', birth_time=datetime(1995, 7, 5), user_credentials=credentials)
+             for index in range(50)]
+
+    json_str = serialize(users, string_output=True, references=True)
+    assert json_str.count('"token"') == 1
+    assert len(json_str) < len(serialize(users, string_output=True)) * 0.6
+
+    new_users = deserialize(json_str, string_input=True, references=True)
+    assert new_users == users
+    assert all(user.user_credentials is new_users[0].user_credentials for user in new_users)
+    assert new_users[0] is not new_users[1]
+
+
+def test_cyclic_graph():
+    root = TreeNode('root')
+    child = root.add_child('child')
+    child.add_child('grandchild')
+    child.sibling = root.add_child('sibling')
+
+    for private in (False, True):
+        serialized = serialize(root, serialize_private_attributes=private, format='binary', references=True)
+        new_root = deserialize(serialized, deserialize_private_attributes=private, format='binary', references=True,
+                               expected_type=TreeNode)
+
+        new_child, new_sibling = new_root.children
+        assert new_child.parent is new_root and new_sibling.parent is new_root
+        assert new_child.sibling is new_sibling
+        assert new_child.children[0].name == 'grandchild' and new_child.children[0].parent is new_child
+        assert new_child.children[0]._expanded is False
+        assert not hasattr(new_root, '_jsonic_id')
+
+
+def test_references_round_trip():
+    serialized = serialize(mock.products, references=True)
+    assert deserialize(serialized, references=True) == mock.products
+    # products created without an amount share the default Amount instance
+    new_products = deserialize(serialized, references=True)
+    assert new_products[0].amount is new_products[1].amount
+
+
+def test_invalid_references():
+    with pytest.raises(ValueError, match='unknown id'):
+        deserialize([{'_jsonic_ref': 3}], references=True)
+
+    with pytest.raises(TypeError, match='typed mode'):
+        serialize(mock.users[0], typed=True, references=True)
+
+
+def test_shared_instances_inside_containers():
+    credentials = UserCredentials(token='shared', exp=datetime(2020, 11, 1))
+    for data in ({'tuple': (credentials,), 'later': credentials},
+                 {'first': credentials, 'tuple': (credentials, credentials), 'nested': ((credentials,),)}):
+        serialized = serialize(data, references=True)
+        assert str(serialized).count("'token'") == 1
+
+        new_data = deserialize(serialized, references=True)
+        instances = [new_data.get('later') or new_data['first'], *new_data['tuple']]
+        if 'nested' in new_data:
+            instances.append(new_data['nested'][0][0])
+        assert len(instances) == (2 if 'later' in data else 4)
+        assert all(instance is instances[0] for instance in instances)
+        assert instances[0].token == 'shared'
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize, validate_serialized, json_schema, type_schema, Serializable
+from tests.serialization.model import Donation, Product, User
+from tests.serialization.model.model import Coordinate, ContactDetails
+
+
+class Item(Serializable):
+    def __init__(self, name: str, quantity: int = 1):
+        super().__init__()
+        self.name = name
+        self.quantity = quantity
+
+
+@dataclass
+class Shelf(Serializable):
+    label: str
+    sizes: Dict[str, float]
+    products: List[Product]
+    parent: Optional['Shelf'] = None
+
+
+def test_schema_derived_from_init_and_annotations():
+    schema = type_schema(Coordinate)
+    assert schema.required_attributes == ('longitude', 'latitude')
+    assert schema.attribute_types == {'longitude': float, 'latitude': float}
+
+    assert 'userCalculatedAttr' not in type_schema(User).attribute_types
+    assert type_schema(Donation).attribute_types['contact'] == Optional[ContactDetails]  # defaults to None
+    assert type_schema(Shelf).required_attributes == ('label', 'sizes', 'products', 'parent')
+
+
+def test_parameters_with_defaults_are_required():
+    serialized = serialize(Item('bolt'))
+    del serialized['quantity']
+    with pytest.raises(ValueError, match='missing required attribute "quantity"'):
+        validate_serialized(serialized)
+    with pytest.raises(AttributeError, match='Missing attribute'):
+        deserialize(serialized)
+
+
+def test_valid_input_passes_validation():
+    for objects in (mock.donations, mock.products, mock.users):
+        assert deserialize(serialize(objects), validate=True) == objects
+        assert deserialize(serialize(objects, string_output=True), string_input=True, validate=True) == objects
+        validate_serialized(serialize(objects, serialize_private_attributes=True), deserialize_private_attributes=True)
+
+    shelf = Shelf('top', {'width': 1.5, 'depth': 2}, mock.products, parent=Shelf('root', {}, []))
+    assert deserialize(serialize(shelf), validate=True, expected_type=Shelf) == shelf
+    assert deserialize(serialize(shelf, typed=True), typed=True, validate=True, expected_type=Shelf) == shelf
+
+
+@pytest.mark.parametrize('corrupt, message', [
+    (lambda donation: donation.pop('user_id'), r'\$\[1\]: missing required attribute "user_id"'),
+    (lambda donation: donation['location']['coord'].update(latitude='north'),
+     r'\$\[1\]\.location\.coord\.latitude: expected number, got str'),
+    (lambda donation: donation.update(product_ids='product_1'), r'\.product_ids: expected typing.List\[str\]'),
+    (lambda donation: donation.update(time='2020-10-10'), r'\.time: expected datetime.datetime, got str'),
+    (lambda donation: donation.update(contact={'_serialized_type': 'tests.serialization.model.model.Address',
+                                               'address': 'Tel Aviv'}), r'\.contact: expected .*ContactDetails'),
+    (lambda donation: donation.update(_serialized_type='no_such_module.Donation'), r'\$\[1\]: unknown type'),
+])
+def test_invalid_input_is_rejected_before_deserializing(corrupt, message):
+    serialized = serialize(mock.donations)
+    corrupt(serialized[1])
+    with pytest.raises(ValueError, match=message):
+        deserialize(serialized, validate=True)
+
+
+def test_private_attributes_are_validated_only_when_deserialized():
+    serialized = serialize(mock.donations[0], serialize_private_attributes=True)
+    serialized['_privateAttr'] = {'_serialized_type': 'no_such_module.Type'}
+    deserialize(serialized, validate=True)
+    with pytest.raises(ValueError, match=r'\$\._privateAttr: unknown type'):
+        deserialize(serialized, validate=True, deserialize_private_attributes=True)
+
+
+def test_json_schema_export():
+    schema = json_schema(List[Shelf])
+    shelf_name = f'{Shelf.__module__}.Shelf'
+    assert schema['$schema'] == 'https://json-schema.org/draft/2020-12/schema'
+    assert schema['items'] == {'$ref': f'#/$defs/{shelf_name}'}
+
+    shelf_schema = schema['$defs'][shelf_name]
+    assert shelf_schema['required'] == ['label', 'sizes', 'products', 'parent', '_serialized_type']
+    assert shelf_schema['properties']['sizes'] == {'type': 'object', 'additionalProperties': {'type': 'number'}}
+    assert shelf_schema['properties']['parent'] == {'anyOf': [{'$ref': f'#/$defs/{shelf_name}'}, {'type': 'null'}]}
+    assert shelf_schema['properties']['_serialized_type'] == {'const': shelf_name}
+    assert f'{Product.__module__}.Product' in schema['$defs']
+
+    typed_schema = json_schema(Shelf, typed=True)['$defs'][shelf_name]
+    assert '_serialized_type' not in typed_schema['properties'] and '_serialized_type' not in typed_schema['required']
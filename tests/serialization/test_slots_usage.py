@@ -0,0 +1,83 @@
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from jsonic import serialize, deserialize, register_jsonic_type, Serializable
+
+
+class SlottedPoint:
+    __slots__ = ('x', 'y', '__secret')
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        self.__secret = 'secret'
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, SlottedPoint):
+            return NotImplemented
+        return self.x == o.x and self.y == o.y
+
+
+class LabeledPoint(SlottedPoint):
+    """Subclass without __slots__, so it also stores attributes in __dict__"""
+
+    def __init__(self, x: float, y: float, label: str):
+        super().__init__(x, y)
+        self.label = label
+
+    def __eq__(self, o: object) -> bool:
+        return super().__eq__(o) and self.label == o.label
+
+
+register_jsonic_type(LabeledPoint, transient_attributes=['y'])
+
+
+# dataclass slots are supported since python 3.10
+if sys.version_info >= (3, 10):
+    @dataclass(slots=True, frozen=True)
+    class Measurement:
+        point: SlottedPoint
+        time: datetime
+        values: List[float] = field(default_factory=list)
+        unit: str = field(default='cm', init=False)
+
+    @dataclass
+    class Report(Serializable):
+        report_id: str
+        measurements: List[Measurement]
+
+
+def test_slots_serialization():
+    point = SlottedPoint(1.5, -2.5)
+    point_json_obj = serialize(point)
+    assert point_json_obj == {'x': 1.5, 'y': -2.5, '_serialized_type': 'tests.serialization.test_slots_usage.SlottedPoint'}
+    assert serialize(point, serialize_private_attributes=True)['_SlottedPoint__secret'] == 'secret'
+    assert deserialize(point_json_obj) == point
+
+    unset_point = SlottedPoint.__new__(SlottedPoint)
+    unset_point.x = 3
+    assert serialize(unset_point) == {'x': 3, '_serialized_type': 'tests.serialization.test_slots_usage.SlottedPoint'}
+
+    labeled_point = LabeledPoint(1, 2, 'label')
+    labeled_point_json_obj = serialize(labeled_point)
+    assert 'y' not in labeled_point_json_obj
+    assert labeled_point_json_obj['label'] == 'label'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='dataclass slots require python 3.10')
+def test_dataclass_serialization():
+    report = Report('report_1', [
+        Measurement(SlottedPoint(1, 2), datetime(2020, 1, 1), [0.5, 1.5]),
+        Measurement(SlottedPoint(3, 4), datetime(2020, 1, 2)),
+    ])
+
+    report_json_str = serialize(report, string_output=True)
+    new_report = deserialize(report_json_str, string_input=True, expected_type=Report)
+    assert new_report == report
+    assert new_report.measurements[0].unit == 'cm'
+
+    assert deserialize(serialize(report, typed=True), expected_type=Report, typed=True) == report
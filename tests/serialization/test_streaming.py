@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, iter_deserialize, serialize_to
+from tests.serialization.model import Product
+
+
+def test_iter_deserialize_json_array():
+    json_str = serialize(mock.products, string_output=True)
+
+    assert list(iter_deserialize(io.StringIO(json_str))) == mock.products
+    assert list(iter_deserialize(io.StringIO(json_str), chunk_size=7, expected_type=Product)) == mock.products
+    assert list(iter_deserialize(io.BytesIO(json_str.encode()), chunk_size=3)) == mock.products
+    assert list(iter_deserialize(io.StringIO(' [ ] '))) == []
+
+
+def test_iter_deserialize_json_lines():
+    lines = [json.dumps(serialize(donation, serialize_private_attributes=True)) for donation in mock.donations]
+    json_lines = '\n'.join(lines + ['42', '"תרומה"', '12345'])
+
+    elements = list(iter_deserialize(io.BytesIO(json_lines.encode()), chunk_size=5, deserialize_private_attributes=True,
+                                     json_lines=True))
+    assert elements == mock.donations + [42, 'תרומה', 12345]
+
+
+def test_iter_deserialize_invalid_stream():
+    with pytest.raises(ValueError, match='Expecting'):
+        list(iter_deserialize(io.StringIO('[1, 2 3]')))
+
+    with pytest.raises(ValueError):
+        list(iter_deserialize(io.StringIO('[1, 2, {"a": ')))
+
+    with pytest.raises(ValueError, match='Extra data'):
+        list(iter_deserialize(io.StringIO('[1, 2] 3')))
+
+    with pytest.raises(ValueError, match=r'Expecting "\["'):
+        list(iter_deserialize(io.StringIO('{"a": 1}\n{"a": 2}')))
+
+
+def test_serialize_to_json_array():
+    output = io.StringIO()
+    assert serialize_to(output, (product for product in mock.products), buffer_size=100) == len(mock.products)
+    assert json.loads(output.getvalue()) == serialize(mock.products)
+    assert list(iter_deserialize(io.StringIO(output.getvalue()))) == mock.products
+
+    output = io.StringIO()
+    assert serialize_to(output, []) == 0
+    assert output.getvalue() == '[]'
+
+
+def test_serialize_to_json_lines():
+    output = io.BytesIO()
+    serialize_to(output, iter(mock.donations), serialize_private_attributes=True, json_lines=True)
+
+    lines = output.getvalue().decode().splitlines()
+    assert [json.loads(line) for line in lines] == serialize(mock.donations, serialize_private_attributes=True)
+
+    output.seek(0)
+    assert list(iter_deserialize(output, deserialize_private_attributes=True, json_lines=True)) == mock.donations
+
+    lists = [[1, 2], [mock.products[0]], []]
+    output = io.StringIO()
+    serialize_to(output, lists, json_lines=True)
+    assert list(iter_deserialize(io.StringIO(output.getvalue()), json_lines=True)) == lists
@@ -0,0 +1,52 @@
+from typing import List, Dict, Optional
+
+import pytest
+
+import tests.serialization.mock as mock
+from jsonic import serialize, deserialize
+from tests.serialization.model import Product, Donation, User
+
+
+def _contains_type_tag(obj):
+    if type(obj) == dict:
+        return '_serialized_type' in obj or any(_contains_type_tag(value) for value in obj.values())
+    if type(obj) == list:
+        return any(_contains_type_tag(element) for element in obj)
+    return False
+
+
+def test_typed_product_serialization():
+    for product in mock.products:
+        product_json_obj = serialize(product, typed=True)
+        assert not _contains_type_tag(product_json_obj)
+        assert deserialize(product_json_obj, expected_type=Product, typed=True) == product
+
+        product_json_str = serialize(product, string_output=True, typed=True)
+        assert '_serialized_type' not in product_json_str
+        assert deserialize(product_json_str, string_input=True, expected_type=Product, typed=True) == product
+
+
+def test_typed_generic_collections():
+    json_list = serialize(mock.donations, serialize_private_attributes=True, typed=True)
+    assert not _contains_type_tag(json_list)
+    new_list = deserialize(json_list, expected_type=List[Donation], typed=True, deserialize_private_attributes=True)
+    assert new_list == mock.donations
+
+    users = {user.user_id: user for user in mock.users}
+    json_dict = serialize(users, typed=True)
+    assert deserialize(json_dict, expected_type=Dict[str, User], typed=True) == users
+
+    assert deserialize(None, expected_type=Optional[User], typed=True) is None
+    assert deserialize(serialize(mock.users[0], typed=True), expected_type=Optional[User], typed=True) == mock.users[0]
+
+
+def test_typed_mode_accepts_tagged_input():
+    assert deserialize(serialize(mock.products), expected_type=List[Product], typed=True) == mock.products
+
+
+def test_typed_mode_requires_expected_type():
+    with pytest.raises(TypeError, match='requires the expected_type'):
+        deserialize(serialize(mock.products[0], typed=True), typed=True)
+
+    with pytest.raises(AttributeError, match='not the expected type'):
+        deserialize(['not', 'a', 'product'], expected_type=Product, typed=True)